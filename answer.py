@@ -3,7 +3,7 @@
 """
 
 import os
-from typing import List
+from typing import Iterator, List, Optional
 
 from intent import IntentResult
 from planner import FetchPlan
@@ -132,58 +132,47 @@ def _generate_final_answer_basic(
     return answer
 
 
-def _generate_final_answer_llm(
+def _build_llm_prompt(
     intent: IntentResult,
     summaries: List[SourceSummary],
     chat_history: List = None
-) -> str:
+) -> Optional[str]:
     """
-    Generate final answer using LLM (optional mode)
+    Build the LLM prompt for the final answer
     Args:
         intent: Intent analysis result
         summaries: Source summaries
         chat_history: Previous chat messages for context (optional)
     Returns:
-        Final answer text
+        Prompt text, or None if there is no evidence
     """
-    try:
-        # Check if OpenAI API key is available
-        if not get_env('OPENAI_API_KEY'):
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info("No OpenAI API key found, using basic template mode")
-            return _generate_final_answer_basic(intent, summaries)
-
-        # Prepare evidence snippets
-        evidence = "\n\n".join([
-            f"[{summary.source_type}]\n{summary.evidence_snippet}"
-            for summary in summaries
-        ])
-
-        # Check if we have any evidence
-        if not evidence.strip():
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning("No evidence data available for LLM")
-            return _generate_final_answer_basic(intent, summaries)
-
-        # Prepare chat history context
-        history_context = ""
-        if chat_history and len(chat_history) > 0:
-            history_context = "\n**이전 대화 내용:**\n"
-            for msg in chat_history[-6:]:  # Last 3 exchanges
-                # Handle both dict and object formats
-                role_value = msg.get('role') if isinstance(msg, dict) else msg.role
-                content_value = msg.get('content') if isinstance(msg, dict) else msg.content
-                role = "사용자" if role_value == "user" else "챗봇"
-                history_context += f"{role}: {content_value[:200]}...\n"
-            history_context += "\n"
-
-        # Get current date
-        from datetime import datetime
-        current_date = datetime.now().strftime('%Y년 %m월 %d일')
-        
-        prompt_text = f"""당신은 초보 투자자를 돕는 친절한 주식 가이드입니다.
+    # Prepare evidence snippets
+    evidence = "\n\n".join([
+        f"[{summary.source_type}]\n{summary.evidence_snippet}"
+        for summary in summaries
+    ])
+
+    # Check if we have any evidence
+    if not evidence.strip():
+        return None
+
+    # Prepare chat history context
+    history_context = ""
+    if chat_history and len(chat_history) > 0:
+        history_context = "\n**이전 대화 내용:**\n"
+        for msg in chat_history[-6:]:  # Last 3 exchanges
+            # Handle both dict and object formats
+            role_value = msg.get('role') if isinstance(msg, dict) else msg.role
+            content_value = msg.get('content') if isinstance(msg, dict) else msg.content
+            role = "사용자" if role_value == "user" else "챗봇"
+            history_context += f"{role}: {content_value[:200]}...\n"
+        history_context += "\n"
+
+    # Get current date
+    from datetime import datetime
+    current_date = datetime.now().strftime('%Y년 %m월 %d일')
+    
+    prompt_text = f"""당신은 초보 투자자를 돕는 친절한 주식 가이드입니다.
 다음 금융에서 수집한 데이터를 **쉽고 간단하게** 정리해서 알려주세요.
 
 **오늘 날짜:** {current_date}
@@ -237,6 +226,38 @@ def _generate_final_answer_llm(
 
 위 가이드에 따라 **결론부터 먼저 제시하고, 그 다음 근거를 설명하는 답변**을 작성하세요:"""
 
+    return prompt_text
+
+
+def _generate_final_answer_llm(
+    intent: IntentResult,
+    summaries: List[SourceSummary],
+    chat_history: List = None
+) -> str:
+    """
+    Generate final answer using LLM (optional mode)
+    Args:
+        intent: Intent analysis result
+        summaries: Source summaries
+        chat_history: Previous chat messages for context (optional)
+    Returns:
+        Final answer text
+    """
+    try:
+        # Check if OpenAI API key is available
+        if not get_env('OPENAI_API_KEY'):
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.info("No OpenAI API key found, using basic template mode")
+            return _generate_final_answer_basic(intent, summaries)
+
+        prompt_text = _build_llm_prompt(intent, summaries, chat_history)
+        if prompt_text is None:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning("No evidence data available for LLM")
+            return _generate_final_answer_basic(intent, summaries)
+
         # Use OpenAI API
         from openai import OpenAI
         from config import LLM_MODEL_OPENAI, LLM_MAX_TOKENS, LLM_TEMPERATURE
@@ -264,27 +285,77 @@ def _generate_final_answer_llm(
         return _generate_final_answer_basic(intent, summaries)
 
 
-def generate_answer(
+def _generate_final_answer_llm_stream(
     intent: IntentResult,
-    plans: List[FetchPlan],
     summaries: List[SourceSummary],
-    use_llm: bool = False,
-    show_details: bool = True,
     chat_history: List = None
-) -> str:
+) -> Iterator[str]:
     """
-    Generate 4-step structured answer
-
+    Streaming variant of _generate_final_answer_llm
+    Yields answer text chunks as the LLM produces them; falls back to the basic
+    template (as a single chunk) if the LLM is unavailable or fails before any output
     Args:
         intent: Intent analysis result
-        plans: Fetch plans
         summaries: Source summaries
-        use_llm: Whether to use LLM for answer generation (default: False)
-        show_details: Whether to show detailed steps 1-3 (default: True)
         chat_history: Previous chat messages for context (optional)
+    Yields:
+        Answer text chunks
+    """
+    import logging
+    logger = logging.getLogger(__name__)
 
-    Returns:
-        Complete answer as markdown string
+    if not get_env('OPENAI_API_KEY'):
+        logger.info("No OpenAI API key found, using basic template mode")
+        yield _generate_final_answer_basic(intent, summaries)
+        return
+
+    prompt_text = _build_llm_prompt(intent, summaries, chat_history)
+    if prompt_text is None:
+        logger.warning("No evidence data available for LLM")
+        yield _generate_final_answer_basic(intent, summaries)
+        return
+
+    started = False
+    try:
+        from openai import OpenAI
+        from config import LLM_MODEL_OPENAI, LLM_MAX_TOKENS
+
+        logger.info(f"Calling OpenAI API (streaming) with model: {LLM_MODEL_OPENAI}")
+
+        client = OpenAI(api_key=get_env('OPENAI_API_KEY'))
+
+        stream = client.chat.completions.create(
+            model=LLM_MODEL_OPENAI,
+            max_completion_tokens=LLM_MAX_TOKENS,
+            messages=[{"role": "user", "content": prompt_text}],
+            stream=True
+        )
+
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                started = True
+                yield delta
+
+        logger.info("OpenAI streaming call successful")
+
+    except Exception as e:
+        logger.error(f"LLM answer streaming failed: {str(e)}", exc_info=True)
+        if not started:
+            logger.info("Falling back to basic template mode")
+            yield _generate_final_answer_basic(intent, summaries)
+
+
+def _answer_header_lines(
+    intent: IntentResult,
+    plans: List[FetchPlan],
+    summaries: List[SourceSummary],
+    show_details: bool
+) -> List[str]:
+    """
+    Build answer lines before the final answer (steps 1-3, only with show_details)
     """
     output = []
 
@@ -319,16 +390,14 @@ def generate_answer(
         # Step 4: Final Answer
         output.append("### [4] 최종 답변 (초보자 친화)\n")
 
-    # Generate final answer (always shown)
-    if summaries:
-        if use_llm:
-            final_answer = _generate_final_answer_llm(intent, summaries, chat_history)
-        else:
-            final_answer = _generate_final_answer_basic(intent, summaries)
-        output.append(final_answer)
-    else:
-        output.append("질문에 답변할 수 있는 충분한 데이터를 수집하지 못했습니다.")
-        output.append("종목 코드를 확인하거나, 다시 시도해주세요.\n")
+    return output
+
+
+def _answer_footer_lines(summaries: List[SourceSummary], show_details: bool) -> List[str]:
+    """
+    Build answer lines after the final answer (references and disclaimer)
+    """
+    output = []
 
     # Reference section - ALWAYS show (even when show_details=False)
     # This ensures users can verify all data comes from finance.daum.net
@@ -378,4 +447,85 @@ def generate_answer(
         output.append("\n\n---")
         output.append("*본 정보는 다음 금융 데이터 기반이며, 투자 판단은 본인 책임입니다*")
 
+    return output
+
+
+# Shown instead of the final answer when no data was collected
+NO_DATA_LINES = [
+    "질문에 답변할 수 있는 충분한 데이터를 수집하지 못했습니다.",
+    "종목 코드를 확인하거나, 다시 시도해주세요.\n"
+]
+
+
+def generate_answer(
+    intent: IntentResult,
+    plans: List[FetchPlan],
+    summaries: List[SourceSummary],
+    use_llm: bool = False,
+    show_details: bool = True,
+    chat_history: List = None
+) -> str:
+    """
+    Generate 4-step structured answer
+
+    Args:
+        intent: Intent analysis result
+        plans: Fetch plans
+        summaries: Source summaries
+        use_llm: Whether to use LLM for answer generation (default: False)
+        show_details: Whether to show detailed steps 1-3 (default: True)
+        chat_history: Previous chat messages for context (optional)
+
+    Returns:
+        Complete answer as markdown string
+    """
+    output = _answer_header_lines(intent, plans, summaries, show_details)
+
+    # Generate final answer (always shown)
+    if summaries:
+        if use_llm:
+            final_answer = _generate_final_answer_llm(intent, summaries, chat_history)
+        else:
+            final_answer = _generate_final_answer_basic(intent, summaries)
+        output.append(final_answer)
+    else:
+        output.extend(NO_DATA_LINES)
+
+    output.extend(_answer_footer_lines(summaries, show_details))
+
     return "\n".join(output)
+
+
+def generate_answer_stream(
+    intent: IntentResult,
+    plans: List[FetchPlan],
+    summaries: List[SourceSummary],
+    use_llm: bool = False,
+    show_details: bool = True,
+    chat_history: List = None
+) -> Iterator[str]:
+    """
+    Streaming variant of generate_answer
+    Yields the answer as text chunks (LLM tokens as they arrive);
+    the concatenated chunks equal the generate_answer output
+
+    Args:
+        Same as generate_answer
+
+    Yields:
+        Markdown text chunks
+    """
+    header = _answer_header_lines(intent, plans, summaries, show_details)
+    if header:
+        yield "\n".join(header) + "\n"
+
+    # Generate final answer (always shown)
+    if summaries:
+        if use_llm:
+            yield from _generate_final_answer_llm_stream(intent, summaries, chat_history)
+        else:
+            yield _generate_final_answer_basic(intent, summaries)
+    else:
+        yield "\n".join(NO_DATA_LINES)
+
+    yield "\n" + "\n".join(_answer_footer_lines(summaries, show_details))
@@ -30,8 +30,9 @@ logger = logging.getLogger(__name__)
 
 # Import LangGraph workflow (optional)
 try:
-    from graph.workflow import create_workflow
+    from graph.workflow import get_workflow
     from graph.state import create_initial_state
+    get_workflow()  # Compile once per process; later messages reuse the cached graph
     LANGGRAPH_AVAILABLE = True
     logger.info("✅ LangGraph available - using advanced workflow")
 except ImportError:
@@ -39,6 +40,25 @@ except ImportError:
     logger.warning("⚠️ LangGraph not installed - using traditional workflow (install: pip install langgraph)")
 
 
+def _iter_workflow(app, initial_state, answer_placeholder):
+    """
+    Run the LangGraph workflow, rendering answer tokens into answer_placeholder as they stream
+    
+    Yields:
+        (node_name, state_update) for each completed node
+    """
+    answer_text = ""
+    for mode, chunk in app.stream(initial_state, stream_mode=["updates", "custom"]):
+        if mode == "custom":
+            token = chunk.get('answer_token') if isinstance(chunk, dict) else None
+            if token:
+                answer_text += token
+                answer_placeholder.markdown(answer_text + "▌")
+        elif chunk:
+            node_name = list(chunk.keys())[0]
+            yield node_name, chunk[node_name] or {}
+
+
 def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool):
     """
     Process stock-related query using LangGraph workflow
@@ -61,35 +81,33 @@ def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool
         
         # Run LangGraph workflow
         if show_steps:
-            # Run workflow and show intermediate steps
-            with st.expander("🧠 사고 과정 보기 (전문 애널리스트 분석)", expanded=True):
-                # Create placeholders for each step
-                step1_placeholder = st.empty()
-                step2_placeholder = st.empty()
-                step3_placeholder = st.empty()
-                step4_placeholder = st.empty()
-                step5_placeholder = st.empty()
-                
-                step1_placeholder.markdown("### [1단계] 질문 의도 분석 중... ⏳")
-                
-                # Prepare initial state
-                initial_state = create_initial_state(
-                    user_query=user_input,
-                    chat_history=chat_history,
-                    show_steps=show_steps,
-                    use_llm=use_llm
-                )
-                
-                app = create_workflow()
-                
-                # Stream results and update UI in real-time
-                final_state = {}
-                for state_update in app.stream(initial_state):
-                    if state_update:
-                        # Get node name and updated state
-                        node_name = list(state_update.keys())[0]
-                        current_state = state_update[node_name]
-                        
+            # Run workflow and show intermediate steps (answer streams below them)
+            steps_container = st.container()
+            answer_placeholder = st.empty()
+            with steps_container:
+                with st.expander("🧠 사고 과정 보기 (전문 애널리스트 분석)", expanded=True):
+                    # Create placeholders for each step
+                    step1_placeholder = st.empty()
+                    step2_placeholder = st.empty()
+                    step3_placeholder = st.empty()
+                    step4_placeholder = st.empty()
+                    step5_placeholder = st.empty()
+                    
+                    step1_placeholder.markdown("### [1단계] 질문 의도 분석 중... ⏳")
+                    
+                    # Prepare initial state
+                    initial_state = create_initial_state(
+                        user_query=user_input,
+                        chat_history=chat_history,
+                        show_steps=show_steps,
+                        use_llm=use_llm
+                    )
+                    
+                    app = get_workflow()
+                    
+                    # Stream results and update UI in real-time
+                    final_state = {}
+                    for node_name, current_state in _iter_workflow(app, initial_state, answer_placeholder):
                         # Merge with final_state
                         final_state.update(current_state)
                         
@@ -113,7 +131,7 @@ def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool
                             step2_placeholder.markdown(plan_text)
                             step3_placeholder.markdown("### [3단계] 데이터 수집 중... ⏳")
                         
-                        elif node_name == "fetch" and final_state.get('data_collected'):
+                        elif node_name in ("fetch", "gather", "join") and final_state.get('data_collected'):
                             success = final_state.get('successful_fetches', 0)
                             failed = final_state.get('failed_fetches', 0)
                             step3_placeholder.markdown(
@@ -123,7 +141,9 @@ def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool
                             )
                             step4_placeholder.markdown("### [4단계] 전문 애널리스트 분석 중... ⏳")
                         
-                        elif node_name == "summarize" and final_state.get('summaries_created'):
+                        
+                        # Progressive gather / parallel join nodes complete steps 3 and 4 together
+                        if node_name in ("summarize", "gather", "join") and final_state.get('summaries_created'):
                             summaries = final_state.get('summaries', [])
                             summary_text = (
                                 f"### [4단계] 전문 애널리스트 분석 ✅\n\n"
@@ -153,11 +173,12 @@ def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool
                         elif node_name == "answer" and final_state.get('answer_generated'):
                             step5_placeholder.markdown("### [5단계] 최종 투자 의견 생성 완료 ✅")
                 
-                # If there was an error during streaming, set final_state from last update
-                if not final_state:
-                    step1_placeholder.error("❌ 워크플로우 실행 중 오류가 발생했습니다.")
+                    # If there was an error during streaming, set final_state from last update
+                    if not final_state:
+                        step1_placeholder.error("❌ 워크플로우 실행 중 오류가 발생했습니다.")
         else:
             # Silent mode - just show spinner
+            answer_placeholder = st.empty()
             with st.spinner("💭 생각하는 중..."):
                 # Execute workflow without showing intermediate steps
                 initial_state = create_initial_state(
@@ -167,11 +188,14 @@ def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool
                     use_llm=use_llm
                 )
                 
-                app = create_workflow()
-                final_state = app.invoke(initial_state)
+                app = get_workflow()
+                final_state = {}
+                for _, current_state in _iter_workflow(app, initial_state, answer_placeholder):
+                    final_state.update(current_state)
         
         # Check for errors
         if final_state.get('error'):
+            answer_placeholder.empty()
             error_msg = f"❌ **오류가 발생했습니다**\n\n{final_state['error']}\n\n잠시 후 다시 시도해주세요."
             st.markdown(error_msg)
             state.add_assistant_message(error_msg)
@@ -179,6 +203,7 @@ def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool
         
         # Check if answer was generated
         if not final_state.get('answer_generated'):
+            answer_placeholder.empty()
             response = "❌ 답변을 생성할 수 없습니다.\n\n잠시 후 다시 시도해주세요."
             st.markdown(response)
             state.add_assistant_message(response)
@@ -204,9 +229,9 @@ def _process_stock_query(user_input: str, state, show_steps: bool, use_llm: bool
             if stock_changed:
                 st.info(f"🔄 종목이 **{final_state['stock_name']} ({new_stock_code})** 으로 변경되었습니다.")
         
-        # Display final answer
+        # Display final answer (replaces the streamed preview)
         answer_text = final_state.get('final_answer', '')
-        st.markdown(answer_text)
+        answer_placeholder.markdown(answer_text)
         
         # Add to history
         state.add_assistant_message(answer_text)
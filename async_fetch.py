@@ -0,0 +1,249 @@
+"""
+Async fetch backend for Daum Finance (httpx)
+Same FetchResult contract, allowlist enforcement and retry engine as daum_fetch.fetch,
+with pooled keep-alive connections per host and optional HTTP/2
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Optional, Dict
+from urllib.parse import urlparse
+
+from config import (
+    DEFAULT_HEADERS,
+    DEFAULT_TIMEOUT,
+    CACHE_TTL_DEFAULT,
+    HTTP_POOL_MAXSIZE,
+    HTTP_POOL_SIZE_PER_HOST,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP2_ENABLED,
+    RATE_LIMIT_MAX_WAIT
+)
+from daum_fetch import (
+    FetchResult,
+    is_allowed_domain,
+    prepare_headers,
+    get_cached_result,
+    build_result
+)
+from retry import RetryState
+from rate_limiter import acquire_rate_limit_async
+
+logger = logging.getLogger(__name__)
+
+# Clients are bound to the event loop that created them: {loop: {host: AsyncClient}}
+_clients = weakref.WeakKeyDictionary()
+
+# Background event loop used by the sync shim
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """Check if HTTP/2 is enabled and the h2 package is installed"""
+    if not HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("HTTP2_ENABLED is set but 'h2' is not installed - using HTTP/1.1")
+        return False
+
+
+def _get_client(host: str):
+    """
+    Get or create a pooled AsyncClient for a host on the running loop
+    Args:
+        host: Request host (e.g. finance.daum.net)
+    Returns:
+        httpx.AsyncClient instance
+    """
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    host_clients = _clients.setdefault(loop, {})
+
+    client = host_clients.get(host)
+    if client is None:
+        pool_size = HTTP_POOL_SIZE_PER_HOST.get(host, HTTP_POOL_MAXSIZE)
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        )
+        client = httpx.AsyncClient(
+            http2=_http2_available(),
+            limits=limits,
+            headers=DEFAULT_HEADERS,
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True
+        )
+        host_clients[host] = client
+
+    return client
+
+
+async def fetch_async(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+    cache_ttl: int = CACHE_TTL_DEFAULT,
+    params: Optional[dict] = None,
+    is_json: bool = False,
+    max_stale: int = 0,
+    check_cache: bool = True
+) -> FetchResult:
+    """
+    Fetch content from Daum Finance asynchronously with allowlist enforcement
+
+    Args:
+        url: URL to fetch
+        headers: Additional headers (optional)
+        use_cache: Whether to use cache (default: True)
+        cache_ttl: Cache TTL in seconds (default: CACHE_TTL_DEFAULT)
+        params: URL parameters (optional)
+        is_json: Whether to parse response as JSON (default: False)
+        max_stale: Seconds the cached value may be served stale after TTL (default: 0)
+        check_cache: Whether to look up the cache first (default: True; False when the
+            caller already did, e.g. daum_fetch through fetch_sync)
+
+    Returns:
+        FetchResult object
+    """
+    import httpx
+
+    # CRITICAL: Allowlist check - block immediately if not allowed
+    if not is_allowed_domain(url):
+        return FetchResult(
+            success=False,
+            error_message=f"도메인 허용 목록에 없음: {url}",
+            url=url
+        )
+
+    # Check cache first
+    if use_cache and check_cache:
+        cached = get_cached_result(url, params, is_json)
+        if cached is not None:
+            return cached
+
+    client = _get_client(urlparse(url).netloc.lower())
+    request_headers = prepare_headers(headers)
+
+    # Unified retry engine (backoff + jitter, Retry-After, time budget, circuit breaker)
+    retry = RetryState(url)
+    while True:
+        if not retry.allow():
+            return FetchResult(
+                success=False,
+                error_message=retry.circuit_open_message(),
+                url=url
+            )
+
+        # Queue for a token from the shared per-host rate limiter (bounded wait)
+        if not await acquire_rate_limit_async(retry.host, max_wait=min(RATE_LIMIT_MAX_WAIT, retry.remaining())):
+            return FetchResult(
+                success=False,
+                error_message=f"요청 한도 초과: {retry.host} (대기 시간 초과)",
+                url=url
+            )
+
+        try:
+            response = await client.get(
+                url,
+                headers=request_headers,
+                params=params,
+                timeout=retry.timeout()
+            )
+
+        except httpx.TimeoutException:
+            delay = retry.on_error()
+            if delay is None:
+                return FetchResult(
+                    success=False,
+                    error_message=f"요청 시간 초과 ({retry.elapsed():.0f}초, {retry.attempts}회 시도)",
+                    url=url
+                )
+            await asyncio.sleep(delay)
+            continue
+
+        except Exception as e:
+            delay = retry.on_error()
+            if delay is None:
+                return FetchResult(
+                    success=False,
+                    error_message=f"요청 실패: {str(e)}",
+                    url=url
+                )
+            await asyncio.sleep(delay)
+            continue
+
+        # Retry 403/429/5xx while attempts and budget remain
+        delay = retry.on_status(response.status_code, response.headers.get('Retry-After'))
+        if delay is not None:
+            await asyncio.sleep(delay)
+            continue
+
+        return build_result(
+            url,
+            response.status_code,
+            response.text,
+            is_json=is_json,
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+            params=params,
+            max_stale=max_stale
+        )
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop shared by all sync callers"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever,
+                name="async-fetch-loop",
+                daemon=True
+            )
+            thread.start()
+    return _loop
+
+
+def fetch_sync(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+    cache_ttl: int = CACHE_TTL_DEFAULT,
+    params: Optional[dict] = None,
+    is_json: bool = False,
+    max_stale: int = 0,
+    check_cache: bool = True
+) -> FetchResult:
+    """
+    Blocking shim around fetch_async for existing synchronous callers
+    Requests from all Streamlit threads share one loop and its connection pools
+
+    Args:
+        Same as fetch_async
+
+    Returns:
+        FetchResult object
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        fetch_async(
+            url,
+            headers=headers,
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+            params=params,
+            is_json=is_json,
+            max_stale=max_stale,
+            check_cache=check_cache
+        ),
+        _get_loop()
+    )
+    return future.result()
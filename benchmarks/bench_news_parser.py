@@ -0,0 +1,200 @@
+"""
+Micro-benchmark: parse_news_list with precompiled selector plans vs the
+previous implementation (one select/select_one call per selector)
+
+Fixture pages cover each item-selector path: the standard Daum news list,
+generic article cards (later fallbacks) and bare news links (last fallback).
+Both implementations must return identical results on every page.
+
+Usage:
+    python benchmarks/bench_news_parser.py [iterations]
+"""
+import gc
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parsers import _page, _news_page  # noqa: E402
+from html_backend import HTML_BACKENDS, parse_html, set_html_backend  # noqa: E402
+from parsers import parse_news_list  # noqa: E402
+
+
+def legacy_parse_news_list(html: str) -> List[Dict[str, str]]:
+    """
+    parse_news_list before selector plans (one select_one per selector per item)
+    Args:
+        html: News page HTML
+    Returns:
+        List of {title, date, link, summary} dicts
+    """
+    try:
+        doc = parse_html(html)
+        results = []
+
+        # Try multiple selectors for different page structures
+        item_selectors = [
+            '.newsList .item_news',           # Standard news list
+            '.news_list .item',               # Alternative structure
+            '.list_news .item',               # Another variant
+            'ul[class*="news"] li',           # Generic news list
+            'div[class*="news"][class*="item"]',  # Div-based items
+            'article[class*="news"]',         # Article-based structure
+        ]
+        
+        items = []
+        for selector in item_selectors:
+            items = doc.select(selector)
+            if items:
+                break
+        
+        if not items:
+            # Fallback: Try to find any links with news-related patterns
+            items = doc.select('a[href*="/news/"]')
+
+        for item in items:
+            try:
+                # Title and link - try multiple selectors
+                link_elem = None
+                title_selectors = [
+                    '.link_news',
+                    'a.link',
+                    'a[class*="title"]',
+                    'a[class*="news"]',
+                    'h3 a',
+                    'h4 a',
+                    'a'
+                ]
+                
+                for selector in title_selectors:
+                    link_elem = item.select_one(selector) if item.name != 'a' else item
+                    if link_elem and link_elem.text():
+                        break
+                
+                if not link_elem:
+                    continue
+
+                title = link_elem.text()
+                link = link_elem.get('href', '')
+                
+                # Skip if title is too short (likely not a real news title)
+                if len(title) < 10:
+                    continue
+
+                # Date - try multiple selectors
+                date = ''
+                date_selectors = [
+                    '.txt_date',
+                    '.date',
+                    'span[class*="date"]',
+                    'time',
+                    '.info_date'
+                ]
+                
+                for selector in date_selectors:
+                    date_elem = item.select_one(selector)
+                    if date_elem:
+                        date = date_elem.text()
+                        break
+
+                # Summary - try multiple selectors
+                summary = ''
+                summary_selectors = [
+                    '.txt_summary',
+                    '.summary',
+                    'p[class*="summary"]',
+                    'p[class*="desc"]',
+                    '.description',
+                    'p'
+                ]
+                
+                for selector in summary_selectors:
+                    summary_elem = item.select_one(selector)
+                    if summary_elem:
+                        summary_text = summary_elem.text()
+                        # Only use if substantial (not just date or short text)
+                        if len(summary_text) > 20:
+                            summary = summary_text[:300]  # Limit to 300 chars
+                            break
+
+                results.append({
+                    'title': title,
+                    'date': date,
+                    'link': link,
+                    'summary': summary
+                })
+
+            except Exception:
+                continue
+
+        return results[:10]  # Limit to 10 news items
+
+    except Exception:
+        return []
+
+
+def _article_cards_page() -> str:
+    items = "".join(
+        f'<article class="news_card"><h3><a href="/news/{i}">코스피 반등에 대형주 강세, 외국인 순매수 {i}</a></h3>'
+        f'<time>{i + 1}시간 전</time><p class="desc">반도체와 2차전지 업종이 동반 상승하며 지수를 끌어올렸다 {i}</p></article>'
+        for i in range(20)
+    )
+    return _page(f'<section class="feed">{items}</section>')
+
+
+def _bare_links_page() -> str:
+    items = "".join(
+        f'<div class="box"><a href="/news/{i}">금리 동결 전망에 증시 관망세 이어져 {i}</a></div>'
+        for i in range(20)
+    )
+    return _page(f'<div class="content_area">{items}</div>')
+
+
+FIXTURES = {
+    "standard list": _news_page,
+    "article cards": _article_cards_page,
+    "bare links": _bare_links_page,
+}
+
+
+def _median_ms(funcs, html: str, iterations: int) -> List[float]:
+    """Median time of each function, interleaved and with GC paused to limit noise"""
+    runs = [[] for _ in funcs]
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            for index, func in enumerate(funcs):
+                start = time.perf_counter()
+                func(html)
+                runs[index].append((time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+    return [statistics.median(r) for r in runs]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    backends = [name for name in HTML_BACKENDS if set_html_backend(name) == name]
+    for backend in backends:
+        set_html_backend(backend)
+        print(f"[{backend}]")
+        for page_name, make_page in FIXTURES.items():
+            html = make_page()
+            same = legacy_parse_news_list(html) == parse_news_list(html)
+            tree_ms, legacy_ms, plan_ms = _median_ms(
+                [parse_html, legacy_parse_news_list, parse_news_list], html, iterations
+            )
+            print(
+                f"  {page_name:<14} legacy {legacy_ms:7.2f}ms  plan {plan_ms:7.2f}ms  "
+                f"(selection {legacy_ms - tree_ms:6.2f} -> {plan_ms - tree_ms:6.2f}ms, "
+                f"identical output: {'yes' if same else 'NO'})"
+            )
+
+
+if __name__ == "__main__":
+    main()
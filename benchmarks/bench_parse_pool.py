@@ -0,0 +1,65 @@
+"""
+Benchmark: concurrent page parsing in-thread vs in the parse process pool
+
+Simulates several sessions parsing large news/quote pages at the same time
+(threads, like Streamlit sessions) and reports wall time for each mode. Also
+checks that both modes return identical results.
+
+Usage:
+    python benchmarks/bench_parse_pool.py [sessions] [pages_per_session]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parse_executor  # noqa: E402
+from bench_parsers import _news_page, _price_page, _talks_page  # noqa: E402
+
+PAGES = [
+    ("parse_news_list", _news_page()),
+    ("parse_price_page", _price_page()),
+    ("parse_talks_list", _talks_page()),
+]
+
+
+def _run(sessions: int, pages_per_session: int, use_pool: bool):
+    """Parse pages from concurrent sessions; returns (wall seconds, results)"""
+    parse_executor.PARSE_PROCESS_POOL = use_pool
+
+    def session(index: int):
+        return [
+            parse_executor.run_parser(*PAGES[(index + i) % len(PAGES)])
+            for i in range(pages_per_session)
+        ]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        results = list(executor.map(session, range(sessions)))
+    return time.perf_counter() - start, results
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    pages_per_session = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+
+    print(f"{sessions} sessions x {pages_per_session} pages, "
+          f"{parse_executor.PARSE_PROCESS_WORKERS} workers, "
+          f"page sizes {', '.join(f'{len(html) / 1024:.0f} KB' for _, html in PAGES)}\n")
+
+    # Start the workers outside the timed runs
+    _run(parse_executor.PARSE_PROCESS_WORKERS, 1, use_pool=True)
+
+    thread_time, thread_results = _run(sessions, pages_per_session, use_pool=False)
+    pool_time, pool_results = _run(sessions, pages_per_session, use_pool=True)
+    parse_executor.shutdown()
+
+    print(f"in-thread     {thread_time * 1000:8.1f}ms")
+    print(f"process pool  {pool_time * 1000:8.1f}ms  ({thread_time / pool_time:.1f}x)")
+    print(f"identical output: {'yes' if thread_results == pool_results else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark: per-page parse time of each HTML parser for each HTML backend
+
+Pages are synthetic Daum Finance-like fixtures (padded with navigation/script
+noise to a realistic size). The benchmark also checks that every backend
+returns identical output dicts.
+
+Usage:
+    python benchmarks/bench_parsers.py [iterations]
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parsers  # noqa: E402
+from html_backend import HTML_BACKENDS, set_html_backend  # noqa: E402
+
+
+def _page(body: str, filler_blocks: int = 300) -> str:
+    """Wrap body in a page with header/footer noise similar to Daum Finance"""
+    nav = "".join(
+        f'<li class="item_gnb"><a href="/menu/{i}" class="link_gnb">메뉴 {i}</a></li>'
+        for i in range(40)
+    )
+    filler = "".join(
+        f'<div class="box_etc"><span class="txt_etc">관련 정보 {i}</span>'
+        f'<a href="/etc/{i}">바로가기 &gt;</a><p>광고 및 안내 문구 {i} &nbsp; 자세히 보기</p></div>'
+        for i in range(filler_blocks)
+    )
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>다음 금융</title>'
+        '<style>.price{color:red}</style>'
+        '<script>window.__CONFIG__ = {"service": "finance", "items": [1, 2, 3]};</script>'
+        f'</head><body><div id="header"><ul class="list_gnb">{nav}</ul></div>'
+        f'<div id="content">{body}</div><div id="footer">{filler}</div></body></html>'
+    )
+
+
+def _price_page() -> str:
+    rows = "".join(
+        f"<tr><th>{key}</th><td>{value}</td></tr>"
+        for key, value in [
+            ("거래량", "12,345,678"), ("거래대금", "8,765억"), ("시가", "71,200"),
+            ("고가", "72,000"), ("저가", "70,800"), ("전일종가", "71,000"),
+        ]
+    )
+    return _page(
+        '<div class="info_price"><strong class="txt_price">71,500</strong>'
+        '<span class="txt_change">▲500</span><span class="txt_rate">+0.70%</span></div>'
+        f'<table class="tb_summary"><tbody>{rows}</tbody></table>'
+    )
+
+
+def _spa_price_page() -> str:
+    """React/SPA quote page: empty root plus embedded state JSON"""
+    state = {
+        "quote": {
+            "symbolCode": "A005930", "name": "삼성전자", "tradePrice": 71500, "change": "RISE",
+            "changeRate": 0.007, "accTradeVolume": 12345678,
+        },
+        "chart": [{"date": f"2026-{i % 12 + 1:02d}-01", "tradePrice": 70000 + i} for i in range(500)],
+    }
+    return _page('<div id="root"></div>').replace(
+        '</body>', f'<script>window.__INITIAL_STATE__ = {json.dumps(state)};</script></body>'
+    )
+
+
+def _news_page() -> str:
+    items = "".join(
+        f'<li class="item_news"><a href="/news/{i}" class="link_news">삼성전자, 반도체 업황 개선 기대감에 상승 {i}</a>'
+        f'<span class="txt_date">2026.10.{i % 28 + 1:02d}</span>'
+        f'<p class="txt_summary">메모리 가격 반등과 함께 외국인 순매수가 이어지며 주가가 강세를 보였다 {i}</p></li>'
+        for i in range(20)
+    )
+    return _page(f'<ul class="newsList">{items}</ul>')
+
+
+def _disclosure_page() -> str:
+    items = "".join(
+        f'<li class="item_disclosure"><a href="/disclosures/{i}" class="link_disclosure">주요사항보고서 {i}</a>'
+        f'<span class="txt_date">2026.10.{i % 28 + 1:02d}</span><span class="txt_category">공시 {i % 3}</span></li>'
+        for i in range(20)
+    )
+    return _page(f'<ul class="disclosureList">{items}</ul>')
+
+
+def _talks_page() -> str:
+    items = "".join(
+        f'<li class="item_talk"><p class="txt_talk">오늘 장 분위기 좋네요 <b>{i}</b> 계속 보유합니다</p>'
+        f'<span class="txt_writer">투자자{i}</span><span class="txt_date">10.{i % 28 + 1:02d}</span></li>'
+        for i in range(20)
+    )
+    return _page(f'<ul class="talkList">{items}</ul>')
+
+
+def _search_page() -> str:
+    items = "".join(
+        f'<li class="item_stock"><a href="/quotes/{5930 + i:06d}"><span class="txt_name">종목{i}</span>'
+        f'<span class="txt_sub">KOSPI</span></a></li>'
+        for i in range(10)
+    )
+    return _page(f'<ul class="searchStockList">{items}</ul>')
+
+
+# Label -> (parser name, page factory)
+FIXTURES = {
+    "parse_price_page": ("parse_price_page", _price_page),
+    "parse_price_page (SPA)": ("parse_price_page", _spa_price_page),
+    "parse_news_list": ("parse_news_list", _news_page),
+    "parse_disclosure_list": ("parse_disclosure_list", _disclosure_page),
+    "parse_talks_list": ("parse_talks_list", _talks_page),
+    "parse_search_results": ("parse_search_results", _search_page),
+}
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    backends = [name for name in HTML_BACKENDS if set_html_backend(name) == name]
+    print(f"Backends: {', '.join(backends)} ({iterations} iterations per page)\n")
+
+    for label, (parser_name, make_page) in FIXTURES.items():
+        html = make_page()
+        parse = getattr(parsers, parser_name)
+        outputs = {}
+        timings = {}
+
+        for backend in backends:
+            set_html_backend(backend)
+            outputs[backend] = parse(html)
+            runs = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                parse(html)
+                runs.append((time.perf_counter() - start) * 1000)
+            timings[backend] = statistics.median(runs)
+
+        same = all(output == outputs[backends[0]] for output in outputs.values())
+        print(f"{label} ({len(html) / 1024:.0f} KB, identical output: {'yes' if same else 'NO'})")
+        for backend in backends:
+            speedup = timings[backends[0]] / timings[backend] if timings[backend] else 0
+            print(f"  {backend:<11} median {timings[backend]:7.2f}ms  ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
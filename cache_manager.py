@@ -1,21 +1,105 @@
 """
 Simple memory-based TTL cache manager
+Bounded by entry count and total size with LRU eviction
+Thread-safe, with single-flight coalescing of concurrent misses
+Expired entries can be kept for a bounded time and served stale while revalidating
+Optional on-disk L2 tier (see disk_cache.py) shared across restarts and processes
+Parser results are memoized next to the raw pages (memory only)
 """
 
+import logging
+import threading
 import time
-from typing import Any, Optional, Dict, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Dict, Tuple
 import hashlib
 import json
+import sys
+
+from config import (
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_BYTES,
+    CACHE_TTL_PARSED,
+    CACHE_SWEEP_INTERVAL,
+    CACHE_DISK_ENABLED,
+    CACHE_DISK_PATH,
+    CACHE_DISK_MAX_ENTRIES,
+    CACHE_WARM_START_ENTRIES
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    Estimate memory size of a cached value in bytes
+    Args:
+        value: Cached value (HTML string, JSON dict/list, etc.)
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _InFlightCall:
+    """
+    A load in progress that concurrent callers wait on
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
 
 
 class CacheManager:
     """
     Simple in-memory cache with TTL (Time To Live)
+    Least recently used entries are evicted when the entry count or
+    total size limit is exceeded
+    All operations are guarded by a lock (shared across Streamlit sessions)
+
+    When an L2 store is given, writes go through to it and L1 misses are
+    looked up there and promoted into memory
     """
 
-    def __init__(self):
-        # Cache structure: {key: (value, expire_time)}
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+        sweep_interval: float = CACHE_SWEEP_INTERVAL,
+        l2: Optional[Any] = None
+    ):
+        # Cache structure: {key: (value, expire_time, stale_until, size)} in LRU order (oldest first)
+        self._cache: "OrderedDict[str, Tuple[Any, float, float, int]]" = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.l2 = l2  # Optional on-disk tier (e.g. SQLiteCacheStore)
+
+        self._total_bytes = 0
+        self._last_sweep = time.time()
+
+        self._lock = threading.RLock()
+        self._inflight: Dict[str, _InFlightCall] = {}
+
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._coalesced = 0
+        self._stale_hits = 0
+        self._l2_hits = 0
+        self._parsed_hits = 0
+        self._parsed_misses = 0
 
     def _make_key(self, url: str, params: Optional[dict] = None) -> str:
         """
@@ -33,6 +117,109 @@ class CacheManager:
 
         return hashlib.md5(key_data.encode()).hexdigest()
 
+    def _remove(self, key: str):
+        """
+        Remove entry and update size accounting
+        """
+        _, _, _, size = self._cache.pop(key)
+        self._total_bytes -= size
+
+    def _evict_if_needed(self):
+        """
+        Evict least recently used entries until within limits
+        """
+        while self._cache and (
+            len(self._cache) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._cache))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def _sweep_due(self) -> bool:
+        """
+        Amortized expiry sweep - due at most once per sweep_interval
+        """
+        now = time.time()
+        if now - self._last_sweep >= self.sweep_interval:
+            self._last_sweep = now
+            return True
+        return False
+
+    def _insert(self, key: str, value: Any, expire_time: float, stale_until: float):
+        """
+        Insert entry into memory as most recently used (caller holds the lock)
+        """
+        size = _estimate_size(value)
+
+        # Values larger than the whole cache are not stored
+        if size > self.max_bytes:
+            return
+
+        if key in self._cache:
+            self._remove(key)
+
+        self._cache[key] = (value, expire_time, stale_until, size)
+        self._total_bytes += size
+        self._evict_if_needed()
+
+    def _l2_call(self, method: str, *args) -> Any:
+        """
+        Call the L2 store, never letting disk errors break the caller
+        """
+        try:
+            return getattr(self.l2, method)(*args)
+        except Exception as e:
+            logger.warning(f"[Cache] L2 {method} failed: {str(e)}")
+            return None
+
+    def _lookup(self, url: str, params: Optional[dict], allow_stale: bool) -> Optional[Tuple[Any, bool]]:
+        """
+        Look up an entry (L1, then L2) and update counters
+        Returns:
+            (value, is_stale) tuple or None on miss
+        """
+        key = self._make_key(url, params)
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(key)
+
+            # Past the staleness ceiling - drop it
+            if entry is not None and now > entry[2]:
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+
+        # L1 miss: try the disk tier and promote the entry
+        if entry is None and self.l2 is not None:
+            l2_entry = self._l2_call('get', key)
+            if l2_entry is not None:
+                value, expire_time, stale_until = l2_entry
+                entry = (value, expire_time, stale_until, 0)
+                with self._lock:
+                    self._l2_hits += 1
+                    self._insert(key, value, expire_time, stale_until)
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expire_time, _, _ = entry
+            is_stale = now > expire_time
+            if is_stale and not allow_stale:
+                self._misses += 1
+                return None
+
+            # Mark as recently used
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            if is_stale:
+                self._stale_hits += 1
+            else:
+                self._hits += 1
+            return value, is_stale
+
     def get(self, url: str, params: Optional[dict] = None) -> Optional[Any]:
         """
         Get value from cache if not expired
@@ -42,21 +229,46 @@ class CacheManager:
         Returns:
             Cached value or None if not found/expired
         """
-        key = self._make_key(url, params)
-
-        if key not in self._cache:
-            return None
-
-        value, expire_time = self._cache[key]
+        entry = self._lookup(url, params, allow_stale=False)
+        return entry[0] if entry else None
 
-        # Check if expired
-        if time.time() > expire_time:
-            del self._cache[key]
-            return None
+    def peek(self, url: str, params: Optional[dict] = None) -> Optional[Any]:
+        """
+        Get a fresh in-memory value without touching hit/miss counters, LRU order or L2
+        (re-checks after waiting for a single-flight slot, so a lookup counts once)
+        Args:
+            url: Request URL
+            params: Request parameters (optional)
+        Returns:
+            Cached value or None if not in memory/expired
+        """
+        key = self._make_key(url, params)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or time.time() > entry[1]:
+                return None
+            return entry[0]
 
-        return value
+    def get_entry(self, url: str, params: Optional[dict] = None) -> Optional[Tuple[Any, bool]]:
+        """
+        Get value from cache, including expired values still within their
+        max-staleness window
+        Args:
+            url: Request URL
+            params: Request parameters (optional)
+        Returns:
+            (value, is_stale) tuple or None if not found/too old
+        """
+        return self._lookup(url, params, allow_stale=True)
 
-    def set(self, url: str, value: Any, ttl: int = 60, params: Optional[dict] = None):
+    def set(
+        self,
+        url: str,
+        value: Any,
+        ttl: int = 60,
+        params: Optional[dict] = None,
+        max_stale: int = 0
+    ):
         """
         Set value in cache with TTL
         Args:
@@ -64,33 +276,228 @@ class CacheManager:
             value: Value to cache
             ttl: Time to live in seconds (default: 60)
             params: Request parameters (optional)
+            max_stale: Seconds after expiry the value may still be served stale (default: 0)
         """
         key = self._make_key(url, params)
         expire_time = time.time() + ttl
-        self._cache[key] = (value, expire_time)
+        stale_until = expire_time + max_stale
+
+        with self._lock:
+            self._insert(key, value, expire_time, stale_until)
+            sweep_due = self._sweep_due()
+
+        # Write through to disk
+        if self.l2 is not None:
+            self._l2_call('set', key, value, expire_time, stale_until)
+
+        if sweep_due:
+            self.clean_expired()
+
+    def _make_parsed_key(self, url: str, content_hash: str, parser_name: str) -> str:
+        """
+        Create cache key for a parser result (URL + content hash + parser name)
+        """
+        return f"{self._make_key(url)}:{parser_name}:{content_hash}"
+
+    def get_parsed(self, url: str, content_hash: str, parser_name: str) -> Optional[Any]:
+        """
+        Get a memoized parser result for a page body
+        Args:
+            url: Page URL
+            content_hash: Hash of the page content that was parsed
+            parser_name: Parser function name (e.g. parse_news_list)
+        Returns:
+            Parsed result or None if not cached/expired
+        """
+        key = self._make_parsed_key(url, content_hash, parser_name)
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now > entry[1]:
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._parsed_misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._parsed_hits += 1
+            return entry[0]
+
+    def set_parsed(
+        self,
+        url: str,
+        content_hash: str,
+        parser_name: str,
+        value: Any,
+        ttl: int = CACHE_TTL_PARSED
+    ):
+        """
+        Memoize a parser result (memory only; the raw page stays cached as before)
+        Args:
+            url: Page URL
+            content_hash: Hash of the page content that was parsed
+            parser_name: Parser function name
+            value: Parsed result
+            ttl: Time to live in seconds (default: CACHE_TTL_PARSED)
+        """
+        key = self._make_parsed_key(url, content_hash, parser_name)
+        expire_time = time.time() + ttl
+
+        with self._lock:
+            self._insert(key, value, expire_time, expire_time)
+
+    def warm_start(self, limit: int = CACHE_WARM_START_ENTRIES) -> int:
+        """
+        Load recently written L2 entries into memory (e.g. after a restart)
+        Args:
+            limit: Maximum number of entries to load
+        Returns:
+            Number of entries loaded
+        """
+        if self.l2 is None:
+            return 0
+
+        entries = self._l2_call('recent', limit) or []
+
+        with self._lock:
+            # Oldest first so the newest end up most recently used
+            for key, value, expire_time, stale_until in reversed(entries):
+                self._insert(key, value, expire_time, stale_until)
+
+        logger.info(f"[Cache] Warm start loaded {len(entries)} entries from disk")
+        return len(entries)
+
+    def single_flight(
+        self,
+        url: str,
+        loader: Callable[[], Any],
+        params: Optional[dict] = None,
+        tag: str = ""
+    ) -> Any:
+        """
+        Run loader once for concurrent callers with the same key
+        The first caller runs loader; others wait and receive its result
+        Args:
+            url: Request URL
+            loader: Function that loads the value (e.g. upstream request)
+            params: Request parameters (optional)
+            tag: Extra key suffix to separate variants of the same URL (optional)
+        Returns:
+            Result of loader
+        """
+        key = self._make_key(url, params) + tag
+
+        with self._lock:
+            call = self._inflight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._inflight[key] = call
+            else:
+                self._coalesced += 1
+
+        # Wait for the in-flight load
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = loader()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.event.set()
 
     def clear(self):
         """
         Clear all cache
         """
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._total_bytes = 0
+
+        if self.l2 is not None:
+            self._l2_call('clear')
 
     def clean_expired(self):
         """
-        Remove all expired entries
+        Remove all entries past their staleness ceiling
         """
         current_time = time.time()
-        expired_keys = [
-            key for key, (_, expire_time) in self._cache.items()
-            if current_time > expire_time
-        ]
+        with self._lock:
+            expired_keys = [
+                key for key, (_, _, stale_until, _) in self._cache.items()
+                if current_time > stale_until
+            ]
+
+            for key in expired_keys:
+                self._remove(key)
+
+            self._expirations += len(expired_keys)
+
+        if self.l2 is not None:
+            self._l2_call('purge_expired')
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        Returns:
+            Dict with entries, bytes, hits, misses, hit_rate, evictions, expirations, coalesced
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._cache),
+                'bytes': self._total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': (self._hits / lookups) if lookups else 0.0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'stale_hits': self._stale_hits,
+                'l2_hits': self._l2_hits,
+                'parsed_hits': self._parsed_hits,
+                'parsed_misses': self._parsed_misses,
+                'l2_enabled': self.l2 is not None,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._inflight)
+            }
+
+
+def create_disk_store(path: str = CACHE_DISK_PATH) -> Optional[Any]:
+    """
+    Create the on-disk L2 store if enabled in config
+    Args:
+        path: SQLite file path (default: CACHE_DISK_PATH)
+    Returns:
+        SQLiteCacheStore or None
+    """
+    if not CACHE_DISK_ENABLED:
+        return None
 
-        for key in expired_keys:
-            del self._cache[key]
+    try:
+        from disk_cache import SQLiteCacheStore
+        return SQLiteCacheStore(path, max_entries=CACHE_DISK_MAX_ENTRIES)
+    except Exception as e:
+        logger.warning(f"[Cache] Disk cache unavailable, using memory only: {str(e)}")
+        return None
 
 
-# Global cache instance
-_cache_instance = CacheManager()
+# Global cache instance (warm-started from disk when the L2 tier is enabled)
+_cache_instance = CacheManager(l2=create_disk_store())
+_cache_instance.warm_start()
 
 
 def get_cache() -> CacheManager:
@@ -16,6 +16,18 @@ CACHE_TTL_PRICE = 60      # 1 minute for price data
 CACHE_TTL_NEWS = 300      # 5 minutes for news
 CACHE_TTL_SEARCH = 120    # 2 minutes for search results
 CACHE_TTL_DEFAULT = 300   # Default cache TTL (5 minutes)
+CACHE_TTL_PARSED = 600    # Memoized parser results (keyed by page content hash)
+
+# Cache capacity settings
+CACHE_MAX_ENTRIES = 512               # Maximum number of cached responses
+CACHE_MAX_BYTES = 64 * 1024 * 1024    # Maximum total size of cached responses (64MB)
+CACHE_SWEEP_INTERVAL = 60             # Minimum seconds between expired entry sweeps
+
+# Stale-while-revalidate: max seconds past TTL a value may be served while refreshing
+CACHE_MAX_STALE_PRICE = 300     # 5 minutes for price data
+CACHE_MAX_STALE_NEWS = 1800     # 30 minutes for news
+CACHE_MAX_STALE_SEARCH = 600    # 10 minutes for search results
+CACHE_REFRESH_WORKERS = 4       # Background refresh threads
 
 # User agent
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -36,8 +48,67 @@ DEFAULT_HEADERS = {
 }
 
 DEFAULT_TIMEOUT = 10      # Request timeout in seconds
-RETRY_DELAY = 1           # Delay between retries in seconds
+RETRY_DELAY = 1           # Base delay for exponential backoff in seconds
 MAX_RETRIES = 2           # Maximum number of retries
+RETRY_MAX_DELAY = 8       # Maximum backoff delay in seconds
+RETRY_TOTAL_BUDGET = 15   # Total time budget per fetch call (all attempts) in seconds
+
+# Circuit breaker: fail fast when a host keeps returning 403/429
+CIRCUIT_BREAKER_THRESHOLD = 5   # Consecutive blocked responses before opening
+CIRCUIT_BREAKER_COOLDOWN = 30   # Seconds to fail fast before trying again
+
+# Outbound rate limits per host, shared by all sessions: (requests per second, burst size)
+RATE_LIMITS = {
+    "finance.daum.net": (5.0, 10),
+    "m.finance.daum.net": (5.0, 10),
+    "api.tavily.com": (2.0, 4),
+}
+RATE_LIMIT_MAX_WAIT = 5   # Maximum seconds a request waits in queue for a token
+
+# Tavily URL discovery fan-out settings
+TAVILY_MAX_WORKERS = 4    # Maximum number of Tavily queries run in parallel
+TAVILY_DEADLINE = 10      # Total time budget for all Tavily queries of one question in seconds
+TAVILY_MAX_CONTEXTS = 64  # Maximum number of live per-request search contexts
+
+# Concurrent fetch settings
+FETCH_MAX_WORKERS = 8     # Maximum number of plans fetched in parallel
+FETCH_DEADLINE = 20       # Per-query deadline for all fetches in seconds
+
+# Progressive evidence pipeline (PIPELINE_MODE=progressive)
+PROGRESSIVE_DEADLINE = 10       # Sources not summarized within this many seconds are dropped
+PROGRESSIVE_GRACE_PERIOD = 1.0  # Extra seconds to wait for stragglers once minimum evidence is ready
+PROGRESSIVE_MIN_SUPPORTING = 1  # News/disclosure/opinion sources required besides price data
+
+# Parallel branch pipeline (PIPELINE_MODE=parallel): per-branch time budget in seconds
+PARALLEL_BRANCH_TIMEOUTS = {
+    "price": 10,        # Realtime quote + price/chart pages
+    "news": 15,
+    "disclosure": 15,
+    "opinion": 15,      # Discussion pages + investor opinion search
+}
+
+# Process-pool HTML parsing (PARSE_PROCESS_POOL=true)
+PARSE_PROCESS_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))  # Worker processes
+PARSE_PROCESS_MIN_SIZE = 32 * 1024  # Pages shorter than this (characters) are parsed in-thread
+PARSE_PROCESS_TIMEOUT = 10          # Seconds a queued page waits for a free worker before parsing in-thread
+PARSE_PROCESS_MAX_WAIT = 30         # Total seconds to wait for a page a worker is parsing (then given up)
+
+# Per-request artifact store (plans/page content referenced from LangGraph state)
+ARTIFACT_MAX_REQUESTS = 64  # Maximum number of live per-request stores (oldest dropped)
+
+# Hedged fallback settings (realtime quote sources)
+HEDGE_DELAY_DEFAULT = 1.0   # Seconds to wait for a source before starting the next fallback
+HEDGE_DELAY_MIN = 0.3       # Lower bound for the auto-tuned hedge delay
+HEDGE_DELAY_MAX = 3.0       # Upper bound for the auto-tuned hedge delay
+HEDGE_MIN_SAMPLES = 5       # Successful samples needed before tuning from latency stats
+REALTIME_DEADLINE = 15      # Total time budget for the realtime quote in seconds
+
+# HTTP connection pool settings
+HTTP_POOL_MAXSIZE = 10    # Default connection pool size per host
+HTTP_POOL_SIZE_PER_HOST = {
+    "finance.daum.net": 20,
+}
+HTTP_KEEPALIVE_EXPIRY = 30  # Idle keep-alive connection lifetime in seconds
 
 # Question type constants
 QUESTION_TYPE_BUY_RECOMMENDATION = "A_매수판단형"
@@ -46,6 +117,17 @@ QUESTION_TYPE_PUBLIC_OPINION = "C_여론요약형"
 QUESTION_TYPE_NEWS_DISCLOSURE = "D_뉴스공시형"
 QUESTION_TYPE_OTHER = "E_기타"
 
+# Tavily response cache TTL per question type (in seconds)
+TAVILY_CACHE_TTL = {
+    QUESTION_TYPE_BUY_RECOMMENDATION: 600,   # 10 minutes
+    QUESTION_TYPE_PRICE_STATUS: 120,         # 2 minutes (prices move quickly)
+    QUESTION_TYPE_PUBLIC_OPINION: 900,       # 15 minutes
+    QUESTION_TYPE_NEWS_DISCLOSURE: 300,      # 5 minutes
+}
+TAVILY_CACHE_TTL_DEFAULT = 600              # Default Tavily cache TTL (10 minutes)
+TAVILY_CACHE_MAX_ENTRIES = 256              # Maximum number of cached Tavily responses
+TAVILY_CACHE_MAX_BYTES = 16 * 1024 * 1024   # Maximum total size of cached Tavily responses (16MB)
+
 # Keywords for each question type
 KEYWORDS_BUY = [
     "매수", "사야", "살까", "투자", "추천", "사는게", "살만", "사볼만", "추천해", 
@@ -89,3 +171,29 @@ def get_env(key: str, default: str = None) -> str:
     
     # Fall back to OS environment variables (for local development)
     return os.getenv(key, default)
+
+
+# Fetch backend: "requests" (default, blocking) or "httpx" (async, pooled, optional HTTP/2)
+FETCH_BACKEND = get_env('FETCH_BACKEND', 'requests')
+HTTP2_ENABLED = get_env('HTTP2_ENABLED', 'false').lower() == 'true'
+
+# HTML parser engine: "bs4" (BeautifulSoup + lxml, default) or "selectolax" (lexbor, faster)
+HTML_PARSER_BACKEND = get_env('HTML_PARSER_BACKEND', 'bs4')
+
+# Memoize HTML parser results in the fetch cache (URL + content hash + parser name)
+PARSE_CACHE_ENABLED = get_env('PARSE_CACHE_ENABLED', 'true').lower() == 'true'
+
+# Parse large pages in worker processes so concurrent sessions use more than one core
+PARSE_PROCESS_POOL = get_env('PARSE_PROCESS_POOL', 'false').lower() == 'true'
+
+# Workflow pipeline: "sequential" (fetch all, then summarize), "progressive"
+# (summarize each source as it arrives and start answering once minimum evidence is ready)
+# or "parallel" (one graph branch per source family, merged by a join node)
+PIPELINE_MODE = get_env('PIPELINE_MODE', 'sequential')
+
+# On-disk L2 cache tier (SQLite) - survives restarts and is shared by local workers
+CACHE_DISK_ENABLED = get_env('CACHE_DISK_ENABLED', 'false').lower() == 'true'
+CACHE_DISK_PATH = get_env('CACHE_DISK_PATH', '.cache/daum_cache.sqlite3')
+CACHE_DISK_MAX_ENTRIES = 5000   # Maximum entries kept on disk
+CACHE_WARM_START_ENTRIES = 200  # Entries loaded into memory at startup
+TAVILY_CACHE_DISK_PATH = get_env('TAVILY_CACHE_DISK_PATH', '.cache/tavily_cache.sqlite3')
@@ -4,8 +4,10 @@ Daum Finance exclusive fetcher with allowlist enforcement
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 from dataclasses import dataclass
@@ -13,32 +15,35 @@ from dataclasses import dataclass
 from config import (
     ALLOWED_DOMAINS,
     DEFAULT_HEADERS,
-    DEFAULT_TIMEOUT,
-    RETRY_DELAY,
-    MAX_RETRIES,
-    CACHE_TTL_DEFAULT
+    CACHE_TTL_DEFAULT,
+    CACHE_REFRESH_WORKERS,
+    FETCH_BACKEND,
+    HTTP_POOL_MAXSIZE,
+    HTTP_POOL_SIZE_PER_HOST,
+    RATE_LIMIT_MAX_WAIT
 )
 from cache_manager import get_cache
+from retry import RetryState
+from rate_limiter import acquire_rate_limit
 
 
-# Global session with retry strategy
+# Global session
 _session = None
 
 def get_session():
-    """Get or create a global requests session with retry strategy"""
+    """Get or create a global requests session (retries are handled by retry.RetryState)"""
     global _session
     if _session is None:
         _session = requests.Session()
         
-        # Retry strategy for specific status codes
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
+        # No adapter-level retries: nesting them inside the fetch loop multiplies attempts
+        # Pool size per host (requests keeps one pool per host)
+        pool_maxsize = max([HTTP_POOL_MAXSIZE, *HTTP_POOL_SIZE_PER_HOST.values()])
+        adapter = HTTPAdapter(
+            pool_connections=len(ALLOWED_DOMAINS),
+            pool_maxsize=pool_maxsize,
+            max_retries=0
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         _session.mount("http://", adapter)
         _session.mount("https://", adapter)
         
@@ -48,6 +53,12 @@ def get_session():
     return _session
 
 
+# Background refresh for stale cache entries
+_refresh_executor = None
+_refresh_lock = threading.Lock()
+_refreshing = set()
+
+
 @dataclass
 class FetchResult:
     """
@@ -59,9 +70,11 @@ class FetchResult:
     json_data: Optional[dict] = None
     error_message: Optional[str] = None
     url: Optional[str] = None
+    stale: bool = False  # Served from cache past its TTL (refresh in progress)
+    from_cache: bool = False  # Served from the fetch cache (no network call)
 
 
-def _is_allowed_domain(url: str) -> bool:
+def is_allowed_domain(url: str) -> bool:
     """
     Check if URL domain is in allowlist
     Args:
@@ -82,13 +95,206 @@ def _is_allowed_domain(url: str) -> bool:
         return False
 
 
+def prepare_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Build request headers from defaults plus additional headers
+    Args:
+        headers: Additional headers (optional)
+    Returns:
+        Request headers with Daum Finance Referer
+    """
+    request_headers = DEFAULT_HEADERS.copy()
+    if headers:
+        request_headers.update(headers)
+
+    # Add Referer for Daum Finance
+    if 'Referer' not in request_headers:
+        request_headers['Referer'] = 'https://finance.daum.net/'
+
+    return request_headers
+
+
+def get_cached_result(
+    url: str,
+    params: Optional[dict] = None,
+    is_json: bool = False,
+    allow_stale: bool = False,
+    peek: bool = False
+) -> Optional[FetchResult]:
+    """
+    Build FetchResult from cache if available (never fetches)
+    Args:
+        url: Request URL
+        params: Request parameters (optional)
+        is_json: Whether the cached value is JSON
+        allow_stale: Whether to return expired values within their max-staleness window
+        peek: Check memory only, without counting a hit/miss (re-checks of a counted lookup)
+    Returns:
+        FetchResult or None if not cached
+    """
+    cache = get_cache()
+    if peek:
+        value = cache.peek(url, params)
+        entry = (value, False) if value is not None else None
+    elif allow_stale:
+        entry = cache.get_entry(url, params)
+    else:
+        value = cache.get(url, params)
+        entry = (value, False) if value is not None else None
+
+    if entry is None:
+        return None
+    cached, is_stale = entry
+
+    if is_json:
+        return FetchResult(
+            success=True,
+            status_code=200,
+            json_data=cached,
+            url=url,
+            stale=is_stale,
+            from_cache=True
+        )
+    else:
+        return FetchResult(
+            success=True,
+            status_code=200,
+            content=cached,
+            url=url,
+            stale=is_stale,
+            from_cache=True
+        )
+
+
+def build_result(
+    url: str,
+    status_code: int,
+    text: str,
+    is_json: bool = False,
+    use_cache: bool = True,
+    cache_ttl: int = CACHE_TTL_DEFAULT,
+    params: Optional[dict] = None,
+    max_stale: int = 0
+) -> FetchResult:
+    """
+    Convert an HTTP response into FetchResult (caches successful responses)
+    Shared by all fetch backends so they return the same contract
+    Args:
+        url: Request URL
+        status_code: HTTP status code
+        text: Response body
+        is_json: Whether to parse response as JSON
+        use_cache: Whether to cache successful responses
+        cache_ttl: Cache TTL in seconds
+        params: Request parameters (optional)
+        max_stale: Seconds the cached value may be served stale after TTL
+    Returns:
+        FetchResult object
+    """
+    # Success
+    if status_code == 200:
+        if is_json:
+            try:
+                json_data = json.loads(text)
+            except Exception as e:
+                return FetchResult(
+                    success=False,
+                    status_code=200,
+                    error_message=f"JSON 파싱 실패: {str(e)}",
+                    url=url
+                )
+
+            # Cache the result
+            if use_cache:
+                get_cache().set(url, json_data, cache_ttl, params, max_stale=max_stale)
+
+            return FetchResult(
+                success=True,
+                status_code=200,
+                json_data=json_data,
+                url=url
+            )
+        else:
+            # Cache the result
+            if use_cache:
+                get_cache().set(url, text, cache_ttl, params, max_stale=max_stale)
+
+            return FetchResult(
+                success=True,
+                status_code=200,
+                content=text,
+                url=url
+            )
+
+    # Access denied (after retries)
+    elif status_code in [403, 429]:
+        return FetchResult(
+            success=False,
+            status_code=status_code,
+            error_message=f"접근 거부 (HTTP {status_code})",
+            url=url
+        )
+
+    # Other HTTP errors
+    else:
+        return FetchResult(
+            success=False,
+            status_code=status_code,
+            error_message=f"HTTP 오류: {status_code}",
+            url=url
+        )
+
+
+def _refresh_in_background(
+    url: str,
+    headers: Optional[Dict[str, str]],
+    cache_ttl: int,
+    params: Optional[dict],
+    is_json: bool,
+    max_stale: int
+):
+    """
+    Refresh a stale cache entry without blocking the caller
+    At most one refresh per key is queued at a time
+    """
+    global _refresh_executor
+
+    refresh_key = (url, json.dumps(params, sort_keys=True), is_json)
+    with _refresh_lock:
+        if refresh_key in _refreshing:
+            return
+        _refreshing.add(refresh_key)
+
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=CACHE_REFRESH_WORKERS,
+                thread_name_prefix="cache-refresh"
+            )
+
+    def _refresh():
+        try:
+            # Joins a foreground fetch of the same key if one is in flight
+            get_cache().single_flight(
+                url,
+                lambda: _fetch_uncached(url, headers, True, cache_ttl, params, is_json, max_stale),
+                params=params,
+                tag=":json" if is_json else ""
+            )
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(refresh_key)
+
+    _refresh_executor.submit(_refresh)
+
+
 def fetch(
     url: str,
     headers: Optional[Dict[str, str]] = None,
     use_cache: bool = True,
     cache_ttl: int = CACHE_TTL_DEFAULT,
     params: Optional[dict] = None,
-    is_json: bool = False
+    is_json: bool = False,
+    max_stale: int = 0
 ) -> FetchResult:
     """
     Fetch content from Daum Finance with allowlist enforcement
@@ -100,146 +306,141 @@ def fetch(
         cache_ttl: Cache TTL in seconds (default: CACHE_TTL_DEFAULT)
         params: URL parameters (optional)
         is_json: Whether to parse response as JSON (default: False)
+        max_stale: Seconds past TTL a cached value may be served (flagged stale)
+            while it is refreshed in the background (default: 0, disabled)
 
     Returns:
         FetchResult object
     """
 
     # CRITICAL: Allowlist check - block immediately if not allowed
-    if not _is_allowed_domain(url):
+    if not is_allowed_domain(url):
         return FetchResult(
             success=False,
             error_message=f"도메인 허용 목록에 없음: {url}",
             url=url
         )
 
-    # Check cache first
-    cache = get_cache()
-    if use_cache:
-        cached = cache.get(url, params)
+    if not use_cache:
+        return _fetch_uncached(url, headers, use_cache, cache_ttl, params, is_json)
+
+    # Check cache first (stale-while-revalidate when max_stale is set)
+    cached = get_cached_result(url, params, is_json, allow_stale=max_stale > 0)
+    if cached is not None:
+        if cached.stale:
+            _refresh_in_background(url, headers, cache_ttl, params, is_json, max_stale)
+        return cached
+
+    # Coalesce concurrent misses: only one upstream request per key is in flight
+    def _load() -> FetchResult:
+        # Another caller may have filled the cache while we were waiting
+        # (peek: this fetch's lookup was already counted as a miss)
+        cached = get_cached_result(url, params, is_json, peek=True)
         if cached is not None:
-            if is_json:
-                return FetchResult(
-                    success=True,
-                    status_code=200,
-                    json_data=cached,
-                    url=url
-                )
-            else:
-                return FetchResult(
-                    success=True,
-                    status_code=200,
-                    content=cached,
-                    url=url
-                )
+            return cached
+        return _fetch_uncached(url, headers, use_cache, cache_ttl, params, is_json, max_stale)
+
+    return get_cache().single_flight(
+        url,
+        _load,
+        params=params,
+        tag=":json" if is_json else ""
+    )
+
+
+def _fetch_uncached(
+    url: str,
+    headers: Optional[Dict[str, str]],
+    use_cache: bool,
+    cache_ttl: int,
+    params: Optional[dict],
+    is_json: bool,
+    max_stale: int = 0
+) -> FetchResult:
+    """
+    Fetch from upstream (cache lookup is done by the caller)
+    Successful responses are stored in cache when use_cache is True
+    """
+    # Alternative async backend (httpx) through its sync shim
+    if FETCH_BACKEND == "httpx":
+        from async_fetch import fetch_sync
+        return fetch_sync(
+            url,
+            headers=headers,
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+            params=params,
+            is_json=is_json,
+            max_stale=max_stale,
+            check_cache=False  # Callers of _fetch_uncached already looked up the cache
+        )
 
     # Prepare headers
     session = get_session()
-    request_headers = DEFAULT_HEADERS.copy()
-    if headers:
-        request_headers.update(headers)
+    request_headers = prepare_headers(headers)
 
-    # Add Referer for Daum Finance
-    if 'Referer' not in request_headers:
-        request_headers['Referer'] = 'https://finance.daum.net/'
+    # Unified retry engine (backoff + jitter, Retry-After, time budget, circuit breaker)
+    retry = RetryState(url)
+    while True:
+        if not retry.allow():
+            return FetchResult(
+                success=False,
+                error_message=retry.circuit_open_message(),
+                url=url
+            )
+
+        # Queue for a token from the shared per-host rate limiter (bounded wait)
+        if not acquire_rate_limit(retry.host, max_wait=min(RATE_LIMIT_MAX_WAIT, retry.remaining())):
+            return FetchResult(
+                success=False,
+                error_message=f"요청 한도 초과: {retry.host} (대기 시간 초과)",
+                url=url
+            )
 
-    # Retry logic with session
-    last_error = None
-    for attempt in range(MAX_RETRIES + 1):
         try:
             response = session.get(
                 url,
                 headers=request_headers,
                 params=params,
-                timeout=DEFAULT_TIMEOUT,
+                timeout=retry.timeout(),
                 allow_redirects=True
             )
 
-            # Success
-            if response.status_code == 200:
-                if is_json:
-                    try:
-                        json_data = response.json()
-                        # Cache the result
-                        if use_cache:
-                            cache.set(url, json_data, cache_ttl, params)
-
-                        return FetchResult(
-                            success=True,
-                            status_code=200,
-                            json_data=json_data,
-                            url=url
-                        )
-                    except Exception as e:
-                        return FetchResult(
-                            success=False,
-                            status_code=200,
-                            error_message=f"JSON 파싱 실패: {str(e)}",
-                            url=url
-                        )
-                else:
-                    content = response.text
-                    # Cache the result
-                    if use_cache:
-                        cache.set(url, content, cache_ttl, params)
-
-                    return FetchResult(
-                        success=True,
-                        status_code=200,
-                        content=content,
-                        url=url
-                    )
-
-            # Handle 403/429 with retry
-            elif response.status_code in [403, 429]:
-                last_error = f"HTTP {response.status_code}"
-                if attempt < MAX_RETRIES:
-                    time.sleep(RETRY_DELAY)
-                    continue
-                else:
-                    return FetchResult(
-                        success=False,
-                        status_code=response.status_code,
-                        error_message=f"접근 거부 (HTTP {response.status_code})",
-                        url=url
-                    )
-
-            # Other HTTP errors
-            else:
-                return FetchResult(
-                    success=False,
-                    status_code=response.status_code,
-                    error_message=f"HTTP 오류: {response.status_code}",
-                    url=url
-                )
-
         except requests.Timeout:
-            last_error = "Timeout"
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY)
-                continue
-            else:
+            delay = retry.on_error()
+            if delay is None:
                 return FetchResult(
                     success=False,
-                    error_message=f"요청 시간 초과 ({DEFAULT_TIMEOUT}초)",
+                    error_message=f"요청 시간 초과 ({retry.elapsed():.0f}초, {retry.attempts}회 시도)",
                     url=url
                 )
+            time.sleep(delay)
+            continue
 
         except Exception as e:
-            last_error = str(e)
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY)
-                continue
-            else:
+            delay = retry.on_error()
+            if delay is None:
                 return FetchResult(
                     success=False,
                     error_message=f"요청 실패: {str(e)}",
                     url=url
                 )
+            time.sleep(delay)
+            continue
 
-    # Should not reach here, but just in case
-    return FetchResult(
-        success=False,
-        error_message=f"알 수 없는 오류: {last_error}",
-        url=url
-    )
+        # Retry 403/429/5xx while attempts and budget remain
+        delay = retry.on_status(response.status_code, response.headers.get('Retry-After'))
+        if delay is not None:
+            time.sleep(delay)
+            continue
+
+        return build_result(
+            url,
+            response.status_code,
+            response.text,
+            is_json=is_json,
+            use_cache=use_cache,
+            cache_ttl=cache_ttl,
+            params=params,
+            max_stale=max_stale
+        )
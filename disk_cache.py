@@ -0,0 +1,153 @@
+"""
+On-disk cache store (SQLite) used as the L2 tier behind CacheManager
+Values are JSON-serialized and zlib-compressed, with TTL metadata per entry
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCacheStore:
+    """
+    Persistent key/value store with expiry metadata
+    Shared safely between threads and between processes on the same host (WAL mode)
+    """
+
+    def __init__(self, path: str, max_entries: int = 5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expire_time REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_updated ON cache(updated_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize and compress a value"""
+        return zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        """Decompress and deserialize a value"""
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def get(self, key: str) -> Optional[Tuple[Any, float, float]]:
+        """
+        Get entry if still within its staleness ceiling
+        Args:
+            key: Cache key
+        Returns:
+            (value, expire_time, stale_until) or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expire_time, stale_until FROM cache WHERE key = ? AND stale_until >= ?",
+                (key, time.time())
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            return self._decode(row[0]), row[1], row[2]
+        except Exception as e:
+            logger.warning(f"[DiskCache] Corrupted entry dropped: {str(e)}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, expire_time: float, stale_until: float):
+        """
+        Store entry (values that are not JSON-serializable are skipped)
+        Args:
+            key: Cache key
+            value: Value to store
+            expire_time: Expiry timestamp
+            stale_until: Staleness ceiling timestamp
+        """
+        try:
+            blob = self._encode(value)
+        except (TypeError, ValueError):
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expire_time, stale_until, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, blob, expire_time, stale_until, time.time())
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        """Delete entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        """Delete all entries"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def purge_expired(self):
+        """
+        Remove entries past their staleness ceiling and trim to max_entries
+        (least recently written first)
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE stale_until < ?", (time.time(),))
+            self._conn.execute(
+                "DELETE FROM cache WHERE key NOT IN "
+                "(SELECT key FROM cache ORDER BY updated_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def recent(self, limit: int) -> List[Tuple[str, Any, float, float]]:
+        """
+        Most recently written entries that are still usable (for warm start)
+        Args:
+            limit: Maximum number of entries
+        Returns:
+            List of (key, value, expire_time, stale_until), newest first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value, expire_time, stale_until FROM cache "
+                "WHERE stale_until >= ? ORDER BY updated_at DESC LIMIT ?",
+                (time.time(), limit)
+            ).fetchall()
+
+        entries = []
+        for key, blob, expire_time, stale_until in rows:
+            try:
+                entries.append((key, self._decode(blob), expire_time, stale_until))
+            except Exception:
+                continue
+        return entries
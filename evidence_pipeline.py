@@ -0,0 +1,249 @@
+"""
+Progressive evidence pipeline
+Fetches and summarizes each source as soon as it completes, together with the
+realtime quote and the investor opinion search, and stops collecting once a
+minimum evidence set is ready (or the deadline passes) so answering can start
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import (
+    FETCH_MAX_WORKERS,
+    PROGRESSIVE_DEADLINE,
+    PROGRESSIVE_GRACE_PERIOD,
+    PROGRESSIVE_MIN_SUPPORTING,
+    QUESTION_TYPE_PRICE_STATUS
+)
+from fetch_executor import TimedFetchResult, timed_fetch
+from daum_fetch import FetchResult
+from summarizer import (
+    SourceSummary,
+    summarize_fetch_result,
+    get_realtime_source_urls,
+    get_realtime_stock_summary,
+    get_talks_summary_from_daum
+)
+from tavily_search import SearchContext
+
+logger = logging.getLogger(__name__)
+
+# Source types that count as supporting evidence (besides price data)
+SUPPORTING_SOURCE_TYPES = ("뉴스", "공시", "토론/의견", "투자자 의견 및 분석")
+
+
+@dataclass
+class ProgressiveResult:
+    """
+    Evidence collected by the progressive pipeline
+    """
+    summaries: List[SourceSummary]  # Same order as summarize_results (realtime, opinions, plans)
+    fetch_results: List[Optional[TimedFetchResult]]  # Per plan; None if dropped or not fetched
+    dropped: List[str] = field(default_factory=list)  # Sources still running when collection stopped
+    elapsed: float = 0.0
+
+
+def _is_price_summary(summary: SourceSummary) -> bool:
+    """Check if a summary carries price data"""
+    return (summary.source_type or "").startswith("시세") or "실시간" in (summary.source_type or "")
+
+
+def is_evidence_ready(summaries: List[SourceSummary], question_type: Optional[str]) -> bool:
+    """
+    Check if the minimum evidence set for answering is available
+    Price data, plus PROGRESSIVE_MIN_SUPPORTING news/disclosure/opinion sources
+    (price questions only need price data)
+
+    Args:
+        summaries: Summaries collected so far
+        question_type: Question type
+
+    Returns:
+        True if answering can start
+    """
+    if not any(_is_price_summary(s) for s in summaries):
+        return False
+
+    if question_type == QUESTION_TYPE_PRICE_STATUS:
+        return True
+
+    supporting = sum(1 for s in summaries if s.source_type in SUPPORTING_SOURCE_TYPES)
+    return supporting >= PROGRESSIVE_MIN_SUPPORTING
+
+
+def fetch_and_summarize(plan) -> Tuple[Optional[TimedFetchResult], Optional[SourceSummary]]:
+    """
+    Fetch one plan and summarize it in the worker thread
+    Tavily news plans are summarized from their pre-fetched content without fetching
+    """
+    if plan.parser_name == "tavily_news":
+        return None, summarize_fetch_result(None, plan)
+
+    result, latency = timed_fetch(plan.url, plan.is_json)
+    return TimedFetchResult(result=result, latency=latency), summarize_fetch_result(result, plan)
+
+
+def realtime_summary_reusing_fetches(
+    stock_code: str,
+    plan_futures: Dict[Future, Any],
+    timeout: float
+) -> Optional[SourceSummary]:
+    """
+    Realtime quote summary reusing this request's own fetches of the quote URLs
+    Waits (bounded) for plans that fetch a realtime source and passes their results
+    as prefetched, like summarize_results does, so those URLs are not requested twice
+
+    Args:
+        stock_code: Stock code
+        plan_futures: {future of fetch_and_summarize: FetchPlan} for this request's plans
+        timeout: Maximum seconds to wait for those plans
+
+    Returns:
+        SourceSummary or None
+    """
+    quote_urls = set(get_realtime_source_urls(stock_code))
+    quote_futures = [future for future, plan in plan_futures.items() if plan.url in quote_urls]
+
+    prefetched: Dict[str, FetchResult] = {}
+    if quote_futures:
+        done, _ = wait(quote_futures, timeout=max(0.0, timeout))
+        for future in done:
+            try:
+                timed, _ = future.result()
+            except Exception:
+                continue
+            if timed is not None and timed.result.success:
+                prefetched[timed.result.url or plan_futures[future].url] = timed.result
+
+    return get_realtime_stock_summary(stock_code, prefetched=prefetched)
+
+
+def collect_evidence(
+    plans: List,
+    stock_code: Optional[str] = None,
+    stock_name: Optional[str] = None,
+    question_type: Optional[str] = None,
+    search_context: Optional[SearchContext] = None,
+    include_realtime: bool = True,
+    deadline: float = PROGRESSIVE_DEADLINE,
+    grace_period: float = PROGRESSIVE_GRACE_PERIOD,
+    on_summary: Optional[Callable[[SourceSummary], Any]] = None
+) -> ProgressiveResult:
+    """
+    Fetch and summarize all sources concurrently, stopping early once enough evidence is ready
+
+    Collection stops when every source finished, when grace_period seconds have
+    passed since the minimum evidence set became ready, or at the deadline.
+    Sources still running at that point are dropped (their fetches finish in the
+    background and still populate the cache).
+
+    Args:
+        plans: List of FetchPlan objects
+        stock_code: Stock code (realtime quote / opinion search)
+        stock_name: Stock name (opinion search)
+        question_type: Question type (decides the minimum evidence set)
+        search_context: Per-request SearchContext (optional)
+        include_realtime: Whether to add realtime quote and opinions (default: True)
+        deadline: Seconds after which late sources are dropped (default: PROGRESSIVE_DEADLINE)
+        grace_period: Seconds to wait for stragglers once evidence is ready (default: PROGRESSIVE_GRACE_PERIOD)
+        on_summary: Callback invoked with each summary as it becomes available (optional)
+
+    Returns:
+        ProgressiveResult
+    """
+    start = time.perf_counter()
+
+    # Task name -> (sort rank, func); ranks keep summarize_results ordering
+    # Plans are submitted first so the realtime quote can reuse their quote fetches
+    tasks: Dict[str, Tuple[int, Callable[[], Any]]] = {}
+    plan_futures: Dict[Future, Any] = {}
+    for index, plan in enumerate(plans):
+        tasks[plan.plan_id] = (2 + index, lambda plan=plan: fetch_and_summarize(plan))
+    if include_realtime and stock_code:
+        tasks["realtime"] = (0, lambda: (None, realtime_summary_reusing_fetches(
+            stock_code, plan_futures, start + deadline - time.perf_counter()
+        )))
+        tasks["opinions"] = (1, lambda: (None, get_talks_summary_from_daum(
+            stock_code, stock_name, search_context=search_context
+        )))
+
+    fetch_results: List[Optional[TimedFetchResult]] = [None] * len(plans)
+    plan_index = {plan.plan_id: index for index, plan in enumerate(plans)}
+    collected: List[Tuple[int, SourceSummary]] = []
+    ready_at = None
+
+    # Realtime/opinions run on their own executor so they never queue behind plans
+    plan_executor = ThreadPoolExecutor(
+        max_workers=max(1, min(FETCH_MAX_WORKERS, len(plans))),
+        thread_name_prefix="evidence"
+    )
+    source_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="evidence-source")
+    try:
+        pending = {}
+        for name, (_, func) in tasks.items():
+            if name in plan_index:
+                future = plan_executor.submit(func)
+                plan_futures[future] = plans[plan_index[name]]
+            else:
+                future = source_executor.submit(func)
+            pending[future] = name
+
+        while pending:
+            now = time.perf_counter()
+            stop_at = start + deadline
+            if ready_at is not None:
+                stop_at = min(stop_at, ready_at + grace_period)
+            if now >= stop_at:
+                break
+
+            done, _ = wait(list(pending), timeout=stop_at - now, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    timed, summary = future.result()
+                except Exception as e:
+                    logger.warning(f"[Evidence] {name} failed: {str(e)}")
+                    if name in plan_index:
+                        # Record the failure so the plan is not reported as a successful fetch
+                        plan = plans[plan_index[name]]
+                        fetch_results[plan_index[name]] = TimedFetchResult(
+                            result=FetchResult(success=False, error_message=f"수집 실패: {str(e)}", url=plan.url),
+                            latency=time.perf_counter() - start
+                        )
+                    continue
+
+                if name in plan_index:
+                    fetch_results[plan_index[name]] = timed
+
+                if summary is not None:
+                    collected.append((tasks[name][0], summary))
+                    logger.info(
+                        f"[Evidence] {name} ready after {time.perf_counter() - start:.2f}s "
+                        f"({summary.source_type})"
+                    )
+                    if on_summary is not None:
+                        on_summary(summary)
+
+            if ready_at is None and is_evidence_ready([s for _, s in collected], question_type):
+                ready_at = time.perf_counter()
+                logger.info(f"[Evidence] Minimum evidence ready after {ready_at - start:.2f}s")
+
+        dropped = sorted(pending.values(), key=lambda name: tasks[name][0])
+        if dropped:
+            logger.info(f"[Evidence] Dropping late sources: {', '.join(dropped)}")
+
+        collected.sort(key=lambda item: item[0])
+        return ProgressiveResult(
+            summaries=[summary for _, summary in collected],
+            fetch_results=fetch_results,
+            dropped=dropped,
+            elapsed=time.perf_counter() - start
+        )
+
+    finally:
+        # Don't block on late sources
+        plan_executor.shutdown(wait=False, cancel_futures=True)
+        source_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,156 @@
+"""
+Bounded-concurrency fetch executor
+Runs several daum_fetch.fetch calls in parallel with a per-query deadline
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from config import (
+    CACHE_TTL_PRICE,
+    CACHE_TTL_NEWS,
+    CACHE_TTL_SEARCH,
+    CACHE_MAX_STALE_PRICE,
+    CACHE_MAX_STALE_NEWS,
+    CACHE_MAX_STALE_SEARCH,
+    FETCH_MAX_WORKERS,
+    FETCH_DEADLINE
+)
+from daum_fetch import fetch, FetchResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TimedFetchResult:
+    """
+    Fetch result with latency information
+    """
+    result: FetchResult
+    latency: float  # Seconds spent on this fetch
+    timed_out: bool = False
+
+
+def get_cache_ttl_for_url(url: str) -> int:
+    """
+    Determine cache TTL based on data type in URL
+    Args:
+        url: URL to fetch
+    Returns:
+        Cache TTL in seconds
+    """
+    url_lower = url.lower()
+    if 'news' in url_lower or 'disclosure' in url_lower:
+        return CACHE_TTL_NEWS
+    elif 'price' in url_lower or 'quote' in url_lower:
+        return CACHE_TTL_PRICE
+    else:
+        return CACHE_TTL_SEARCH
+
+
+def get_max_stale_for_url(url: str) -> int:
+    """
+    Determine max staleness (stale-while-revalidate window) based on data type in URL
+    Args:
+        url: URL to fetch
+    Returns:
+        Max staleness in seconds
+    """
+    url_lower = url.lower()
+    if 'news' in url_lower or 'disclosure' in url_lower:
+        return CACHE_MAX_STALE_NEWS
+    elif 'price' in url_lower or 'quote' in url_lower:
+        return CACHE_MAX_STALE_PRICE
+    else:
+        return CACHE_MAX_STALE_SEARCH
+
+
+def timed_fetch(url: str, is_json: bool) -> Tuple[FetchResult, float]:
+    """
+    Fetch a single URL and measure latency
+    """
+    start = time.perf_counter()
+    result = fetch(
+        url=url,
+        use_cache=True,
+        cache_ttl=get_cache_ttl_for_url(url),
+        is_json=is_json,
+        max_stale=get_max_stale_for_url(url)
+    )
+    return result, time.perf_counter() - start
+
+
+def fetch_all(
+    targets: List[Tuple[str, bool]],
+    max_workers: int = FETCH_MAX_WORKERS,
+    deadline: Optional[float] = FETCH_DEADLINE
+) -> List[TimedFetchResult]:
+    """
+    Fetch all URLs in parallel with bounded concurrency
+
+    Args:
+        targets: List of (url, is_json) tuples
+        max_workers: Maximum number of concurrent fetches (default: FETCH_MAX_WORKERS)
+        deadline: Total time budget in seconds for all fetches (default: FETCH_DEADLINE)
+
+    Returns:
+        List of TimedFetchResult objects in the same order as targets
+    """
+    if not targets:
+        return []
+
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(targets))),
+        thread_name_prefix="fetch"
+    )
+
+    try:
+        futures = [
+            executor.submit(timed_fetch, url, is_json)
+            for url, is_json in targets
+        ]
+        wait(futures, timeout=deadline)
+
+        results = []
+        for (url, _), future in zip(targets, futures):
+            if future.done() and not future.cancelled():
+                try:
+                    result, latency = future.result()
+                    results.append(TimedFetchResult(result=result, latency=latency))
+                    continue
+                except Exception as e:
+                    result = FetchResult(
+                        success=False,
+                        error_message=f"요청 실패: {str(e)}",
+                        url=url
+                    )
+                    results.append(TimedFetchResult(
+                        result=result,
+                        latency=time.perf_counter() - start
+                    ))
+                    continue
+
+            # Not finished within the deadline
+            results.append(TimedFetchResult(
+                result=FetchResult(
+                    success=False,
+                    error_message=f"요청 시간 초과 (전체 제한 {deadline}초)",
+                    url=url
+                ),
+                latency=time.perf_counter() - start,
+                timed_out=True
+            ))
+
+        logger.info(
+            f"[FetchExecutor] {len(targets)} fetches finished in "
+            f"{time.perf_counter() - start:.2f}s (workers={max_workers})"
+        )
+        return results
+
+    finally:
+        # Don't block on stragglers past the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,7 +1,7 @@
 """
 LangGraph workflow for Daum Finance Chatbot
 """
-from .workflow import create_workflow
+from .workflow import create_workflow, get_workflow
 from .state import create_initial_state
 
-__all__ = ['create_workflow', 'create_initial_state']
+__all__ = ['create_workflow', 'get_workflow', 'create_initial_state']
@@ -0,0 +1,143 @@
+"""
+Per-request artifact store for the LangGraph workflow
+Large payloads (FetchPlan objects with pre-fetched Tavily content, FetchResult
+objects with page HTML) stay here; graph state only carries small references,
+so streaming/checkpointing does not copy them at every step
+"""
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from config import ARTIFACT_MAX_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ArtifactEntry:
+    """
+    One stored artifact
+    """
+    value: Any
+    size: int  # Approximate payload size in bytes (content strings only)
+
+
+def _payload_size(value: Any) -> int:
+    """Approximate size of an artifact's content strings"""
+    size = 0
+    for attr in ('content', 'title'):
+        text = getattr(value, attr, None)
+        if isinstance(text, str):
+            size += len(text.encode('utf-8'))
+    return size
+
+
+def plan_ref(plan_id: str) -> str:
+    """Reference for a FetchPlan"""
+    return f"plan:{plan_id}"
+
+
+def result_ref(plan_id: str) -> str:
+    """Reference for the FetchResult of a plan"""
+    return f"result:{plan_id}"
+
+
+class ArtifactStore:
+    """
+    Artifacts of one request, keyed by reference string
+    """
+
+    __slots__ = ('request_id', '_entries', '_lock')
+
+    def __init__(self, request_id: str):
+        self.request_id = request_id
+        self._entries: Dict[str, ArtifactEntry] = {}
+        self._lock = threading.Lock()
+
+    def put(self, ref: str, value: Any) -> str:
+        """
+        Store an artifact
+        Args:
+            ref: Reference string (see plan_ref / result_ref)
+            value: Artifact
+        Returns:
+            ref
+        """
+        with self._lock:
+            self._entries[ref] = ArtifactEntry(value, _payload_size(value))
+        return ref
+
+    def get(self, ref: Optional[str]) -> Any:
+        """
+        Get an artifact (None if unknown)
+        """
+        if not ref:
+            return None
+        with self._lock:
+            entry = self._entries.get(ref)
+        return entry.value if entry is not None else None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get store metrics
+        Returns:
+            Dict with entries and bytes
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': sum(entry.size for entry in self._entries.values())
+            }
+
+
+# Live stores by request id (oldest dropped beyond ARTIFACT_MAX_REQUESTS, e.g.
+# requests that ended before answer_node released them)
+_stores: "OrderedDict[str, ArtifactStore]" = OrderedDict()
+_stores_lock = threading.Lock()
+
+
+def create_artifact_store(request_id: str) -> ArtifactStore:
+    """
+    Create and register the artifact store for a request
+    Args:
+        request_id: Request id (ChatbotState['request_id']; unregistered if empty)
+    Returns:
+        ArtifactStore instance
+    """
+    store = ArtifactStore(request_id)
+    if not request_id:
+        return store
+
+    with _stores_lock:
+        _stores[request_id] = store
+        while len(_stores) > ARTIFACT_MAX_REQUESTS:
+            _stores.popitem(last=False)
+    return store
+
+
+def get_artifact_store(request_id: Optional[str]) -> Optional[ArtifactStore]:
+    """
+    Get the artifact store registered for a request (None if unknown)
+    """
+    if not request_id:
+        return None
+    with _stores_lock:
+        return _stores.get(request_id)
+
+
+def release_artifact_store(request_id: Optional[str]):
+    """
+    Unregister the artifact store for a request
+    """
+    if not request_id:
+        return
+    with _stores_lock:
+        store = _stores.pop(request_id, None)
+
+    if store is not None:
+        stats = store.stats()
+        logger.info(
+            f"[Artifacts] Request {request_id}: released {stats['entries']} artifacts ({stats['bytes']} bytes)"
+        )
@@ -3,14 +3,27 @@ LangGraph Node definitions for Daum Finance Chatbot
 Each node performs a specific task and updates the state
 """
 import logging
-from typing import Dict, Any
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Callable, Optional
 from .state import ChatbotState
+from .artifacts import (
+    ArtifactStore,
+    create_artifact_store,
+    get_artifact_store,
+    release_artifact_store,
+    plan_ref,
+    result_ref
+)
 from intent import analyze_intent, IntentResult
 from planner import create_plan
-from daum_fetch import fetch
+from tavily_search import create_search_context, get_search_context, release_search_context
+from fetch_executor import fetch_all, TimedFetchResult
+from daum_fetch import FetchResult, get_cached_result
 from summarizer import summarize_results
-from answer import generate_answer
-from config import CACHE_TTL_PRICE, CACHE_TTL_NEWS, CACHE_TTL_SEARCH
+from evidence_pipeline import collect_evidence, fetch_and_summarize, realtime_summary_reusing_fetches
+from answer import generate_answer, generate_answer_stream
+from config import PARALLEL_BRANCH_TIMEOUTS
 
 logger = logging.getLogger(__name__)
 
@@ -70,22 +83,20 @@ def plan_node(state: ChatbotState) -> Dict[str, Any]:
             question_type=state['question_type']
         )
         
+        # Per-request search context: dedupes/batches Tavily calls across plan and summarize
+        search_context = create_search_context(
+            state.get('request_id'),
+            stock_name=intent.stock_name,
+            stock_code=intent.stock_code,
+            question_type=intent.question_type
+        )
+        
         # Create plans using existing logic
-        plans = create_plan(intent, use_tavily=True)
+        plans = create_plan(intent, use_tavily=True, search_context=search_context)
         
-        # Convert plans to dict format for state
-        fetch_plans = [
-            {
-                'plan_id': plan.plan_id,
-                'description': plan.description,
-                'url': plan.url,
-                'parser_name': plan.parser_name,
-                'is_json': plan.is_json,
-                'title': plan.title,
-                'content': plan.content if hasattr(plan, 'content') else None
-            }
-            for plan in plans
-        ]
+        # Plans (with Tavily content) go to the artifact store; state keeps compact refs
+        store = create_artifact_store(state.get('request_id'))
+        fetch_plans = [_plan_state(plan, store) for plan in plans]
         
         return {
             'plans_created': True,
@@ -100,11 +111,56 @@ def plan_node(state: ChatbotState) -> Dict[str, Any]:
         }
 
 
+def _plan_state(plan, store: ArtifactStore) -> Dict[str, Any]:
+    """
+    Store a FetchPlan and get its compact state format (no pre-fetched content)
+    """
+    store.put(plan_ref(plan.plan_id), plan)
+    return {
+        'plan_id': plan.plan_id,
+        'description': plan.description,
+        'url': plan.url,
+        'parser_name': plan.parser_name,
+        'is_json': plan.is_json,
+        'title': plan.title
+    }
+
+
+def _get_store(state: ChatbotState) -> ArtifactStore:
+    """Get the request's artifact store (a new empty one if it was already dropped)"""
+    request_id = state.get('request_id')
+    return get_artifact_store(request_id) or create_artifact_store(request_id)
+
+
+def _load_plans(state: ChatbotState) -> List[Any]:
+    """
+    Get the FetchPlan objects for state['fetch_plans'] from the artifact store
+    Plans missing from the store are rebuilt from state (without pre-fetched content)
+    """
+    from planner import FetchPlan
+    
+    store = get_artifact_store(state.get('request_id'))
+    plans = []
+    for p in state['fetch_plans']:
+        plan = store.get(plan_ref(p['plan_id'])) if store is not None else None
+        if plan is None:
+            plan = FetchPlan(
+                plan_id=p['plan_id'],
+                description=p['description'],
+                url=p['url'],
+                parser_name=p['parser_name'],
+                is_json=p.get('is_json', False),
+                title=p.get('title')
+            )
+        plans.append(plan)
+    return plans
+
+
 def fetch_node(state: ChatbotState) -> Dict[str, Any]:
     """
     Node 3: Fetch data from sources
     
-    Executes all fetch plans and collects data
+    Executes all fetch plans in parallel and collects data
     
     Returns:
         State updates
@@ -115,33 +171,25 @@ def fetch_node(state: ChatbotState) -> Dict[str, Any]:
         raw_data = []
         successful = 0
         failed = 0
+        store = _get_store(state)
         
-        for plan in state['fetch_plans']:
-            # Determine cache TTL
-            url = plan['url']
-            if 'news' in url.lower() or 'disclosure' in url.lower():
-                cache_ttl = CACHE_TTL_NEWS
-            elif 'price' in url.lower() or 'quote' in url.lower():
-                cache_ttl = CACHE_TTL_PRICE
-            else:
-                cache_ttl = CACHE_TTL_SEARCH
-            
-            # Fetch data
-            result = fetch(
-                url=url,
-                use_cache=True,
-                cache_ttl=cache_ttl,
-                is_json=plan['is_json']
+        # Fetch all plans in parallel (results keep plan order)
+        timed_results = fetch_all([
+            (plan['url'], plan['is_json'])
+            for plan in state['fetch_plans']
+        ])
+        
+        for plan, timed in zip(state['fetch_plans'], timed_results):
+            result = timed.result
+            logger.info(
+                f"[FetchNode] {plan['plan_id']} {'OK' if result.success else 'FAIL'} "
+                f"in {timed.latency * 1000:.0f}ms: {plan['url']}"
             )
             
-            # Store result
+            # Store result (page content stays in the artifact store)
             raw_data.append({
                 'plan': plan,
-                'result': {
-                    'success': result.success,
-                    'content': result.content if result.success else None,
-                    'error': result.error_message
-                }
+                'result': _fetch_result_dict(timed, plan['plan_id'], store)
             })
             
             if result.success:
@@ -164,6 +212,57 @@ def fetch_node(state: ChatbotState) -> Dict[str, Any]:
         }
 
 
+def _summary_to_dict(summary) -> Dict[str, Any]:
+    """Convert a SourceSummary to state format"""
+    return {
+        'source_type': summary.source_type,
+        'source_url': summary.source_url,
+        'key_data': summary.key_data,
+        'evidence_snippet': summary.evidence_snippet
+    }
+
+
+def _summaries_state_update(summaries: List[Any]) -> Dict[str, Any]:
+    """
+    Convert SourceSummary objects to state format, compressing them to the token budget
+    
+    Returns:
+        State updates (summaries_created, summaries, total_tokens)
+    """
+    return _summary_dicts_state_update([_summary_to_dict(s) for s in summaries])
+
+
+def _summary_dicts_state_update(summary_dicts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compress state-format summaries to the token budget
+    
+    Returns:
+        State updates (summaries_created, summaries, total_tokens)
+    """
+    from .middleware import compress_summaries_if_needed, estimate_tokens
+    
+    # Calculate token count
+    total_text = ' '.join([s['evidence_snippet'] for s in summary_dicts])
+    total_tokens = estimate_tokens(total_text)
+    
+    logger.info(f"[SummarizeNode] Initial token count: {total_tokens}")
+    
+    # Apply middleware: compress if needed
+    summary_dicts = compress_summaries_if_needed(summary_dicts)
+    
+    # Recalculate after compression
+    compressed_text = ' '.join([s['evidence_snippet'] for s in summary_dicts])
+    final_tokens = estimate_tokens(compressed_text)
+    
+    logger.info(f"[SummarizeNode] Final token count: {final_tokens}")
+    
+    return {
+        'summaries_created': True,
+        'summaries': summary_dicts,
+        'total_tokens': final_tokens
+    }
+
+
 def summarize_node(state: ChatbotState) -> Dict[str, Any]:
     """
     Node 4: Summarize collected data
@@ -177,37 +276,32 @@ def summarize_node(state: ChatbotState) -> Dict[str, Any]:
     logger.info(f"[SummarizeNode] Summarizing {len(state['raw_data'])} data sources")
     
     try:
-        # Convert raw_data back to fetch results format
-        from planner import FetchPlan
-        from daum_fetch import FetchResult
-        from .middleware import compress_summaries_if_needed, estimate_tokens
-        
+        # Resolve plan/result refs from the artifact store
+        store = _get_store(state)
+        plans_by_id = {plan.plan_id: plan for plan in _load_plans(state)}
         fetch_results = []
         plans = []
         
         for item in state['raw_data']:
-            plan_dict = item['plan']
+            plan = plans_by_id[item['plan']['plan_id']]
             result_dict = item['result']
-            
-            # Reconstruct plan
-            plan = FetchPlan(
-                plan_id=plan_dict['plan_id'],
-                description=plan_dict['description'],
-                url=plan_dict['url'],
-                parser_name=plan_dict['parser_name'],
-                is_json=plan_dict.get('is_json', False),
-                title=plan_dict.get('title'),
-                content=plan_dict.get('content')  # ✅ Include content
-            )
             plans.append(plan)
             
-            # Reconstruct result
-            result = FetchResult(
-                url=plan_dict['url'],
-                success=result_dict['success'],
-                content=result_dict.get('content'),
-                error_message=result_dict.get('error')
-            )
+            # FetchResult as fetched (keeps json_data for API plans, so realtime
+            # quote summarization reuses it instead of refetching)
+            result = store.get(result_dict.get('content_ref'))
+            if result is None and result_dict['success'] and plan.parser_name != "tavily_news":
+                # Artifact dropped: fall back to the shared fetch cache (no refetch)
+                result = get_cached_result(plan.url, None, plan.is_json)
+                if result is None:
+                    logger.warning(f"[SummarizeNode] Result for {plan.plan_id} no longer available: {plan.url}")
+                    result = FetchResult(url=plan.url, success=False, error_message="수집 결과 만료")
+            if result is None:
+                result = FetchResult(
+                    url=plan.url,
+                    success=result_dict['success'],
+                    error_message=result_dict.get('error')
+                )
             
             fetch_results.append((result, plan))
         
@@ -219,49 +313,353 @@ def summarize_node(state: ChatbotState) -> Dict[str, Any]:
             plans,
             stock_code=stock_code,
             stock_name=stock_name,
-            include_realtime=True
+            include_realtime=True,
+            search_context=get_search_context(state.get('request_id'))
         )
+        release_search_context(state.get('request_id'))
         
-        # Convert summaries to dict format
-        summary_dicts = [
-            {
-                'source_type': s.source_type,
-                'source_url': s.source_url,
-                'key_data': s.key_data,
-                'evidence_snippet': s.evidence_snippet
-            }
-            for s in summaries
-        ]
+        return _summaries_state_update(summaries)
+    
+    except Exception as e:
+        logger.error(f"[SummarizeNode] Error: {str(e)}")
+        return {
+            'summaries_created': False,
+            'error': f"Summarization failed: {str(e)}"
+        }
+
+
+def _fetch_result_dict(
+    timed,
+    plan_id: str,
+    store: ArtifactStore,
+    dropped: bool = False
+) -> Dict[str, Any]:
+    """
+    Convert a TimedFetchResult to state format, storing the FetchResult in the artifact store
+    Args:
+        timed: TimedFetchResult, or None for Tavily news (no fetch) / dropped sources
+        plan_id: Plan id (artifact reference)
+        store: Request's artifact store
+        dropped: Whether the source was dropped at a deadline
+    """
+    if timed is None:
+        return {
+            'success': not dropped,
+            'content_ref': None,
+            'error': "수집 지연으로 제외됨" if dropped else None,
+            'stale': False,
+            'latency_ms': None
+        }
+    
+    result = timed.result
+    return {
+        'success': result.success,
+        'content_ref': store.put(result_ref(plan_id), result) if result.success else None,
+        'error': result.error_message,
+        'stale': result.stale,
+        'latency_ms': round(timed.latency * 1000)
+    }
+
+
+def gather_node(state: ChatbotState) -> Dict[str, Any]:
+    """
+    Node 3+4 (progressive mode): Fetch and summarize sources as they arrive
+    
+    Replaces fetch + summarize when PIPELINE_MODE=progressive. Each source is
+    summarized as soon as its fetch completes; the node returns once the minimum
+    evidence set is ready (plus a short grace period) or at the deadline, dropping
+    late sources so answer generation can start early
+    
+    Returns:
+        State updates (fetch and summarize fields)
+    """
+    logger.info(f"[GatherNode] Collecting evidence from {len(state['fetch_plans'])} sources")
+    
+    try:
+        plans = _load_plans(state)
+        store = _get_store(state)
         
-        # Calculate token count
-        total_text = ' '.join([s['evidence_snippet'] for s in summary_dicts])
-        total_tokens = estimate_tokens(total_text)
+        evidence = collect_evidence(
+            plans,
+            stock_code=state.get('stock_code'),
+            stock_name=state.get('stock_name'),
+            question_type=state.get('question_type'),
+            search_context=get_search_context(state.get('request_id'))
+        )
+        release_search_context(state.get('request_id'))
         
-        logger.info(f"[SummarizeNode] Initial token count: {total_tokens}")
+        raw_data = []
+        successful = 0
+        failed = 0
         
-        # Apply middleware: compress if needed
-        summary_dicts = compress_summaries_if_needed(summary_dicts)
+        for plan, timed in zip(state['fetch_plans'], evidence.fetch_results):
+            result_dict = _fetch_result_dict(
+                timed, plan['plan_id'], store, dropped=plan['plan_id'] in evidence.dropped
+            )
+            raw_data.append({'plan': plan, 'result': result_dict})
+            if result_dict['success']:
+                successful += 1
+            else:
+                failed += 1
         
-        # Recalculate after compression
-        compressed_text = ' '.join([s['evidence_snippet'] for s in summary_dicts])
-        final_tokens = estimate_tokens(compressed_text)
+        logger.info(
+            f"[GatherNode] {len(evidence.summaries)} summaries in {evidence.elapsed:.2f}s "
+            f"(dropped: {len(evidence.dropped)})"
+        )
         
-        logger.info(f"[SummarizeNode] Final token count: {final_tokens}")
+        updates = {
+            'data_collected': True,
+            'raw_data': raw_data,
+            'successful_fetches': successful,
+            'failed_fetches': failed
+        }
+        updates.update(_summaries_state_update(evidence.summaries))
+        return updates
+    
+    except Exception as e:
+        logger.error(f"[GatherNode] Error: {str(e)}")
+        return {
+            'data_collected': False,
+            'summaries_created': False,
+            'error': f"Evidence collection failed: {str(e)}"
+        }
+
+
+# Parallel mode: source family per parser (unknown parsers fall back to price pages)
+BRANCH_PARSERS = {
+    "price": ("parse_price_page", "parse_chart_for_price", "parse_api_quote", "parse_chart_json"),
+    "news": ("parse_news_list", "tavily_news"),
+    "disclosure": ("parse_disclosure_list",),
+    "opinion": ("parse_talks_list",),
+}
+
+# Branches that also run a plan-independent source (realtime quote / opinion search)
+BRANCHES_WITH_EXTRA_SOURCE = ("price", "opinion")
+
+
+def get_plan_branch(parser_name: str) -> str:
+    """
+    Get the parallel-mode branch for a plan
+    Args:
+        parser_name: FetchPlan parser name
+    Returns:
+        Branch name (price, news, disclosure or opinion)
+    """
+    for branch, parsers in BRANCH_PARSERS.items():
+        if parser_name in parsers:
+            return branch
+    return "price"
+
+
+def get_active_branches(state: ChatbotState) -> List[str]:
+    """
+    Get the branches with work for this request
+    Returns:
+        Branch names in BRANCH_PARSERS order
+    """
+    branches = {get_plan_branch(p['parser_name']) for p in state['fetch_plans']}
+    if state.get('stock_code'):
+        branches.update(BRANCHES_WITH_EXTRA_SOURCE)
+    return [branch for branch in BRANCH_PARSERS if branch in branches]
+
+
+def _branch_extra_source(
+    branch: str,
+    state: ChatbotState,
+    plan_futures: Dict[Future, Any],
+    deadline: float
+) -> Optional[Callable[[], Any]]:
+    """
+    Get the plan-independent source of a branch
+    Args:
+        branch: Branch name
+        state: Current state
+        plan_futures: {future: FetchPlan} of the branch's plans (realtime quote reuses their fetches)
+        deadline: perf_counter time at which the branch stops waiting
+    Returns:
+        Callable returning Optional[SourceSummary], or None
+    """
+    from summarizer import get_talks_summary_from_daum
+    
+    stock_code = state.get('stock_code')
+    if not stock_code:
+        return None
+    
+    if branch == "price":
+        return lambda: realtime_summary_reusing_fetches(
+            stock_code, plan_futures, deadline - time.perf_counter()
+        )
+    if branch == "opinion":
+        search_context = get_search_context(state.get('request_id'))
+        return lambda: get_talks_summary_from_daum(
+            stock_code, state.get('stock_name'), search_context=search_context
+        )
+    return None
+
+
+def make_branch_node(branch: str) -> Callable[[ChatbotState], Dict[str, Any]]:
+    """
+    Create the parallel-mode node for one source family
+    
+    The node fetches and summarizes its plans (plus the realtime quote for price
+    and the investor opinion search for opinion) concurrently, dropping anything
+    not finished within PARALLEL_BRANCH_TIMEOUTS[branch]. Results are appended to
+    branch_results and merged by join_node.
+    
+    Args:
+        branch: Branch name (key of BRANCH_PARSERS)
+    
+    Returns:
+        Node function
+    """
+    timeout = PARALLEL_BRANCH_TIMEOUTS.get(branch, max(PARALLEL_BRANCH_TIMEOUTS.values()))
+    
+    def branch_node(state: ChatbotState) -> Dict[str, Any]:
+        start = time.perf_counter()
+        
+        # Task key -> func; rank keeps summarize_results ordering
+        # (realtime 0, opinions 1, plans 2 + plan index)
+        tasks = {}
+        plans = {}
+        for index, plan in enumerate(_load_plans(state)):
+            if get_plan_branch(plan.parser_name) != branch:
+                continue
+            tasks[2 + index] = lambda plan=plan: fetch_and_summarize(plan)
+            plans[2 + index] = plan
+        
+        # Plan futures are filled in before the extra source is submitted
+        plan_futures = {}
+        extra = _branch_extra_source(branch, state, plan_futures, start + timeout)
+        if extra is not None:
+            rank = 0 if branch == "price" else 1
+            tasks[rank] = lambda: (None, extra())
+        
+        logger.info(f"[BranchNode:{branch}] Running {len(tasks)} sources (timeout {timeout}s)")
+        
+        raw_data = []
+        summaries = []
+        store = _get_store(state)
+        executor = ThreadPoolExecutor(max_workers=max(1, len(tasks)), thread_name_prefix=f"branch-{branch}")
+        try:
+            futures = {}
+            for rank, func in tasks.items():
+                futures[rank] = executor.submit(func)
+                if rank in plans:
+                    plan_futures[futures[rank]] = plans[rank]
+            wait(list(futures.values()), timeout=timeout)
+            
+            for rank, future in futures.items():
+                name = state['fetch_plans'][rank - 2]['plan_id'] if rank >= 2 else ("realtime", "opinions")[rank]
+                timed, summary, dropped = None, None, False
+                if not future.done():
+                    dropped = True
+                    logger.warning(f"[BranchNode:{branch}] {name} dropped after {timeout}s")
+                else:
+                    try:
+                        timed, summary = future.result()
+                    except Exception as e:
+                        logger.warning(f"[BranchNode:{branch}] {name} failed: {str(e)}")
+                        if rank >= 2:
+                            # Record the failure so the plan is not reported as a successful fetch
+                            timed = TimedFetchResult(
+                                result=FetchResult(
+                                    success=False,
+                                    error_message=f"수집 실패: {str(e)}",
+                                    url=plans[rank].url
+                                ),
+                                latency=time.perf_counter() - start
+                            )
+                
+                if rank >= 2:
+                    raw_data.append({
+                        'index': rank - 2,
+                        'plan': state['fetch_plans'][rank - 2],
+                        'result': _fetch_result_dict(timed, name, store, dropped=dropped)
+                    })
+                if summary is not None:
+                    summaries.append({'rank': rank, 'summary': _summary_to_dict(summary)})
+        finally:
+            # Don't block on sources past the branch timeout
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        elapsed = time.perf_counter() - start
+        logger.info(f"[BranchNode:{branch}] {len(summaries)} summaries in {elapsed:.2f}s")
         
         return {
-            'summaries_created': True,
-            'summaries': summary_dicts,
-            'total_tokens': final_tokens
+            'branch_results': [{
+                'branch': branch,
+                'raw_data': raw_data,
+                'summaries': summaries,
+                'elapsed': round(elapsed, 3)
+            }]
+        }
+    
+    branch_node.__name__ = f"{branch}_branch_node"
+    return branch_node
+
+
+def join_node(state: ChatbotState) -> Dict[str, Any]:
+    """
+    Join node (parallel mode): merge branch results
+    
+    Restores plan order for raw_data and summarize_results order for summaries,
+    then applies the same token management as summarize_node
+    
+    Returns:
+        State updates (fetch and summarize fields)
+    """
+    branch_results = state.get('branch_results', [])
+    logger.info(
+        "[JoinNode] Merging branches: "
+        + ", ".join(f"{b['branch']} {b['elapsed']:.2f}s" for b in branch_results)
+    )
+    
+    try:
+        release_search_context(state.get('request_id'))
+        
+        raw_items = sorted(
+            (item for b in branch_results for item in b['raw_data']),
+            key=lambda item: item['index']
+        )
+        raw_data = [{'plan': item['plan'], 'result': item['result']} for item in raw_items]
+        successful = sum(1 for item in raw_data if item['result']['success'])
+        
+        summary_items = sorted(
+            (item for b in branch_results for item in b['summaries']),
+            key=lambda item: item['rank']
+        )
+        
+        updates = {
+            'data_collected': True,
+            'raw_data': raw_data,
+            'successful_fetches': successful,
+            'failed_fetches': len(raw_data) - successful
         }
+        updates.update(_summary_dicts_state_update([item['summary'] for item in summary_items]))
+        return updates
     
     except Exception as e:
-        logger.error(f"[SummarizeNode] Error: {str(e)}")
+        logger.error(f"[JoinNode] Error: {str(e)}")
         return {
+            'data_collected': False,
             'summaries_created': False,
-            'error': f"Summarization failed: {str(e)}"
+            'error': f"Branch merge failed: {str(e)}"
         }
 
 
+def _get_stream_writer():
+    """
+    Get LangGraph's custom stream writer for the running node
+    Returns:
+        Writer callable, or None outside a graph run / on LangGraph versions without it
+    """
+    try:
+        from langgraph.config import get_stream_writer
+        return get_stream_writer()
+    except (ImportError, RuntimeError):
+        return None
+
+
 def answer_node(state: ChatbotState) -> Dict[str, Any]:
     """
     Node 5: Generate final answer
@@ -276,7 +674,6 @@ def answer_node(state: ChatbotState) -> Dict[str, Any]:
     try:
         # Reconstruct objects for answer generation
         from intent import IntentResult
-        from planner import FetchPlan
         from summarizer import SourceSummary
         
         intent = IntentResult(
@@ -285,18 +682,7 @@ def answer_node(state: ChatbotState) -> Dict[str, Any]:
             question_type=state['question_type']
         )
         
-        plans = [
-            FetchPlan(
-                plan_id=p['plan_id'],
-                description=p['description'],
-                url=p['url'],
-                parser_name=p['parser_name'],
-                is_json=p.get('is_json', False),
-                title=p.get('title'),
-                content=p.get('content')  # ✅ Include content
-            )
-            for p in state['fetch_plans']
-        ]
+        plans = _load_plans(state)
         
         summaries = [
             SourceSummary(
@@ -308,8 +694,7 @@ def answer_node(state: ChatbotState) -> Dict[str, Any]:
             for s in state['summaries']
         ]
         
-        # Generate answer
-        answer_text = generate_answer(
+        answer_kwargs = dict(
             intent=intent,
             plans=plans,
             summaries=summaries,
@@ -318,6 +703,18 @@ def answer_node(state: ChatbotState) -> Dict[str, Any]:
             chat_history=state['chat_history']
         )
         
+        # Generate answer, emitting tokens as custom stream events when streamed
+        # (app.stream(..., stream_mode=["updates", "custom"]))
+        writer = _get_stream_writer()
+        if writer is not None:
+            chunks = []
+            for chunk in generate_answer_stream(**answer_kwargs):
+                chunks.append(chunk)
+                writer({'answer_token': chunk})
+            answer_text = "".join(chunks)
+        else:
+            answer_text = generate_answer(**answer_kwargs)
+        
         return {
             'answer_generated': True,
             'final_answer': answer_text
@@ -330,3 +727,7 @@ def answer_node(state: ChatbotState) -> Dict[str, Any]:
             'error': f"Answer generation failed: {str(e)}",
             'final_answer': f"❌ 답변 생성 중 오류가 발생했습니다: {str(e)}"
         }
+    
+    finally:
+        # Last consumer of the request's plans/page content
+        release_artifact_store(state.get('request_id'))
@@ -1,7 +1,9 @@
 """
 LangGraph State definition for Daum Finance Chatbot
 """
-from typing import TypedDict, Optional, List, Dict, Any
+import operator
+import uuid
+from typing import TypedDict, Optional, List, Dict, Any, Annotated
 from dataclasses import dataclass
 
 
@@ -13,6 +15,7 @@ class ChatbotState(TypedDict):
     LangGraph automatically manages state updates and token limits.
     """
     # User input
+    request_id: str  # Unique id per question (keys per-request resources, e.g. SearchContext)
     user_query: str
     chat_history: List[Dict[str, str]]  # For multi-turn conversations
     
@@ -32,6 +35,9 @@ class ChatbotState(TypedDict):
     successful_fetches: int
     failed_fetches: int
     
+    # Parallel mode: per-branch results, concatenated by LangGraph as branches finish
+    branch_results: Annotated[List[Dict[str, Any]], operator.add]
+    
     # Summarization (with automatic token management)
     summaries_created: bool
     summaries: List[Dict[str, str]]
@@ -69,6 +75,7 @@ def create_initial_state(
     """
     return ChatbotState(
         # User input
+        request_id=uuid.uuid4().hex,
         user_query=user_query,
         chat_history=chat_history or [],
         
@@ -87,6 +94,7 @@ def create_initial_state(
         raw_data=[],
         successful_fetches=0,
         failed_fetches=0,
+        branch_results=[],
         
         # Summarization
         summaries_created=False,
@@ -7,20 +7,40 @@ This workflow orchestrates the entire chatbot process:
 3. Data fetching
 4. Summarization (with token management)
 5. Answer generation
+
+In progressive mode (PIPELINE_MODE=progressive), steps 3-4 run as a single
+"gather" node that summarizes each source as it arrives
+
+In parallel mode (PIPELINE_MODE=parallel), steps 3-4 fan out into one branch
+per source family (price, news, disclosure, opinion), each with its own
+timeout, and fan back in at a "join" node
 """
 import logging
+import threading
+import time
+from typing import Dict, List, Optional, Union
 from langgraph.graph import StateGraph, END
+from config import PIPELINE_MODE
 from .state import ChatbotState
 from .nodes import (
     intent_node,
     plan_node,
     fetch_node,
     summarize_node,
-    answer_node
+    gather_node,
+    join_node,
+    answer_node,
+    make_branch_node,
+    get_active_branches,
+    BRANCH_PARSERS
 )
 
 logger = logging.getLogger(__name__)
 
+# Compiled workflows per pipeline mode, shared by all sessions
+_compiled_workflows: Dict[str, StateGraph] = {}
+_compiled_workflows_lock = threading.Lock()
+
 
 def should_continue_after_intent(state: ChatbotState) -> str:
     """
@@ -58,6 +78,26 @@ def should_continue_after_plan(state: ChatbotState) -> str:
     return "fetch"
 
 
+def route_branches(state: ChatbotState) -> Union[str, List[str]]:
+    """
+    Conditional edge after plan creation (parallel mode)
+    
+    Returns:
+        Branch node names to run in parallel, or END
+    """
+    if should_continue_after_plan(state) == END:
+        return END
+    
+    branches = get_active_branches(state)
+    logger.info(f"[Workflow] Fanning out to branches: {', '.join(branches)}")
+    return [_branch_node_name(branch) for branch in branches]
+
+
+def _branch_node_name(branch: str) -> str:
+    """Graph node name for a parallel-mode branch"""
+    return f"{branch}_branch"
+
+
 def should_continue_after_fetch(state: ChatbotState) -> str:
     """
     Conditional edge after data fetching
@@ -95,21 +135,36 @@ def should_continue_after_summarize(state: ChatbotState) -> str:
     return "answer"
 
 
-def create_workflow() -> StateGraph:
+def create_workflow(mode: Optional[str] = None) -> StateGraph:
     """
     Create the LangGraph workflow
     
+    Args:
+        mode: "sequential" (fetch -> summarize), "progressive" (gather: summarize
+              sources as they arrive, answer once minimum evidence is ready) or
+              "parallel" (one branch per source family -> join);
+              defaults to PIPELINE_MODE
+    
     Returns:
         Compiled StateGraph
     """
+    mode = mode or PIPELINE_MODE
+    
     # Create graph
     workflow = StateGraph(ChatbotState)
     
     # Add nodes
     workflow.add_node("intent", intent_node)
     workflow.add_node("plan", plan_node)
-    workflow.add_node("fetch", fetch_node)
-    workflow.add_node("summarize", summarize_node)
+    if mode == "progressive":
+        workflow.add_node("gather", gather_node)
+    elif mode == "parallel":
+        for branch in BRANCH_PARSERS:
+            workflow.add_node(_branch_node_name(branch), make_branch_node(branch))
+        workflow.add_node("join", join_node)
+    else:
+        workflow.add_node("fetch", fetch_node)
+        workflow.add_node("summarize", summarize_node)
     workflow.add_node("answer", answer_node)
     
     # Set entry point
@@ -125,36 +180,104 @@ def create_workflow() -> StateGraph:
         }
     )
     
-    workflow.add_conditional_edges(
-        "plan",
-        should_continue_after_plan,
-        {
-            "fetch": "fetch",
-            END: END
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "fetch",
-        should_continue_after_fetch,
-        {
-            "summarize": "summarize",
-            END: END
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "summarize",
-        should_continue_after_summarize,
-        {
-            "answer": "answer",
-            END: END
-        }
-    )
+    if mode == "progressive":
+        workflow.add_conditional_edges(
+            "plan",
+            should_continue_after_plan,
+            {
+                "fetch": "gather",
+                END: END
+            }
+        )
+        
+        # Gather produces summaries directly
+        workflow.add_conditional_edges(
+            "gather",
+            should_continue_after_summarize,
+            {
+                "answer": "answer",
+                END: END
+            }
+        )
+    elif mode == "parallel":
+        branch_nodes = [_branch_node_name(branch) for branch in BRANCH_PARSERS]
+        workflow.add_conditional_edges(
+            "plan",
+            route_branches,
+            branch_nodes + [END]
+        )
+        
+        # Branches started together finish in the same step, so join runs once
+        for node in branch_nodes:
+            workflow.add_edge(node, "join")
+        
+        workflow.add_conditional_edges(
+            "join",
+            should_continue_after_summarize,
+            {
+                "answer": "answer",
+                END: END
+            }
+        )
+    else:
+        workflow.add_conditional_edges(
+            "plan",
+            should_continue_after_plan,
+            {
+                "fetch": "fetch",
+                END: END
+            }
+        )
+        
+        workflow.add_conditional_edges(
+            "fetch",
+            should_continue_after_fetch,
+            {
+                "summarize": "summarize",
+                END: END
+            }
+        )
+        
+        workflow.add_conditional_edges(
+            "summarize",
+            should_continue_after_summarize,
+            {
+                "answer": "answer",
+                END: END
+            }
+        )
     
     # Answer node ends the workflow
     workflow.add_edge("answer", END)
     
     # Compile graph
-    logger.info("[Workflow] Compiling LangGraph workflow")
+    logger.info(f"[Workflow] Compiling LangGraph workflow (mode={mode})")
     return workflow.compile()
+
+
+def get_workflow(mode: Optional[str] = None) -> StateGraph:
+    """
+    Get the compiled LangGraph workflow, compiling it once per process
+    The compiled graph holds no per-run state (no checkpointer), so one
+    instance is shared by all sessions and messages
+    
+    Args:
+        mode: Pipeline mode (defaults to PIPELINE_MODE)
+    
+    Returns:
+        Compiled StateGraph
+    """
+    mode = mode or PIPELINE_MODE
+    
+    app = _compiled_workflows.get(mode)
+    if app is not None:
+        return app
+    
+    with _compiled_workflows_lock:
+        app = _compiled_workflows.get(mode)
+        if app is None:
+            start = time.perf_counter()
+            app = create_workflow(mode)
+            _compiled_workflows[mode] = app
+            logger.info(f"[Workflow] Compiled in {(time.perf_counter() - start) * 1000:.1f}ms (mode={mode})")
+    return app
@@ -0,0 +1,202 @@
+"""
+Hedged execution of fallback sources
+Starts the primary source, fires the next fallback if no valid answer arrives
+within the hedge delay, and takes the first valid result
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import (
+    HEDGE_DELAY_DEFAULT,
+    HEDGE_DELAY_MIN,
+    HEDGE_DELAY_MAX,
+    HEDGE_MIN_SAMPLES
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-attempt flags (each hedged attempt runs in its own worker thread)
+_attempt_context = threading.local()
+
+
+def mark_served_from_cache():
+    """
+    Flag the running hedged attempt as answered without a network call
+    (cache or already-fetched data), so its latency does not skew the hedge delay
+    """
+    _attempt_context.from_cache = True
+
+
+class SourceStats:
+    """
+    Per-source success/latency statistics used to tune the hedge delay
+    """
+
+    def __init__(self, window: int = 50):
+        self._lock = threading.Lock()
+        self._window = window
+        self._successes: Dict[str, int] = {}
+        self._failures: Dict[str, int] = {}
+        self._latencies: Dict[str, deque] = {}
+
+    def record(self, name: str, success: bool, latency: Optional[float]):
+        """
+        Record one source attempt
+        Args:
+            name: Source name
+            success: Whether the source returned a valid result
+            latency: Seconds taken, or None when served without a network call
+                (counted as success/failure but not sampled)
+        """
+        with self._lock:
+            if success:
+                self._successes[name] = self._successes.get(name, 0) + 1
+                if latency is not None:
+                    self._latencies.setdefault(name, deque(maxlen=self._window)).append(latency)
+            else:
+                self._failures[name] = self._failures.get(name, 0) + 1
+
+    def hedge_delay(self, name: str) -> float:
+        """
+        Suggested hedge delay for a source: p90 of its recent successful latencies
+        Args:
+            name: Source name
+        Returns:
+            Delay in seconds (HEDGE_DELAY_DEFAULT until enough samples)
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(name, []))
+
+        if len(latencies) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DELAY_DEFAULT
+
+        p90 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))]
+        return min(max(p90, HEDGE_DELAY_MIN), HEDGE_DELAY_MAX)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statistics for all sources
+        Returns:
+            {name: {successes, failures, success_rate, avg_latency, hedge_delay}}
+        """
+        with self._lock:
+            names = set(self._successes) | set(self._failures)
+            data = {}
+            for name in names:
+                successes = self._successes.get(name, 0)
+                failures = self._failures.get(name, 0)
+                latencies = list(self._latencies.get(name, []))
+                data[name] = {
+                    'successes': successes,
+                    'failures': failures,
+                    'success_rate': successes / (successes + failures),
+                    'avg_latency': (sum(latencies) / len(latencies)) if latencies else None
+                }
+
+        for name in data:
+            data[name]['hedge_delay'] = self.hedge_delay(name)
+        return data
+
+
+def run_hedged(
+    candidates: List[Tuple[str, Callable[[], Any]]],
+    stats: SourceStats,
+    deadline: Optional[float] = None
+) -> Optional[Tuple[str, Any]]:
+    """
+    Run candidates in priority order with hedging
+
+    The first candidate starts immediately. The next one starts when no valid
+    result arrived within the hedge delay of the last started source (measured
+    from its start), or right away when the last started source failed. The first
+    valid result wins; the rest are cancelled (running ones finish in the
+    background and are ignored).
+
+    Args:
+        candidates: List of (name, func) in priority order; func returns a value or None if invalid
+            (and calls mark_served_from_cache() when it answered without a network call)
+        stats: SourceStats used for hedge delays and updated with every attempt
+        deadline: Total time budget in seconds (optional)
+
+    Returns:
+        (name, value) of the first valid result, or None
+    """
+    if not candidates:
+        return None
+
+    def _attempt(name: str, func: Callable[[], Any]) -> Any:
+        _attempt_context.from_cache = False
+        start = time.perf_counter()
+        try:
+            value = func()
+        except Exception as e:
+            logger.warning(f"[Hedge] {name} failed: {str(e)}")
+            value = None
+        # Cache/prefetch answers take ~0ms and would collapse the p90 hedge delay
+        latency = None if _attempt_context.from_cache else time.perf_counter() - start
+        stats.record(name, value is not None, latency)
+        return value
+
+    executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="hedge")
+    start = time.perf_counter()
+    pending = {}
+    next_index = 0
+    latest = None       # Future of the most recently started candidate
+    last_launch = start
+
+    def _launch_next():
+        nonlocal next_index, latest, last_launch
+        name, func = candidates[next_index]
+        latest = executor.submit(_attempt, name, func)
+        pending[latest] = name
+        last_launch = time.perf_counter()
+        next_index += 1
+        if next_index > 1:
+            logger.info(f"[Hedge] Started fallback source: {name}")
+
+    try:
+        _launch_next()
+
+        while pending:
+            now = time.perf_counter()
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - (now - start)
+                if remaining <= 0:
+                    logger.warning("[Hedge] Deadline exceeded, no valid result")
+                    return None
+
+            # Hedge timer runs from the last launch, not from the last completion
+            timeout = remaining
+            hedge_at = None
+            if next_index < len(candidates):
+                hedge_at = last_launch + stats.hedge_delay(candidates[next_index - 1][0])
+                hedge_in = max(0.0, hedge_at - now)
+                timeout = hedge_in if remaining is None else min(hedge_in, remaining)
+
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            latest_failed = False
+            for future in done:
+                name = pending.pop(future)
+                value = future.result()
+                if value is not None:
+                    logger.info(f"[Hedge] {name} won after {time.perf_counter() - start:.2f}s")
+                    return name, value
+                latest_failed = latest_failed or future is latest
+
+            # Hedge delay since the last launch passed, or the latest source failed
+            if hedge_at is not None and (
+                latest_failed or not pending or time.perf_counter() >= hedge_at
+            ):
+                _launch_next()
+
+        return None
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,351 @@
+"""
+Pluggable HTML engine for parsers.py
+"bs4" builds a BeautifulSoup(lxml) tree; "selectolax" uses the lexbor engine,
+which builds its tree several times faster. Both backends expose the same small
+node API (select / select_one / text / raw_text / get), so every parser returns
+identical output dicts whichever backend is configured
+"""
+
+import logging
+import re
+from typing import Any, Callable, List, Optional, Sequence
+
+from config import HTML_PARSER_BACKEND
+
+logger = logging.getLogger(__name__)
+
+HTML_BACKENDS = ("bs4", "selectolax")
+
+# Tags whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = ("script", "style")
+
+
+# Compound selector subset compiled to predicates: tag, .class, [attr*="value"]
+_COMPOUND_RE = re.compile(r'^([a-zA-Z][\w-]*)?((?:\.[\w-]+|\[[\w-]+\*="[^"]+"\])*)$')
+_COMPOUND_PART_RE = re.compile(r'\.([\w-]+)|\[([\w-]+)\*="([^"]+)"\]')
+
+
+def _compile_compound(text: str) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile a compound selector (e.g. a.link, span[class*="date"]) to a Tag predicate
+    Returns None for syntax outside the supported subset
+    """
+    match = _COMPOUND_RE.match(text)
+    if not match or not text:
+        return None
+
+    name = match.group(1).lower() if match.group(1) else None
+    classes = []
+    contains = []
+    for class_name, attr, value in _COMPOUND_PART_RE.findall(match.group(2)):
+        if class_name:
+            classes.append(class_name)
+        else:
+            contains.append((attr, value))
+
+    def predicate(tag) -> bool:
+        if name is not None and tag.name != name:
+            return False
+        if classes:
+            tag_classes = tag.get('class') or ()
+            for class_name in classes:
+                if class_name not in tag_classes:
+                    return False
+        for attr, value in contains:
+            attr_value = tag.get(attr)
+            if attr_value is None:
+                return False
+            if isinstance(attr_value, list):  # Multi-valued (class) attributes
+                attr_value = ' '.join(attr_value)
+            if value not in attr_value:
+                return False
+        return True
+
+    return predicate
+
+
+def _compile_bs4_selector(selector: str) -> Callable[[Any], bool]:
+    """
+    Compile a selector to a BeautifulSoup Tag predicate
+    Descendant chains of compound selectors become plain Python checks (much
+    cheaper per element than soupsieve's match); anything else uses soupsieve
+    """
+    compounds = [_compile_compound(part) for part in selector.split()]
+    if not compounds or any(compound is None for compound in compounds):
+        import soupsieve
+        return soupsieve.compile(selector).match
+
+    *ancestors, subject = compounds
+
+    def matches(tag) -> bool:
+        if not subject(tag):
+            return False
+        # Descendant combinators: match remaining compounds against ancestors, innermost first
+        index = len(ancestors) - 1
+        node = tag.parent
+        while index >= 0 and node is not None:
+            if ancestors[index](node):
+                index -= 1
+            node = node.parent
+        return index < 0
+
+    return matches
+
+
+class SelectorPlan:
+    """
+    Ordered CSS selectors compiled once (at import of the parser that defines them)
+    Nodes resolve a whole plan in a single tree pass instead of one select per selector
+    """
+
+    __slots__ = ('selectors', '_bs4_matchers')
+
+    def __init__(self, selectors: Sequence[str]):
+        self.selectors = tuple(selectors)
+        # Predicates for the bs4 backend (lexbor runs selector strings natively)
+        self._bs4_matchers = [_compile_bs4_selector(selector) for selector in self.selectors]
+
+
+class Bs4Node:
+    """
+    Element of a BeautifulSoup tree
+    """
+
+    __slots__ = ('_tag',)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    @property
+    def name(self) -> str:
+        """Tag name"""
+        return self._tag.name
+
+    def select(self, selector: str) -> List['Bs4Node']:
+        """Descendants matching a CSS selector, in document order"""
+        return [Bs4Node(tag) for tag in self._tag.select(selector)]
+
+    def select_one(self, selector: str) -> Optional['Bs4Node']:
+        """First descendant matching a CSS selector (None if no match)"""
+        tag = self._tag.select_one(selector)
+        return Bs4Node(tag) if tag is not None else None
+
+    def text(self) -> str:
+        """Text content, each string stripped (get_text(strip=True))"""
+        return self._tag.get_text(strip=True)
+
+    def raw_text(self) -> Optional[str]:
+        """Unmodified text of a single-string element such as <script> (None if empty)"""
+        return self._tag.string
+
+    def get(self, attr: str, default=None):
+        """Attribute value"""
+        return self._tag.get(attr, default)
+
+    def select_first_matching(self, plan: SelectorPlan) -> List['Bs4Node']:
+        """
+        Descendants matching the first selector of plan that matches anything
+        Single pass; once a selector matches, lower-priority selectors are no longer tested
+        """
+        matchers = plan._bs4_matchers
+        found: List[List[Any]] = [[] for _ in matchers]
+        best = len(matchers)
+        for tag in self._tag.descendants:
+            if tag.name is None:  # Strings, comments
+                continue
+            for index in range(min(best + 1, len(matchers))):
+                if matchers[index](tag):
+                    found[index].append(tag)
+                    best = min(best, index)
+
+        if best == len(matchers):
+            return []
+        return [Bs4Node(tag) for tag in found[best]]
+
+    def select_firsts(self, plan: SelectorPlan) -> List[Optional['Bs4Node']]:
+        """
+        First descendant matching each selector of plan (None where nothing matches), in one pass
+        """
+        matchers = plan._bs4_matchers
+        firsts: List[Optional[Bs4Node]] = [None] * len(matchers)
+        pending = list(range(len(matchers)))
+        for tag in self._tag.descendants:
+            if tag.name is None:
+                continue
+            for index in list(pending):
+                if matchers[index](tag):
+                    firsts[index] = Bs4Node(tag)
+                    pending.remove(index)
+            if not pending:
+                break
+        return firsts
+
+
+class LexborNode:
+    """
+    Element of a selectolax (lexbor) tree, matching Bs4Node behavior
+    """
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def name(self) -> str:
+        """Tag name"""
+        return self._node.tag
+
+    def select(self, selector: str) -> List['LexborNode']:
+        """Descendants matching a CSS selector, in document order"""
+        # lexbor also matches the context node itself; soupsieve only matches descendants
+        own_id = self._node.mem_id
+        return [LexborNode(node) for node in self._node.css(selector) if node.mem_id != own_id]
+
+    def select_one(self, selector: str) -> Optional['LexborNode']:
+        """First descendant matching a CSS selector (None if no match)"""
+        node = self._node.css_first(selector)
+        if node is None:
+            return None
+        if node.mem_id != self._node.mem_id:
+            return LexborNode(node)
+
+        matches = self.select(selector)
+        return matches[0] if matches else None
+
+    def text(self) -> str:
+        """Text content, each string stripped (same as get_text(strip=True))"""
+        if self._node.css_first(", ".join(_NON_TEXT_TAGS)) is None:
+            return self._node.text(deep=True, separator='', strip=True)
+
+        # Skip script/style text like BeautifulSoup does
+        parts: List[str] = []
+        _collect_text(self._node, parts)
+        return ''.join(parts)
+
+    def raw_text(self) -> Optional[str]:
+        """Unmodified text of a single-string element such as <script> (None if empty)"""
+        return self._node.text(deep=True) or None
+
+    def get(self, attr: str, default=None):
+        """Attribute value (valueless attributes read as '' like in BeautifulSoup)"""
+        attributes = self._node.attributes
+        if attr not in attributes:
+            return default
+        value = attributes[attr]
+        return value if value is not None else ''
+
+    def select_first_matching(self, plan: SelectorPlan) -> List['LexborNode']:
+        """
+        Descendants matching the first selector of plan that matches anything
+        (lexbor's native per-selector queries beat a Python-side union pass)
+        """
+        for selector in plan.selectors:
+            matches = self.select(selector)
+            if matches:
+                return matches
+        return []
+
+    def select_firsts(self, plan: SelectorPlan) -> '_LazyFirsts':
+        """
+        First descendant matching each selector of plan (None where nothing matches)
+        Evaluated per selector on first access, so callers that stop at the first
+        usable match only pay for the queries they read
+        """
+        return _LazyFirsts(self, plan.selectors)
+
+
+class _LazyFirsts:
+    """
+    Index-accessible first matches of a selector plan, queried on demand
+    """
+
+    __slots__ = ('_node', '_selectors', '_cache')
+
+    _UNSET = object()
+
+    def __init__(self, node: LexborNode, selectors: Sequence[str]):
+        self._node = node
+        self._selectors = selectors
+        self._cache = [self._UNSET] * len(selectors)
+
+    def __len__(self) -> int:
+        return len(self._selectors)
+
+    def __getitem__(self, index: int) -> Optional[LexborNode]:
+        value = self._cache[index]
+        if value is self._UNSET:
+            value = self._node.select_one(self._selectors[index])
+            self._cache[index] = value
+        return value
+
+
+def _collect_text(node, parts: List[str]):
+    """Append stripped, non-empty text of node's descendants outside script/style"""
+    for child in node.iter(include_text=True):
+        if child.tag == '-text':
+            text = child.text(deep=False).strip()
+            if text:
+                parts.append(text)
+        elif child.tag not in _NON_TEXT_TAGS and child.tag != '-comment':
+            _collect_text(child, parts)
+
+
+def _resolve_backend(name: str) -> str:
+    """
+    Validate a backend name, falling back to bs4 if it is unknown or not installed
+    """
+    name = (name or "bs4").lower()
+    if name not in HTML_BACKENDS:
+        logger.warning(f"Unknown HTML_PARSER_BACKEND '{name}' - using bs4")
+        return "bs4"
+
+    if name == "selectolax":
+        try:
+            import selectolax.lexbor  # noqa: F401
+        except ImportError:
+            logger.warning("HTML_PARSER_BACKEND=selectolax but 'selectolax' is not installed - using bs4")
+            return "bs4"
+    return name
+
+
+_backend = _resolve_backend(HTML_PARSER_BACKEND)
+
+
+def get_html_backend() -> str:
+    """
+    Get the active HTML backend name
+    """
+    return _backend
+
+
+def set_html_backend(name: str) -> str:
+    """
+    Switch the HTML backend at runtime (e.g. for benchmarks)
+    Args:
+        name: Backend name (bs4 or selectolax)
+    Returns:
+        Backend actually in use
+    """
+    global _backend
+    _backend = _resolve_backend(name)
+    return _backend
+
+
+def parse_html(html: str, backend: Optional[str] = None):
+    """
+    Parse an HTML document
+    Args:
+        html: HTML text
+        backend: Backend name (default: configured HTML_PARSER_BACKEND)
+    Returns:
+        Root node (Bs4Node or LexborNode)
+    """
+    backend = _resolve_backend(backend) if backend else _backend
+
+    if backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborNode(LexborHTMLParser(html).root)
+
+    from bs4 import BeautifulSoup
+    return Bs4Node(BeautifulSoup(html, 'lxml'))
@@ -0,0 +1,165 @@
+"""
+Process-pool HTML parse executor (opt-in, PARSE_PROCESS_POOL=true)
+HTML parsing is CPU-bound and holds the GIL, so sessions parsing pages in threads
+share one core. Large pages are shipped to worker processes as UTF-8 bytes and
+only the small result dicts/lists come back; small pages, and any pool failure,
+are parsed in the calling thread
+"""
+
+import atexit
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, get_origin
+
+from config import (
+    PARSE_PROCESS_POOL,
+    PARSE_PROCESS_WORKERS,
+    PARSE_PROCESS_MIN_SIZE,
+    PARSE_PROCESS_TIMEOUT,
+    PARSE_PROCESS_MAX_WAIT
+)
+from html_backend import get_html_backend, set_html_backend
+import parsers
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _parse_in_worker(parser_name: str, body: bytes, backend: str) -> Any:
+    """
+    Worker process entry point: decode the page and run the parser
+    Args:
+        parser_name: Parser function name in parsers.py
+        body: Page HTML as UTF-8 bytes
+        backend: HTML backend of the submitting process
+    Returns:
+        Parser result
+    """
+    if get_html_backend() != backend:
+        set_html_backend(backend)
+    return getattr(parsers, parser_name)(body.decode('utf-8', 'surrogatepass'))
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get or start the shared worker pool (None if it cannot be started)
+    Workers are spawned rather than forked so they never inherit the
+    Streamlit server's threads and locks
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = ProcessPoolExecutor(
+                    max_workers=PARSE_PROCESS_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                logger.info(f"[ParseExecutor] Started process pool ({PARSE_PROCESS_WORKERS} workers)")
+            except Exception as e:
+                logger.warning(f"[ParseExecutor] Process pool unavailable, parsing in-thread: {str(e)}")
+                return None
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next large page starts a fresh one"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _empty_result(parse: Callable) -> Any:
+    """Empty value of a parser's return type (dict parsers -> {}, list parsers -> [])"""
+    return {} if get_origin(parse.__annotations__.get('return')) is dict else []
+
+
+def is_enabled() -> bool:
+    """
+    Check if large pages are parsed in worker processes
+    """
+    return PARSE_PROCESS_POOL
+
+
+def run_parser(parser_name: str, content: str) -> Any:
+    """
+    Run a parsers.py HTML parser, in a worker process for large pages when enabled
+    Falls back to parsing in the calling thread for small pages, when the pool
+    is disabled/broken, or when the page is still queued after PARSE_PROCESS_TIMEOUT.
+    A page a worker has started is awaited (never parsed twice) for up to
+    PARSE_PROCESS_MAX_WAIT in total, then given up with an empty result.
+    Parser exceptions propagate as with a direct call.
+
+    Args:
+        parser_name: Parser function name (e.g. parse_news_list)
+        content: Page HTML
+
+    Returns:
+        Parser result
+    """
+    parse = getattr(parsers, parser_name)
+    if not PARSE_PROCESS_POOL or len(content) < PARSE_PROCESS_MIN_SIZE:
+        return parse(content)
+
+    pool = _get_pool()
+    if pool is None:
+        return parse(content)
+
+    submitted_at = time.perf_counter()
+    try:
+        future = pool.submit(
+            _parse_in_worker,
+            parser_name,
+            content.encode('utf-8', 'surrogatepass'),
+            get_html_backend()
+        )
+    except (BrokenProcessPool, RuntimeError) as e:
+        logger.warning(f"[ParseExecutor] Pool rejected {parser_name}, parsing in-thread: {str(e)}")
+        _discard_pool(pool)
+        return parse(content)
+
+    try:
+        try:
+            return future.result(timeout=PARSE_PROCESS_TIMEOUT)
+        except FutureTimeoutError:
+            # Still queued behind other pages: parse here instead of waiting for a slot
+            if future.cancel():
+                logger.warning(f"[ParseExecutor] {parser_name} still queued after {PARSE_PROCESS_TIMEOUT}s, parsing in-thread")
+                return parse(content)
+
+            # Already running in a worker: parsing it again here would only double the CPU cost
+            logger.warning(f"[ParseExecutor] {parser_name} slow in worker (>{PARSE_PROCESS_TIMEOUT}s), still waiting")
+            remaining = PARSE_PROCESS_MAX_WAIT - (time.perf_counter() - submitted_at)
+            try:
+                return future.result(timeout=max(0.0, remaining))
+            except FutureTimeoutError:
+                logger.error(
+                    f"[ParseExecutor] Gave up on {parser_name} after {PARSE_PROCESS_MAX_WAIT}s in worker, "
+                    f"returning empty result"
+                )
+                return _empty_result(parse)
+    except BrokenProcessPool as e:
+        logger.warning(f"[ParseExecutor] Worker died during {parser_name}, parsing in-thread: {str(e)}")
+        _discard_pool(pool)
+        return parse(content)
+
+
+def shutdown():
+    """
+    Stop the worker pool (registered at exit)
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown)
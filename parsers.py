@@ -1,10 +1,23 @@
 """
 HTML/JSON parsers for Daum Finance pages
+HTML is parsed with the engine selected by HTML_PARSER_BACKEND (see html_backend)
 """
 
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
+import json
 import re
+import threading
+
+from html_backend import parse_html, SelectorPlan
+
+# Fast JSON decoding for embedded page state (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 def parse_search_results(html: str) -> List[Dict[str, str]]:
@@ -16,20 +29,20 @@ def parse_search_results(html: str) -> List[Dict[str, str]]:
         List of {code, name, market} dicts
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = parse_html(html)
         results = []
 
         # Find stock items in search results
-        items = soup.select('.searchStockList .item_stock')
+        items = doc.select('.searchStockList .item_stock')
 
         for item in items:
             try:
                 # Extract stock code
                 link = item.select_one('a')
-                if not link or 'href' not in link.attrs:
+                if not link or link.get('href') is None:
                     continue
 
-                href = link['href']
+                href = link.get('href')
                 code_match = re.search(r'/quotes/(\d{6})', href)
                 if not code_match:
                     continue
@@ -38,11 +51,11 @@ def parse_search_results(html: str) -> List[Dict[str, str]]:
 
                 # Extract stock name
                 name_elem = item.select_one('.txt_name')
-                name = name_elem.get_text(strip=True) if name_elem else ''
+                name = name_elem.text() if name_elem else ''
 
                 # Extract market info if available
                 market_elem = item.select_one('.txt_sub')
-                market = market_elem.get_text(strip=True) if market_elem else ''
+                market = market_elem.text() if market_elem else ''
 
                 if code and name:
                     results.append({
@@ -60,6 +73,87 @@ def parse_search_results(html: str) -> List[Dict[str, str]]:
         return []
 
 
+# Embedded state markers of React/SPA quote pages
+_INITIAL_STATE_MARKER = 'window.__INITIAL_STATE__'
+_NEXT_DATA_MARKER = '__NEXT_DATA__'
+
+
+def _script_bounds(html: str, pos: int) -> Optional[Tuple[int, int]]:
+    """
+    Get the content bounds of the <script> element around a position (str.find only, no DOM)
+    Args:
+        html: Raw HTML
+        pos: Position inside the script's opening tag or content
+    Returns:
+        (content_start, content_end) or None if pos is not inside a script element
+    """
+    tag_start = html.rfind('<script', 0, pos)
+    if tag_start == -1 or html.rfind('</script', tag_start, pos) != -1:
+        return None
+
+    content_start = html.find('>', tag_start) + 1
+    content_end = html.find('</script', max(pos, content_start))
+    if content_end == -1:
+        content_end = len(html)
+    return content_start, content_end
+
+
+def _decode_assigned_json(html: str, start: int, end: int) -> Optional[Any]:
+    """
+    Decode the JSON object assigned at html[start:end] (e.g. ' = {...};')
+    """
+    brace = html.find('{', start, end)
+    if brace == -1 or html[start:brace].strip() != '=':
+        return None
+
+    try:
+        return _json_loads(html[brace:end].rstrip().rstrip(';'))
+    except ValueError:
+        pass
+
+    # More statements follow the assignment: decode just the object
+    try:
+        return json.JSONDecoder().raw_decode(html, brace)[0]
+    except ValueError:
+        return None
+
+
+def _extract_embedded_state(html: str) -> Optional[Any]:
+    """
+    Find embedded state JSON of React/SPA pages in the raw HTML without building a DOM
+    Looks for window.__INITIAL_STATE__ = {...} and <script id="__NEXT_DATA__"> in
+    scripts that contain price data (tradePrice)
+    Args:
+        html: Raw HTML
+    Returns:
+        Decoded state or None if the page has no embedded state
+    """
+    if 'tradePrice' not in html:
+        return None
+
+    pos = html.find(_INITIAL_STATE_MARKER)
+    while pos != -1:
+        bounds = _script_bounds(html, pos)
+        if bounds and html.find('tradePrice', *bounds) != -1:
+            state = _decode_assigned_json(html, pos + len(_INITIAL_STATE_MARKER), bounds[1])
+            if state is not None:
+                return state
+        pos = html.find(_INITIAL_STATE_MARKER, pos + 1)
+
+    pos = html.find(_NEXT_DATA_MARKER)
+    while pos != -1:
+        bounds = _script_bounds(html, pos)
+        # Marker must be in the opening tag (id="__NEXT_DATA__"); content is pure JSON
+        if bounds and pos < bounds[0] and html.find('tradePrice', *bounds) != -1:
+            try:
+                return _json_loads(html[bounds[0]:bounds[1]])
+            except ValueError:
+                pass
+        pos = html.find(_NEXT_DATA_MARKER, pos + 1)
+
+    return None
+
+
 def parse_price_page(html: str) -> Dict[str, Any]:
     """
     Parse price/quote page to extract current price, change, volume, etc.
@@ -69,30 +163,13 @@ def parse_price_page(html: str) -> Dict[str, Any]:
         Dict with price data
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
-        data = {}
+        # React/SPA pages: use the embedded state JSON, no DOM needed
+        state = _extract_embedded_state(html)
+        if state is not None:
+            return _extract_price_from_json(state)
 
-        # Try to extract JSON data from script tags (for React/SPA pages)
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string and 'tradePrice' in script.string:
-                import json
-                import re
-                
-                # Try to find JSON objects in script content
-                try:
-                    # Look for window.__INITIAL_STATE__ or similar patterns
-                    json_match = re.search(r'window\.__INITIAL_STATE__\s*=\s*(\{.+?\});', script.string, re.DOTALL)
-                    if not json_match:
-                        json_match = re.search(r'__NEXT_DATA__["\']?\s*type=["\']application/json["\']>(\{.+?\})</script>', script.string, re.DOTALL)
-                    
-                    if json_match:
-                        json_data = json.loads(json_match.group(1))
-                        # Extract data from JSON structure
-                        # This will need to be adjusted based on actual structure
-                        return _extract_price_from_json(json_data)
-                except:
-                    pass
+        doc = parse_html(html)
+        data = {}
 
         # Fallback: Try multiple CSS selectors for different page structures
         price_selectors = [
@@ -106,9 +183,9 @@ def parse_price_page(html: str) -> Dict[str, Any]:
         ]
         
         for selector in price_selectors:
-            price_elem = soup.select_one(selector)
+            price_elem = doc.select_one(selector)
             if price_elem:
-                price_text = price_elem.get_text(strip=True).replace(',', '')
+                price_text = price_elem.text().replace(',', '')
                 try:
                     data['current_price'] = int(price_text)
                     break
@@ -119,16 +196,16 @@ def parse_price_page(html: str) -> Dict[str, Any]:
         # Change and change rate - try multiple selectors
         change_selectors = ['.change', '.txt_change', '[class*="change"]']
         for selector in change_selectors:
-            change_elem = soup.select_one(selector)
+            change_elem = doc.select_one(selector)
             if change_elem:
-                data['change'] = change_elem.get_text(strip=True)
+                data['change'] = change_elem.text()
                 break
 
         rate_selectors = ['.rate', '.txt_rate', '[class*="rate"]']
         for selector in rate_selectors:
-            rate_elem = soup.select_one(selector)
+            rate_elem = doc.select_one(selector)
             if rate_elem:
-                data['change_rate'] = rate_elem.get_text(strip=True)
+                data['change_rate'] = rate_elem.text()
                 break
 
         # Additional info from summary table - try multiple selectors
@@ -140,15 +217,15 @@ def parse_price_page(html: str) -> Dict[str, Any]:
         ]
         
         for table_selector in table_selectors:
-            info_items = soup.select(table_selector)
+            info_items = doc.select(table_selector)
             if info_items:
                 for item in info_items:
                     th = item.select_one('th, dt')
                     td = item.select_one('td, dd')
 
                     if th and td:
-                        key = th.get_text(strip=True)
-                        value = td.get_text(strip=True)
+                        key = th.text()
+                        value = td.text()
 
                         if '거래량' in key:
                             data['volume'] = value
@@ -170,33 +247,126 @@ def parse_price_page(html: str) -> Dict[str, Any]:
         return {}
 
 
-def _extract_price_from_json(json_data: dict) -> Dict[str, Any]:
+# _extract_price_from_json: state key -> output key
+_PRICE_JSON_FIELDS = (
+    ('tradePrice', 'current_price'),
+    ('change', 'change'),
+    ('changeRate', 'change_rate'),
+    ('accTradeVolume', 'volume'),
+)
+
+# Likely locations of the quote object in embedded page state (tried before scanning)
+_PRICE_JSON_PATHS = (
+    (),
+    ('quote',),
+    ('data',),
+    ('stock',),
+    ('quotes', 'quote'),
+    ('props', 'pageProps', 'quote'),
+    ('props', 'pageProps', 'initialState', 'quote'),
+)
+
+# Bounds for the breadth-first fallback scan
+_PRICE_JSON_MAX_DEPTH = 8
+_PRICE_JSON_MAX_NODES = 2000
+
+# Quote path discovered per state layout (first top-level keys), least recently used first
+_PRICE_JSON_LAYOUT_KEYS = 32
+_PRICE_JSON_LAYOUT_CACHE_SIZE = 128
+_price_json_paths: "OrderedDict[Tuple[str, ...], Tuple[str, ...]]" = OrderedDict()
+_price_json_paths_lock = threading.Lock()
+
+
+def _resolve_json_path(json_data: dict, path: Tuple[str, ...]) -> Optional[dict]:
+    """Follow a key path through nested dicts (None if it leads nowhere)"""
+    node = json_data
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node if isinstance(node, dict) else None
+
+
+def _has_price_fields(node: Optional[dict]) -> bool:
+    """Check if a dict holds any price field"""
+    return node is not None and any(key in node for key, _ in _PRICE_JSON_FIELDS)
+
+
+def _scan_price_path(json_data: dict) -> Optional[Tuple[str, ...]]:
     """
-    Extract price data from JSON structure
+    Bounded breadth-first scan for the shallowest dict holding tradePrice
+    (or, failing that, the shallowest dict holding any price field)
     """
-    data = {}
-    
-    # Try different common JSON structures
-    if isinstance(json_data, dict):
-        # Look for common keys
-        if 'tradePrice' in json_data:
-            data['current_price'] = json_data.get('tradePrice')
-        if 'change' in json_data:
-            data['change'] = json_data.get('change')
-        if 'changeRate' in json_data:
-            data['change_rate'] = json_data.get('changeRate')
-        if 'accTradeVolume' in json_data:
-            data['volume'] = json_data.get('accTradeVolume')
-        
-        # Recursively search nested structures
-        for key, value in json_data.items():
+    fallback = None
+    queue = deque([((), json_data)])
+    queued = 1
+
+    while queue:
+        path, node = queue.popleft()
+        if 'tradePrice' in node:
+            return path
+        if fallback is None and _has_price_fields(node):
+            fallback = path
+
+        if len(path) >= _PRICE_JSON_MAX_DEPTH:
+            continue
+        for key, value in node.items():
+            if queued >= _PRICE_JSON_MAX_NODES:
+                break
             if isinstance(value, dict):
-                nested_data = _extract_price_from_json(value)
-                if nested_data:
-                    data.update(nested_data)
-                    break
-    
-    return data
+                queue.append((path + (key,), value))
+                queued += 1
+
+    return fallback
+
+
+def _find_price_path(json_data: dict) -> Optional[Tuple[str, ...]]:
+    """
+    Locate the quote object: path cached for this layout, likely paths, then a bounded scan
+    """
+    layout = tuple(islice(json_data, _PRICE_JSON_LAYOUT_KEYS))
+
+    with _price_json_paths_lock:
+        path = _price_json_paths.get(layout)
+        if path is not None:
+            _price_json_paths.move_to_end(layout)
+
+    # Repeat layout: O(path length)
+    if path is not None and _has_price_fields(_resolve_json_path(json_data, path)):
+        return path
+
+    path = None
+    for candidate in _PRICE_JSON_PATHS:
+        node = _resolve_json_path(json_data, candidate)
+        if node is not None and 'tradePrice' in node:
+            path = candidate
+            break
+    if path is None:
+        path = _scan_price_path(json_data)
+
+    if path is not None:
+        with _price_json_paths_lock:
+            _price_json_paths[layout] = path
+            _price_json_paths.move_to_end(layout)
+            while len(_price_json_paths) > _PRICE_JSON_LAYOUT_CACHE_SIZE:
+                _price_json_paths.popitem(last=False)
+    return path
+
+
+def _extract_price_from_json(json_data: Any) -> Dict[str, Any]:
+    """
+    Extract price data from embedded page state JSON
+    Reads the fields of a single quote object (the dict holding tradePrice)
+    """
+    if not isinstance(json_data, dict):
+        return {}
+
+    path = _find_price_path(json_data)
+    if path is None:
+        return {}
+
+    quote = _resolve_json_path(json_data, path)
+    return {name: quote[key] for key, name in _PRICE_JSON_FIELDS if key in quote}
 
 
 def parse_chart_json(json_data: Any) -> List[Dict[str, Any]]:
@@ -283,6 +453,50 @@ def parse_chart_for_price(json_data: Any) -> Dict[str, Any]:
         return {}
 
 
+# parse_news_list selector plans, compiled once at import (each list in priority order)
+_NEWS_ITEM_PLAN = SelectorPlan([
+    '.newsList .item_news',           # Standard news list
+    '.news_list .item',               # Alternative structure
+    '.list_news .item',               # Another variant
+    'ul[class*="news"] li',           # Generic news list
+    'div[class*="news"][class*="item"]',  # Div-based items
+    'article[class*="news"]',         # Article-based structure
+    'a[href*="/news/"]',              # Fallback: any links with news-related patterns
+])
+
+_NEWS_TITLE_SELECTORS = [
+    '.link_news',
+    'a.link',
+    'a[class*="title"]',
+    'a[class*="news"]',
+    'h3 a',
+    'h4 a',
+    'a'
+]
+
+_NEWS_DATE_SELECTORS = [
+    '.txt_date',
+    '.date',
+    'span[class*="date"]',
+    'time',
+    '.info_date'
+]
+
+_NEWS_SUMMARY_SELECTORS = [
+    '.txt_summary',
+    '.summary',
+    'p[class*="summary"]',
+    'p[class*="desc"]',
+    '.description',
+    'p'
+]
+
+# Title, date and summary candidates of an item are resolved together in one pass
+_NEWS_FIELD_PLAN = SelectorPlan(_NEWS_TITLE_SELECTORS + _NEWS_DATE_SELECTORS + _NEWS_SUMMARY_SELECTORS)
+_NEWS_DATE_START = len(_NEWS_TITLE_SELECTORS)
+_NEWS_SUMMARY_START = _NEWS_DATE_START + len(_NEWS_DATE_SELECTORS)
+
+
 def parse_news_list(html: str) -> List[Dict[str, str]]:
     """
     Parse news list page - tries multiple selectors for robustness
@@ -292,90 +506,54 @@ def parse_news_list(html: str) -> List[Dict[str, str]]:
         List of {title, date, link, summary} dicts
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = parse_html(html)
         results = []
 
-        # Try multiple selectors for different page structures
-        item_selectors = [
-            '.newsList .item_news',           # Standard news list
-            '.news_list .item',               # Alternative structure
-            '.list_news .item',               # Another variant
-            'ul[class*="news"] li',           # Generic news list
-            'div[class*="news"][class*="item"]',  # Div-based items
-            'article[class*="news"]',         # Article-based structure
-        ]
-        
-        items = []
-        for selector in item_selectors:
-            items = soup.select(selector)
-            if items:
-                break
-        
-        if not items:
-            # Fallback: Try to find any links with news-related patterns
-            items = soup.select('a[href*="/news/"]')
+        # Items of the first item selector that matches (single pass over the page)
+        items = doc.select_first_matching(_NEWS_ITEM_PLAN)
 
         for item in items:
             try:
-                # Title and link - try multiple selectors
+                firsts = item.select_firsts(_NEWS_FIELD_PLAN)
+
+                # Title and link - first title selector whose first match has text
+                title = ''
                 link_elem = None
-                title_selectors = [
-                    '.link_news',
-                    'a.link',
-                    'a[class*="title"]',
-                    'a[class*="news"]',
-                    'h3 a',
-                    'h4 a',
-                    'a'
-                ]
-                
-                for selector in title_selectors:
-                    link_elem = item.select_one(selector) if item.name != 'a' else item
-                    if link_elem and link_elem.get_text(strip=True):
-                        break
+                if item.name == 'a':
+                    link_elem = item
+                    title = item.text()
+                else:
+                    for index in range(_NEWS_DATE_START):
+                        elem = firsts[index]
+                        if elem is not None:
+                            title = elem.text()
+                            if title:
+                                link_elem = elem
+                                break
                 
                 if not link_elem:
                     continue
 
-                title = link_elem.get_text(strip=True)
                 link = link_elem.get('href', '')
                 
                 # Skip if title is too short (likely not a real news title)
                 if len(title) < 10:
                     continue
 
-                # Date - try multiple selectors
+                # Date - first date selector that matches
                 date = ''
-                date_selectors = [
-                    '.txt_date',
-                    '.date',
-                    'span[class*="date"]',
-                    'time',
-                    '.info_date'
-                ]
-                
-                for selector in date_selectors:
-                    date_elem = item.select_one(selector)
-                    if date_elem:
-                        date = date_elem.get_text(strip=True)
+                for index in range(_NEWS_DATE_START, _NEWS_SUMMARY_START):
+                    date_elem = firsts[index]
+                    if date_elem is not None:
+                        date = date_elem.text()
                         break
 
-                # Summary - try multiple selectors
+                # Summary - first substantial match (not just date or short text)
                 summary = ''
-                summary_selectors = [
-                    '.txt_summary',
-                    '.summary',
-                    'p[class*="summary"]',
-                    'p[class*="desc"]',
-                    '.description',
-                    'p'
-                ]
-                
-                for selector in summary_selectors:
-                    summary_elem = item.select_one(selector)
-                    if summary_elem:
-                        summary_text = summary_elem.get_text(strip=True)
-                        # Only use if substantial (not just date or short text)
+                for index in range(_NEWS_SUMMARY_START, len(firsts)):
+                    summary_elem = firsts[index]
+                    if summary_elem is not None:
+                        summary_text = summary_elem.text()
                         if len(summary_text) > 20:
                             summary = summary_text[:300]  # Limit to 300 chars
                             break
@@ -386,11 +564,13 @@ def parse_news_list(html: str) -> List[Dict[str, str]]:
                     'link': link,
                     'summary': summary
                 })
+                if len(results) >= 10:  # Limit to 10 news items
+                    break
 
             except Exception:
                 continue
 
-        return results[:10]  # Limit to 10 news items
+        return results
 
     except Exception:
         return []
@@ -405,11 +585,11 @@ def parse_disclosure_list(html: str) -> List[Dict[str, str]]:
         List of {title, date, type} dicts
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = parse_html(html)
         results = []
 
         # Find disclosure items
-        items = soup.select('.disclosureList .item_disclosure')
+        items = doc.select('.disclosureList .item_disclosure')
 
         for item in items:
             try:
@@ -418,15 +598,15 @@ def parse_disclosure_list(html: str) -> List[Dict[str, str]]:
                 if not title_elem:
                     continue
 
-                title = title_elem.get_text(strip=True)
+                title = title_elem.text()
 
                 # Date
                 date_elem = item.select_one('.txt_date')
-                date = date_elem.get_text(strip=True) if date_elem else ''
+                date = date_elem.text() if date_elem else ''
 
                 # Type
                 type_elem = item.select_one('.txt_category')
-                disc_type = type_elem.get_text(strip=True) if type_elem else ''
+                disc_type = type_elem.text() if type_elem else ''
 
                 results.append({
                     'title': title,
@@ -452,11 +632,11 @@ def parse_talks_list(html: str) -> List[Dict[str, str]]:
         List of {content, author, date} dicts
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = parse_html(html)
         results = []
 
         # Find talk items
-        items = soup.select('.talkList .item_talk, .commentList .item_comment')
+        items = doc.select('.talkList .item_talk, .commentList .item_comment')
 
         for item in items:
             try:
@@ -465,15 +645,15 @@ def parse_talks_list(html: str) -> List[Dict[str, str]]:
                 if not content_elem:
                     continue
 
-                content = content_elem.get_text(strip=True)
+                content = content_elem.text()
 
                 # Author
                 author_elem = item.select_one('.txt_writer')
-                author = author_elem.get_text(strip=True) if author_elem else '익명'
+                author = author_elem.text() if author_elem else '익명'
 
                 # Date
                 date_elem = item.select_one('.txt_date')
-                date = date_elem.get_text(strip=True) if date_elem else ''
+                date = date_elem.text() if date_elem else ''
 
                 results.append({
                     'content': content[:200],  # Limit content length
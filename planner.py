@@ -4,7 +4,7 @@ Combines direct URL generation + Tavily search for comprehensive coverage
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 
 from config import (
@@ -25,7 +25,11 @@ from endpoints import (
     get_realtime_quote_api,
     get_finance_api_url
 )
-from tavily_search import get_tavily_urls_by_question_type, get_tavily_news_by_question_type
+from tavily_search import (
+    get_tavily_urls_by_question_type,
+    get_tavily_news_by_question_type,
+    SearchContext
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +53,11 @@ class FetchPlan:
         return self.description
 
 
-def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan]:
+def create_plan(
+    intent: IntentResult,
+    use_tavily: bool = True,
+    search_context: Optional[SearchContext] = None
+) -> List[FetchPlan]:
     """
     Create exploration plan based on intent
     Combines direct URL generation + Tavily search for comprehensive coverage
@@ -57,6 +65,7 @@ def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan
     Args:
         intent: IntentResult from intent analysis
         use_tavily: Whether to use Tavily for additional URL discovery (default: True)
+        search_context: Per-request SearchContext shared with summarize_results (optional)
 
     Returns:
         List of FetchPlan objects
@@ -73,6 +82,10 @@ def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan
     code = intent.stock_code
     question_type = intent.question_type
 
+    # Start all Tavily searches for this question (incl. the summarizer's) as one batch
+    if search_context is not None:
+        search_context.prefetch(include_url_discovery=use_tavily)
+
     # Type A: Buy recommendation - need price + news
     if question_type == QUESTION_TYPE_BUY_RECOMMENDATION:
         plans.append(FetchPlan(
@@ -89,7 +102,8 @@ def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan
                 question_type=question_type,
                 stock_name=intent.stock_name,
                 stock_code=intent.stock_code,
-                max_results=3  # Latest 3 news articles
+                max_results=3,  # Latest 3 news articles
+                context=search_context
             )
 
             for i, news in enumerate(news_results, 1):
@@ -145,7 +159,8 @@ def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan
                 question_type=question_type,
                 stock_name=intent.stock_name,
                 stock_code=intent.stock_code,
-                max_results=3  # Latest 3 news articles
+                max_results=3,  # Latest 3 news articles
+                context=search_context
             )
 
             for i, news in enumerate(news_results, 1):
@@ -200,6 +215,18 @@ def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan
     # This helps discover pages that direct URL generation might miss
     # Especially important for news/disclosures/talks which often return 404
     if use_tavily:
+        existing_urls = {plan.url for plan in plans}
+
+        # Set limit based on question type
+        # For problematic types (news/disclosures/talks), allow more Tavily URLs
+        # Tavily search stops early once this many usable URLs are found
+        if question_type in [QUESTION_TYPE_NEWS_DISCLOSURE, QUESTION_TYPE_PUBLIC_OPINION]:
+            max_tavily_additions = 8  # More URLs for problematic types
+        elif question_type == QUESTION_TYPE_BUY_RECOMMENDATION:
+            max_tavily_additions = 5  # Moderate for buy recommendations
+        else:
+            max_tavily_additions = 3  # Default for price queries
+
         try:
             logger.info(f"[Planner] Requesting Tavily URLs for {intent.stock_name}")
             print(f"[Planner] Using Tavily to find additional URLs for {intent.stock_name}")
@@ -207,7 +234,10 @@ def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan
             tavily_urls = get_tavily_urls_by_question_type(
                 question_type=question_type,
                 stock_name=intent.stock_name,
-                stock_code=intent.stock_code
+                stock_code=intent.stock_code,
+                max_urls=max_tavily_additions,
+                url_filter=lambda url: url not in existing_urls and not _is_individual_article_url(url),
+                context=search_context
             )
 
             logger.info(f"[Planner] Tavily returned {len(tavily_urls)} URLs")
@@ -220,18 +250,8 @@ def create_plan(intent: IntentResult, use_tavily: bool = True) -> List[FetchPlan
             tavily_urls = []
 
         # Add Tavily URLs that aren't duplicates
-        existing_urls = {plan.url for plan in plans}
         tavily_plan_counter = 1
 
-        # Set limit based on question type
-        # For problematic types (news/disclosures/talks), allow more Tavily URLs
-        if question_type in [QUESTION_TYPE_NEWS_DISCLOSURE, QUESTION_TYPE_PUBLIC_OPINION]:
-            max_tavily_additions = 8  # More URLs for problematic types
-        elif question_type == QUESTION_TYPE_BUY_RECOMMENDATION:
-            max_tavily_additions = 5  # Moderate for buy recommendations
-        else:
-            max_tavily_additions = 3  # Default for price queries
-
         for url in tavily_urls:
             if url not in existing_urls:
                 # Skip individual article URLs (React SPAs that require JavaScript)
@@ -0,0 +1,136 @@
+"""
+Per-host token bucket rate limiter shared by all sessions
+Callers queue for a token (bounded wait) instead of failing immediately
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config import RATE_LIMITS, RATE_LIMIT_MAX_WAIT
+
+logger = logging.getLogger(__name__)
+
+# Host key used for Tavily API calls
+TAVILY_HOST = "api.tavily.com"
+
+
+class TokenBucket:
+    """
+    Token bucket with reservations
+    Tokens refill at `rate` per second up to `capacity` (burst size)
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._acquired = 0
+        self._throttled = 0
+        self._rejected = 0
+        self._throttled_time = 0.0
+
+    def reserve(self, max_wait: float = RATE_LIMIT_MAX_WAIT) -> Optional[float]:
+        """
+        Reserve a token
+        Args:
+            max_wait: Maximum seconds the caller is willing to wait
+        Returns:
+            Seconds to wait before sending, or None if the wait would exceed max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > max_wait:
+                self._rejected += 1
+                return None
+
+            # Tokens may go negative: later callers queue behind this reservation
+            self._tokens -= 1
+            self._acquired += 1
+            if wait > 0:
+                self._throttled += 1
+                self._throttled_time += wait
+            return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter metrics
+        Returns:
+            Dict with rate, capacity, acquired, throttled, rejected, throttled_seconds
+        """
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'acquired': self._acquired,
+                'throttled': self._throttled,
+                'rejected': self._rejected,
+                'throttled_seconds': round(self._throttled_time, 3)
+            }
+
+
+# Buckets per host, created from RATE_LIMITS
+_buckets: Dict[str, TokenBucket] = {
+    host: TokenBucket(rate, capacity)
+    for host, (rate, capacity) in RATE_LIMITS.items()
+}
+
+
+def acquire_rate_limit(host: str, max_wait: float = RATE_LIMIT_MAX_WAIT) -> bool:
+    """
+    Wait for a token for host (hosts without a configured limit pass immediately)
+    Args:
+        host: Target host
+        max_wait: Maximum seconds to wait
+    Returns:
+        True if the request may be sent, False if throttled beyond max_wait
+    """
+    bucket = _buckets.get(host)
+    if bucket is None:
+        return True
+
+    wait = bucket.reserve(max_wait)
+    if wait is None:
+        logger.warning(f"[RateLimiter] {host} throttled beyond {max_wait:.1f}s")
+        return False
+
+    if wait > 0:
+        time.sleep(wait)
+    return True
+
+
+async def acquire_rate_limit_async(host: str, max_wait: float = RATE_LIMIT_MAX_WAIT) -> bool:
+    """
+    Async version of acquire_rate_limit
+    """
+    bucket = _buckets.get(host)
+    if bucket is None:
+        return True
+
+    wait = bucket.reserve(max_wait)
+    if wait is None:
+        logger.warning(f"[RateLimiter] {host} throttled beyond {max_wait:.1f}s")
+        return False
+
+    if wait > 0:
+        await asyncio.sleep(wait)
+    return True
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get metrics for all rate-limited hosts
+    Returns:
+        {host: stats dict}
+    """
+    return {host: bucket.stats() for host, bucket in _buckets.items()}
@@ -0,0 +1,238 @@
+"""
+Unified retry/backoff engine for outbound requests
+Exponential backoff with full jitter, Retry-After support, a total time budget
+per call and a per-host circuit breaker shared by all sessions
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config import (
+    DEFAULT_TIMEOUT,
+    RETRY_DELAY,
+    MAX_RETRIES,
+    RETRY_MAX_DELAY,
+    RETRY_TOTAL_BUDGET,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_COOLDOWN
+)
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying
+RETRY_STATUS_CODES = (403, 429, 500, 502, 503, 504)
+
+# Status codes that mean the host is blocking/throttling us (trip the breaker)
+BLOCKED_STATUS_CODES = (403, 429)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for one call
+    """
+    max_attempts: int = MAX_RETRIES + 1
+    base_delay: float = RETRY_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    total_budget: float = RETRY_TOTAL_BUDGET
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter
+        Args:
+            attempt: Number of attempts made so far (1-based)
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date)
+    Args:
+        value: Header value
+    Returns:
+        Delay in seconds or None
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except Exception:
+        return None
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+    Opens after CIRCUIT_BREAKER_THRESHOLD consecutive blocked responses (403/429)
+    and fails fast for CIRCUIT_BREAKER_COOLDOWN seconds; after that, requests go
+    through again and a single further blocked response re-opens it
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        cooldown: float = CIRCUIT_BREAKER_COOLDOWN
+    ):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+
+    def allow(self, host: str) -> bool:
+        """
+        Check if a request to host may be sent
+        """
+        with self._lock:
+            open_until = self._open_until.get(host)
+            if open_until is None:
+                return True
+
+            if time.time() < open_until:
+                return False
+
+            # Half-open: let requests through, re-open on the next failure
+            del self._open_until[host]
+            self._failures[host] = self.threshold - 1
+            return True
+
+    def record_success(self, host: str):
+        """
+        Reset failure count after a non-blocked response
+        """
+        with self._lock:
+            self._failures.pop(host, None)
+
+    def record_failure(self, host: str):
+        """
+        Count a blocked response, opening the circuit at the threshold
+        """
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.threshold:
+                self._open_until[host] = time.time() + self.cooldown
+                logger.warning(f"[CircuitBreaker] Open for {host} ({self.cooldown}s)")
+
+    def retry_in(self, host: str) -> float:
+        """
+        Seconds until the circuit for host closes (0 if closed)
+        """
+        with self._lock:
+            return max(0.0, self._open_until.get(host, 0) - time.time())
+
+
+_circuit_breaker = CircuitBreaker()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """
+    Get global circuit breaker shared by all sessions
+    """
+    return _circuit_breaker
+
+
+class RetryState:
+    """
+    Retry bookkeeping for a single call, shared by sync and async fetch loops
+
+    Usage:
+        retry = RetryState(url)
+        while True:
+            if not retry.allow(): fail fast
+            send request with timeout=retry.timeout()
+            delay = retry.on_status(...) / retry.on_error()
+            if delay is None: give up, else sleep(delay) and loop
+    """
+
+    def __init__(self, url: str, policy: Optional[RetryPolicy] = None):
+        self.policy = policy or RetryPolicy()
+        self.host = urlparse(url).netloc.lower()
+        self.breaker = get_circuit_breaker()
+        self.attempts = 0
+        self._start = time.monotonic()
+
+    def elapsed(self) -> float:
+        """Seconds since the call started (all attempts and backoff)"""
+        return time.monotonic() - self._start
+
+    def remaining(self) -> float:
+        """Seconds left in the total budget"""
+        return self.policy.total_budget - self.elapsed()
+
+    def allow(self) -> bool:
+        """Check the circuit breaker before an attempt (counts the attempt)"""
+        if not self.breaker.allow(self.host):
+            return False
+        self.attempts += 1
+        return True
+
+    def timeout(self) -> float:
+        """Request timeout for the next attempt, bounded by the remaining budget"""
+        return max(0.5, min(DEFAULT_TIMEOUT, self.remaining()))
+
+    def _next_delay(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Delay before the next attempt, or None when attempts or budget are exhausted
+        """
+        if self.attempts >= self.policy.max_attempts:
+            return None
+
+        delay = self.policy.backoff(self.attempts)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        # Sleeping past the budget would leave no time for the next attempt
+        if delay >= self.remaining():
+            return None
+        return delay
+
+    def on_status(self, status_code: int, retry_after_header: Optional[str] = None) -> Optional[float]:
+        """
+        Record a response
+        Args:
+            status_code: HTTP status code
+            retry_after_header: Retry-After header value (optional)
+        Returns:
+            Delay before retrying, or None if the response should be returned as is
+        """
+        if status_code in BLOCKED_STATUS_CODES:
+            self.breaker.record_failure(self.host)
+        else:
+            self.breaker.record_success(self.host)
+
+        if status_code not in RETRY_STATUS_CODES:
+            return None
+
+        return self._next_delay(parse_retry_after(retry_after_header))
+
+    def on_error(self) -> Optional[float]:
+        """
+        Record a network error/timeout
+        Returns:
+            Delay before retrying, or None to give up
+        """
+        return self._next_delay()
+
+    def circuit_open_message(self) -> str:
+        """
+        Error message for a call rejected by the circuit breaker
+        """
+        retry_in = self.breaker.retry_in(self.host)
+        return f"일시적으로 접근 차단됨 ({self.host}, {retry_in:.0f}초 후 재시도 가능)"
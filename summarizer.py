@@ -4,10 +4,17 @@ Converts fetch results into evidence snippets
 """
 
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import hashlib
 
+from cache_manager import get_cache
 from daum_fetch import FetchResult
+from config import CACHE_TTL_PRICE, PARSE_CACHE_ENABLED, PARSE_PROCESS_WORKERS, REALTIME_DEADLINE
+from hedging import SourceStats, mark_served_from_cache, run_hedged
+from tavily_search import search_investor_opinions, SearchContext
 import parsers
+import parse_executor
 
 # Daum Fetch imports (requests 기반 - Streamlit Cloud 호환)
 import daum_fetch
@@ -25,6 +32,37 @@ class SourceSummary:
     evidence_snippet: str
 
 
+def _parse_html(parser_name: str, url: str, content: str) -> Any:
+    """
+    Run an HTML parser, memoized by URL + content hash + parser name
+    Repeat pages (same body, any session) skip HTML parsing entirely;
+    misses run in the parse process pool when enabled
+
+    Args:
+        parser_name: Parser function name in parsers.py (e.g. parse_news_list)
+        url: Page URL
+        content: Page HTML
+
+    Returns:
+        Parser result
+    """
+    if not PARSE_CACHE_ENABLED or not content:
+        return parse_executor.run_parser(parser_name, content)
+
+    content_hash = hashlib.blake2b(
+        content.encode('utf-8', 'surrogatepass'), digest_size=16
+    ).hexdigest()
+
+    cache = get_cache()
+    parsed = cache.get_parsed(url, content_hash, parser_name)
+    if parsed is None:
+        parsed = parse_executor.run_parser(parser_name, content)
+        # Empty results are not memoized (may be a parse the pool gave up on)
+        if parsed:
+            cache.set_parsed(url, content_hash, parser_name, parsed)
+    return parsed
+
+
 def _summarize_price_data(data: Dict[str, Any]) -> str:
     """
     Create evidence snippet for price data
@@ -235,13 +273,75 @@ def _summarize_chart_data(chart_list: List[Dict[str, Any]]) -> str:
     return snippet
 
 
-def get_realtime_stock_summary_from_daum(stock_code: str) -> Optional[SourceSummary]:
+# 실시간 시세 소스별 성공률/지연 통계 (hedge delay 자동 조정용)
+_realtime_source_stats = SourceStats()
+
+
+def get_realtime_source_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get success/latency statistics of realtime quote sources
+    Returns:
+        {source_name: stats dict}
+    """
+    return _realtime_source_stats.snapshot()
+
+
+def _fetch_realtime_source(
+    url: str,
+    is_json: bool = False,
+    prefetched: Optional[Dict[str, FetchResult]] = None
+) -> FetchResult:
+    """
+    Get a realtime quote source, reusing this request's results when available
+    Otherwise goes through the shared fetch cache with the price TTL
+
+    Args:
+        url: Source URL
+        is_json: Whether the source is a JSON API
+        prefetched: {url: FetchResult} already fetched for this request (optional)
+
+    Returns:
+        FetchResult object
+    """
+    if prefetched:
+        result = prefetched.get(url)
+        if result is not None and result.success:
+            if (is_json and result.json_data) or (not is_json and result.content):
+                mark_served_from_cache()
+                return result
+
+    result = daum_fetch.fetch(url, is_json=is_json, use_cache=True, cache_ttl=CACHE_TTL_PRICE)
+    if result.from_cache:
+        mark_served_from_cache()
+    return result
+
+
+def get_realtime_source_urls(stock_code: str) -> List[str]:
+    """
+    URLs the realtime quote reads, in fallback order (finance API, chart API, price page)
+    Args:
+        stock_code: Stock code
+    Returns:
+        List of URLs
+    """
+    return [
+        endpoints.get_finance_api_url(stock_code),
+        endpoints.get_chart_api_url(stock_code, "days"),
+        endpoints.get_price_url(stock_code),
+    ]
+
+
+def get_realtime_stock_summary_from_daum(
+    stock_code: str,
+    prefetched: Optional[Dict[str, FetchResult]] = None
+) -> Optional[SourceSummary]:
     """
     다음 금융에서 실시간 주식 데이터를 가져와서 SourceSummary로 변환
     requests를 사용하여 API/HTML 파싱 (Streamlit Cloud 호환)
     
     Args:
         stock_code: 종목 코드 (예: "005930")
+        prefetched: 현재 요청에서 이미 수집한 결과 {url: FetchResult} (optional)
     
     Returns:
         SourceSummary 객체 또는 None (실패 시)
@@ -250,35 +350,44 @@ def get_realtime_stock_summary_from_daum(stock_code: str) -> Optional[SourceSumm
     logger = logging.getLogger(__name__)
     
     try:
-        # 1. Finance API 시도 (가장 안정적, 테스트 완료)
-        api_url = endpoints.get_finance_api_url(stock_code)
-        result = daum_fetch.fetch(api_url, is_json=True, use_cache=False)
-        
-        data = None
-        if result.success and result.json_data:
-            data = parsers.parse_api_quote(result.json_data)
-            if data:
-                logger.info("✅ Finance API로 데이터 가져오기 성공")
-        
-        # 2. Chart API 시도 (폴백)
-        if not data:
-            chart_url = endpoints.get_chart_api_url(stock_code, "days")
-            result = daum_fetch.fetch(chart_url, is_json=True, use_cache=False)
-            
+        api_url, chart_url, price_url = get_realtime_source_urls(stock_code)
+
+        # 1. Finance API (가장 안정적, 테스트 완료)
+        def _from_finance_api():
+            result = _fetch_realtime_source(api_url, is_json=True, prefetched=prefetched)
             if result.success and result.json_data:
-                data = parsers.parse_chart_for_price(result.json_data)
-                if data:
-                    logger.info("✅ Chart API로 데이터 가져오기 성공")
-        
-        # 3. HTML 페이지 파싱 시도 (최후 수단)
-        if not data:
-            price_url = endpoints.get_price_url(stock_code)
-            result = daum_fetch.fetch(price_url, use_cache=False)
-            
+                return parsers.parse_api_quote(result.json_data) or None
+            return None
+
+        # 2. Chart API (폴백)
+        def _from_chart_api():
+            result = _fetch_realtime_source(chart_url, is_json=True, prefetched=prefetched)
+            if result.success and result.json_data:
+                return parsers.parse_chart_for_price(result.json_data) or None
+            return None
+
+        # 3. HTML 페이지 파싱 (최후 수단)
+        def _from_html():
+            result = _fetch_realtime_source(price_url, prefetched=prefetched)
             if result.success:
-                data = parsers.parse_price_page(result.content)
-                if data:
-                    logger.info("✅ HTML 파싱으로 데이터 가져오기 성공")
+                return _parse_html("parse_price_page", result.url or price_url, result.content) or None
+            return None
+
+        # 응답이 늦으면 다음 소스를 병렬로 시작 (hedged), 먼저 성공한 결과 사용
+        winner = run_hedged(
+            [
+                ("finance_api", _from_finance_api),
+                ("chart_api", _from_chart_api),
+                ("html", _from_html),
+            ],
+            stats=_realtime_source_stats,
+            deadline=REALTIME_DEADLINE
+        )
+
+        data = None
+        if winner:
+            source_name, data = winner
+            logger.info(f"✅ {source_name}로 데이터 가져오기 성공")
         
         if not data:
             logger.warning(f"Failed to get stock data from Daum for {stock_code}")
@@ -297,7 +406,10 @@ def get_realtime_stock_summary_from_daum(stock_code: str) -> Optional[SourceSumm
         return None
 
 
-def get_realtime_stock_summary(stock_code: str) -> Optional[SourceSummary]:
+def get_realtime_stock_summary(
+    stock_code: str,
+    prefetched: Optional[Dict[str, FetchResult]] = None
+) -> Optional[SourceSummary]:
     """
     다음 금융에서 실시간 주식 데이터를 가져와서 SourceSummary로 변환
     
@@ -305,6 +417,7 @@ def get_realtime_stock_summary(stock_code: str) -> Optional[SourceSummary]:
     
     Args:
         stock_code: 종목 코드 (예: "005930")
+        prefetched: 현재 요청에서 이미 수집한 결과 {url: FetchResult} (optional)
     
     Returns:
         SourceSummary 객체 또는 None (실패 시)
@@ -313,7 +426,7 @@ def get_realtime_stock_summary(stock_code: str) -> Optional[SourceSummary]:
     logger = logging.getLogger(__name__)
     
     # 다음 금융 (Selenium)만 사용
-    daum_result = get_realtime_stock_summary_from_daum(stock_code)
+    daum_result = get_realtime_stock_summary_from_daum(stock_code, prefetched=prefetched)
     
     if daum_result:
         logger.info("✅ Successfully got data from Daum Finance (finance.daum.net)")
@@ -323,7 +436,11 @@ def get_realtime_stock_summary(stock_code: str) -> Optional[SourceSummary]:
         return None
 
 
-def get_talks_summary_from_daum(stock_code: str, stock_name: str = None) -> Optional[SourceSummary]:
+def get_talks_summary_from_daum(
+    stock_code: str,
+    stock_name: str = None,
+    search_context: Optional[SearchContext] = None
+) -> Optional[SourceSummary]:
     """
     Tavily를 사용하여 종목 관련 투자자 의견/분석을 검색
     다음 금융 토론 페이지가 404를 반환하므로 Tavily로 대체
@@ -331,65 +448,211 @@ def get_talks_summary_from_daum(stock_code: str, stock_name: str = None) -> Opti
     Args:
         stock_code: 종목 코드
         stock_name: 종목명 (optional)
+        search_context: 요청 단위 SearchContext (planner에서 미리 검색한 결과 재사용, optional)
     
     Returns:
         SourceSummary 객체 또는 None (실패 시)
     """
     import logging
-    import os
     logger = logging.getLogger(__name__)
     
-    try:
-        from tavily import TavilyClient
-        
-        # Tavily API 키 확인
-        tavily_api_key = os.getenv('TAVILY_API_KEY')
-        if not tavily_api_key:
-            logger.warning("Tavily API key not found, skipping investor opinions search")
-            return None
-        
-        client = TavilyClient(api_key=tavily_api_key)
-        
-        # 검색 쿼리 구성
-        search_query = f"{stock_name or stock_code} 종목 투자 의견 분석 전망"
-        
-        # Tavily 검색
-        response = client.search(
-            query=search_query,
-            search_depth="basic",
-            max_results=3
-        )
-        
-        if not response or 'results' not in response or len(response['results']) == 0:
-            logger.warning(f"No investor opinions found via Tavily for {stock_code}")
-            return None
+    # Tavily 검색 (응답 캐시, rate limiter 적용)
+    results = search_investor_opinions(
+        stock_name=stock_name,
+        stock_code=stock_code,
+        max_results=3,
+        context=search_context
+    )
+    
+    if not results:
+        logger.warning(f"No investor opinions found via Tavily for {stock_code}")
+        return None
+    
+    # 검색 결과 요약
+    snippets = []
+    for i, result in enumerate(results, 1):
+        title = result.get('title', '제목 없음')
+        content = (result.get('content') or '')[:150]
         
-        # 검색 결과 요약
-        snippets = []
-        for i, result in enumerate(response['results'][:3], 1):
-            title = result.get('title', '제목 없음')
-            content = result.get('content', '')[:150]
+        snippet_line = f"{i}. {title}"
+        if content:
+            snippet_line += f"\n   {content}..."
+        snippets.append(snippet_line)
+    
+    snippet = "\n\n".join(snippets)
+    
+    logger.info(f"✅ Tavily로 {len(results)}개의 투자 의견 검색 완료")
+    
+    return SourceSummary(
+        source_url="Tavily 검색 결과",
+        source_type="투자자 의견 및 분석",
+        key_data={'results': results},
+        evidence_snippet=f"💬 **투자자 의견 및 분석:**\n\n{snippet}"
+    )
+
+
+def summarize_fetch_result(fetch_result: Optional[FetchResult], plan) -> Optional[SourceSummary]:
+    """
+    Summarize a single fetch result into an evidence snippet
+
+    Args:
+        fetch_result: FetchResult for the plan (not needed for Tavily news plans)
+        plan: FetchPlan that produced the result
+
+    Returns:
+        SourceSummary or None (failed fetch / no valid data)
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+
+    # Special handling for Tavily news - use pre-fetched content OR fetch actual page
+    if plan.parser_name == "tavily_news":
+        try:
+            # Use Tavily's content if available and substantial
+            content_text = plan.content if hasattr(plan, 'content') and plan.content else ""
             
-            snippet_line = f"{i}. {title}"
-            if content:
-                snippet_line += f"\n   {content}..."
-            snippets.append(snippet_line)
-        
-        snippet = "\n\n".join(snippets)
-        
-        logger.info(f"✅ Tavily로 {len(response['results'])}개의 투자 의견 검색 완료")
-        
-        return SourceSummary(
-            source_url="Tavily 검색 결과",
-            source_type="투자자 의견 및 분석",
-            key_data={'results': response['results'][:3]},
-            evidence_snippet=f"💬 **투자자 의견 및 분석:**\n\n{snippet}"
-        )
-    except ImportError:
-        logger.warning("Tavily not installed, skipping investor opinions search")
+            # If Tavily content is too short or empty, try fetching the actual page
+            if len(content_text.strip()) < 100:
+                logger.info(f"Tavily content too short ({len(content_text)} chars), fetching actual page: {plan.url}")
+                
+                # Try to fetch and parse the news page
+                from daum_fetch import fetch
+                
+                # Only fetch if it's a news list page (not individual article)
+                if '/news' in plan.url and not any(x in plan.url for x in ['/stock/', '/economy/', '/industry/', '/world/']):
+                    fetch_result_actual = fetch(plan.url, use_cache=True)
+                    
+                    if fetch_result_actual.success and fetch_result_actual.content:
+                        # Try to parse news list
+                        news_list = _parse_html(
+                            "parse_news_list",
+                            fetch_result_actual.url or plan.url,
+                            fetch_result_actual.content
+                        )
+                        
+                        if news_list and len(news_list) > 0:
+                            # Use top 3 news from the page
+                            news_snippets = []
+                            for i, news_item in enumerate(news_list[:3], 1):
+                                title = news_item.get('title', '')
+                                date = news_item.get('date', '')
+                                snippet_text = f"{i}. **{title}**"
+                                if date:
+                                    snippet_text += f" ({date})"
+                                news_snippets.append(snippet_text)
+                            
+                            snippet = "📰 **최신 뉴스:**\n" + "\n".join(news_snippets)
+                            parsed_data = {
+                                "title": plan.title or "뉴스 목록",
+                                "url": plan.url,
+                                "news_list": news_list[:3]
+                            }
+                            
+                            logger.info(f"Successfully fetched and parsed {len(news_list[:3])} news items from {plan.url}")
+                            return SourceSummary(
+                                source_url=plan.url,
+                                source_type="뉴스",
+                                key_data=parsed_data,
+                                evidence_snippet=snippet
+                            )
+            
+            # Use Tavily content if available
+            if plan.title and content_text:
+                # Extract first 300 chars of content for snippet
+                content_preview = content_text[:300].replace('\n', ' ').strip()
+                if len(content_preview) > 0:
+                    snippet = f"📰 **{plan.title}**\n\n{content_preview}..."
+                else:
+                    snippet = f"📰 **{plan.title}**"
+            elif plan.title:
+                snippet = f"📰 **{plan.title}**"
+            else:
+                # Skip if no title and no content
+                logger.warning(f"Skipping Tavily news with no title and no content: {plan.url}")
+                return None
+            
+            parsed_data = {
+                "title": plan.title,
+                "url": plan.url,
+                "content": content_text[:1000] if content_text else ""  # First 1000 chars for LLM
+            }
+            source_type = "뉴스"
+
+            logger.info(f"Added Tavily news: {plan.title} ({len(content_text)} chars)")
+            return SourceSummary(
+                source_url=plan.url,
+                source_type=source_type,
+                key_data=parsed_data,
+                evidence_snippet=snippet
+            )
+        except Exception as e:
+            logger.error(f"Error processing Tavily news: {str(e)}", exc_info=True)
+            return None  # Skip on error
+
+    if fetch_result is None or not fetch_result.success:
+        # Skip failed fetches instead of adding them
+        # This allows graceful degradation
         return None
+
+    # Parse based on parser_name
+    parser_name = plan.parser_name
+    page_url = fetch_result.url or plan.url
+    parsed_data = None
+
+    try:
+        if parser_name == "parse_price_page":
+            parsed_data = _parse_html("parse_price_page", page_url, fetch_result.content or "")
+            snippet = _summarize_price_data(parsed_data)
+            source_type = "시세 정보"
+
+        elif parser_name == "parse_chart_for_price":
+            parsed_data = parsers.parse_chart_for_price(fetch_result.json_data or {})
+            snippet = _summarize_price_data(parsed_data)
+            source_type = "시세 정보 (차트 API)"
+
+        elif parser_name == "parse_api_quote":
+            parsed_data = parsers.parse_api_quote(fetch_result.json_data or {})
+            snippet = _summarize_price_data(parsed_data)
+            source_type = "시세 정보 (API)"
+
+        elif parser_name == "parse_news_list":
+            parsed_data = _parse_html("parse_news_list", page_url, fetch_result.content or "")
+            snippet = _summarize_news_data(parsed_data)
+            source_type = "뉴스"
+
+        elif parser_name == "parse_talks_list":
+            parsed_data = _parse_html("parse_talks_list", page_url, fetch_result.content or "")
+            snippet = _summarize_talks_data(parsed_data)
+            source_type = "토론/의견"
+
+        elif parser_name == "parse_disclosure_list":
+            parsed_data = _parse_html("parse_disclosure_list", page_url, fetch_result.content or "")
+            snippet = _summarize_disclosure_data(parsed_data)
+            source_type = "공시"
+
+        elif parser_name == "parse_chart_json":
+            parsed_data = parsers.parse_chart_json(fetch_result.json_data or {})
+            snippet = _summarize_chart_data(parsed_data)
+            source_type = "차트"
+
+        else:
+            parsed_data = {}
+            snippet = "알 수 없는 데이터 형식입니다."
+            source_type = plan.description
+
+        # Only add if we got valid data
+        if parsed_data or snippet != "시세 정보를 확인할 수 없습니다.":
+            return SourceSummary(
+                source_url=page_url,
+                source_type=source_type,
+                key_data=parsed_data if isinstance(parsed_data, dict) else {"data": parsed_data},
+                evidence_snippet=snippet
+            )
+        return None
+
     except Exception as e:
-        logger.error(f"Failed to search investor opinions via Tavily: {str(e)}")
+        # Skip parsing errors instead of adding them
+        # This allows graceful degradation
         return None
 
 
@@ -398,7 +661,8 @@ def summarize_results(
     plans: List,
     stock_code: Optional[str] = None,
     stock_name: Optional[str] = None,
-    include_realtime: bool = True
+    include_realtime: bool = True,
+    search_context: Optional[SearchContext] = None
 ) -> List[SourceSummary]:
     """
     Summarize all fetch results into evidence snippets
@@ -410,6 +674,7 @@ def summarize_results(
         stock_code: 종목 코드 (실시간 데이터 가져오기용, optional)
         stock_name: 종목명 (optional, Tavily 검색에 사용)
         include_realtime: 실시간 데이터 포함 여부 (기본: True)
+        search_context: 요청 단위 SearchContext (optional, create_plan과 공유)
 
     Returns:
         List of SourceSummary objects (only successful ones)
@@ -422,165 +687,37 @@ def summarize_results(
     if include_realtime and stock_code:
         logger.info(f"📊 Fetching stock data from Daum Finance for {stock_code}")
         
-        # 시세 데이터
-        realtime_summary = get_realtime_stock_summary(stock_code)
+        # 시세 데이터 (이번 요청에서 이미 수집한 결과 재사용)
+        prefetched = {
+            (fetch_result.url or plan.url): fetch_result
+            for fetch_result, plan in fetch_results
+            if fetch_result.success
+        }
+        realtime_summary = get_realtime_stock_summary(stock_code, prefetched=prefetched)
         if realtime_summary:
             summaries.append(realtime_summary)
             logger.info(f"✅ Added stock price data from finance.daum.net")
         
         # 투자자 의견 (Tavily 검색)
         logger.info(f"💬 Searching investor opinions via Tavily for {stock_code}")
-        talks_summary = get_talks_summary_from_daum(stock_code, stock_name)
+        talks_summary = get_talks_summary_from_daum(stock_code, stock_name, search_context=search_context)
         if talks_summary:
             summaries.append(talks_summary)
             logger.info(f"✅ Added investor opinions via Tavily search")
 
     # 2. 기존 Daum Finance 데이터 처리
-    for fetch_result, plan in fetch_results:
-        # Special handling for Tavily news - use pre-fetched content OR fetch actual page
-        if plan.parser_name == "tavily_news":
-            try:
-                # Use Tavily's content if available and substantial
-                content_text = plan.content if hasattr(plan, 'content') and plan.content else ""
-                
-                # If Tavily content is too short or empty, try fetching the actual page
-                if len(content_text.strip()) < 100:
-                    logger.info(f"Tavily content too short ({len(content_text)} chars), fetching actual page: {plan.url}")
-                    
-                    # Try to fetch and parse the news page
-                    from daum_fetch import fetch
-                    
-                    # Only fetch if it's a news list page (not individual article)
-                    if '/news' in plan.url and not any(x in plan.url for x in ['/stock/', '/economy/', '/industry/', '/world/']):
-                        fetch_result_actual = fetch(plan.url, use_cache=True)
-                        
-                        if fetch_result_actual.success and fetch_result_actual.content:
-                            # Try to parse news list
-                            news_list = parsers.parse_news_list(fetch_result_actual.content)
-                            
-                            if news_list and len(news_list) > 0:
-                                # Use top 3 news from the page
-                                news_snippets = []
-                                for i, news_item in enumerate(news_list[:3], 1):
-                                    title = news_item.get('title', '')
-                                    date = news_item.get('date', '')
-                                    snippet_text = f"{i}. **{title}**"
-                                    if date:
-                                        snippet_text += f" ({date})"
-                                    news_snippets.append(snippet_text)
-                                
-                                snippet = "📰 **최신 뉴스:**\n" + "\n".join(news_snippets)
-                                parsed_data = {
-                                    "title": plan.title or "뉴스 목록",
-                                    "url": plan.url,
-                                    "news_list": news_list[:3]
-                                }
-                                
-                                summaries.append(SourceSummary(
-                                    source_url=plan.url,
-                                    source_type="뉴스",
-                                    key_data=parsed_data,
-                                    evidence_snippet=snippet
-                                ))
-                                logger.info(f"Successfully fetched and parsed {len(news_list[:3])} news items from {plan.url}")
-                                continue
-                
-                # Use Tavily content if available
-                if plan.title and content_text:
-                    # Extract first 300 chars of content for snippet
-                    content_preview = content_text[:300].replace('\n', ' ').strip()
-                    if len(content_preview) > 0:
-                        snippet = f"📰 **{plan.title}**\n\n{content_preview}..."
-                    else:
-                        snippet = f"📰 **{plan.title}**"
-                elif plan.title:
-                    snippet = f"📰 **{plan.title}**"
-                else:
-                    # Skip if no title and no content
-                    logger.warning(f"Skipping Tavily news with no title and no content: {plan.url}")
-                    continue
-                
-                parsed_data = {
-                    "title": plan.title,
-                    "url": plan.url,
-                    "content": content_text[:1000] if content_text else ""  # First 1000 chars for LLM
-                }
-                source_type = "뉴스"
-
-                summaries.append(SourceSummary(
-                    source_url=plan.url,
-                    source_type=source_type,
-                    key_data=parsed_data,
-                    evidence_snippet=snippet
-                ))
-                logger.info(f"Added Tavily news: {plan.title} ({len(content_text)} chars)")
-            except Exception as e:
-                logger.error(f"Error processing Tavily news: {str(e)}", exc_info=True)
-                pass  # Skip on error
-            continue  # Move to next result
-
-        if not fetch_result.success:
-            # Skip failed fetches instead of adding them
-            # This allows graceful degradation
-            continue
-
-        # Parse based on parser_name
-        parser_name = plan.parser_name
-        parsed_data = None
-
-        try:
-            if parser_name == "parse_price_page":
-                parsed_data = parsers.parse_price_page(fetch_result.content or "")
-                snippet = _summarize_price_data(parsed_data)
-                source_type = "시세 정보"
-
-            elif parser_name == "parse_chart_for_price":
-                parsed_data = parsers.parse_chart_for_price(fetch_result.json_data or {})
-                snippet = _summarize_price_data(parsed_data)
-                source_type = "시세 정보 (차트 API)"
-
-            elif parser_name == "parse_api_quote":
-                parsed_data = parsers.parse_api_quote(fetch_result.json_data or {})
-                snippet = _summarize_price_data(parsed_data)
-                source_type = "시세 정보 (API)"
-
-            elif parser_name == "parse_news_list":
-                parsed_data = parsers.parse_news_list(fetch_result.content or "")
-                snippet = _summarize_news_data(parsed_data)
-                source_type = "뉴스"
-
-            elif parser_name == "parse_talks_list":
-                parsed_data = parsers.parse_talks_list(fetch_result.content or "")
-                snippet = _summarize_talks_data(parsed_data)
-                source_type = "토론/의견"
-
-            elif parser_name == "parse_disclosure_list":
-                parsed_data = parsers.parse_disclosure_list(fetch_result.content or "")
-                snippet = _summarize_disclosure_data(parsed_data)
-                source_type = "공시"
-
-            elif parser_name == "parse_chart_json":
-                parsed_data = parsers.parse_chart_json(fetch_result.json_data or {})
-                snippet = _summarize_chart_data(parsed_data)
-                source_type = "차트"
-
-            else:
-                parsed_data = {}
-                snippet = "알 수 없는 데이터 형식입니다."
-                source_type = plan.description
-
-            # Only add if we got valid data
-            if parsed_data or snippet != "시세 정보를 확인할 수 없습니다.":
-                summaries.append(SourceSummary(
-                    source_url=fetch_result.url or plan.url,
-                    source_type=source_type,
-                    key_data=parsed_data if isinstance(parsed_data, dict) else {"data": parsed_data},
-                    evidence_snippet=snippet
-                ))
+    # (프로세스 풀 사용 시 페이지들을 동시에 워커 프로세스로 보내 파싱)
+    if parse_executor.is_enabled() and len(fetch_results) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(PARSE_PROCESS_WORKERS, len(fetch_results)),
+            thread_name_prefix="summarize"
+        ) as executor:
+            plan_summaries = list(executor.map(lambda item: summarize_fetch_result(*item), fetch_results))
+    else:
+        plan_summaries = [summarize_fetch_result(fetch_result, plan) for fetch_result, plan in fetch_results]
 
-        except Exception as e:
-            # Skip parsing errors instead of adding them
-            # This allows graceful degradation
-            continue
+    for summary in plan_summaries:
+        if summary:
+            summaries.append(summary)
 
     return summaries
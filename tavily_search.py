@@ -4,9 +4,201 @@ Tavily is ONLY used for finding URLs within finance.daum.net
 Actual data collection is done by web_fetch with allowlist enforcement
 """
 
-from typing import List, Optional
+import json
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from config import get_env
+from config import (
+    get_env,
+    TAVILY_MAX_WORKERS,
+    TAVILY_DEADLINE,
+    TAVILY_MAX_CONTEXTS,
+    TAVILY_CACHE_TTL,
+    TAVILY_CACHE_TTL_DEFAULT,
+    TAVILY_CACHE_MAX_ENTRIES,
+    TAVILY_CACHE_MAX_BYTES,
+    TAVILY_CACHE_DISK_PATH
+)
+from cache_manager import CacheManager, create_disk_store
+from rate_limiter import acquire_rate_limit, TAVILY_HOST
+
+# Shared Tavily client (created on first use, reused by all sessions)
+_client = None
+_client_lock = threading.Lock()
+
+# Dedicated Tavily response cache (separate capacity from page cache, optional disk tier)
+# Entries are keyed by TAVILY_CACHE_URL + normalized search parameters
+TAVILY_CACHE_URL = "tavily://search"
+_tavily_cache = CacheManager(
+    max_entries=TAVILY_CACHE_MAX_ENTRIES,
+    max_bytes=TAVILY_CACHE_MAX_BYTES,
+    l2=create_disk_store(TAVILY_CACHE_DISK_PATH)
+)
+_tavily_cache.warm_start()
+
+
+def _get_client():
+    """
+    Get or create the shared TavilyClient
+    Returns:
+        TavilyClient instance, or None if the API key is not set
+    Raises:
+        ImportError: If tavily-python is not installed
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    from tavily import TavilyClient
+
+    with _client_lock:
+        if _client is None:
+            api_key = get_env('TAVILY_API_KEY')
+            if not api_key:
+                return None
+            _client = TavilyClient(api_key=api_key)
+    return _client
+
+
+def _normalize_query(query: str) -> str:
+    """
+    Normalize a search query for cache keys (Unicode NFKC, case, whitespace)
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def get_tavily_cache_ttl(question_type: Optional[str]) -> int:
+    """
+    Get Tavily cache TTL for a question type
+    Args:
+        question_type: Question type (A_매수판단형, B_시세상태형, etc.)
+    Returns:
+        Cache TTL in seconds
+    """
+    return TAVILY_CACHE_TTL.get(question_type, TAVILY_CACHE_TTL_DEFAULT)
+
+
+def get_tavily_cache_stats() -> Dict[str, Any]:
+    """
+    Get Tavily response cache statistics (hits, misses, hit_rate, ...)
+    """
+    return _tavily_cache.stats()
+
+
+def _cached_search(cache_ttl: Optional[int] = None, **search_params) -> Optional[List[Dict[str, Any]]]:
+    """
+    Run a Tavily search through the response cache
+    Concurrent identical searches are coalesced into one API call
+
+    Args:
+        cache_ttl: Cache TTL in seconds (default: TAVILY_CACHE_TTL_DEFAULT)
+        **search_params: Arguments for TavilyClient.search (query, max_results, ...)
+
+    Returns:
+        List of raw result dicts, or None if Tavily is unavailable or rate limited
+
+    Raises:
+        ImportError: If tavily-python is not installed
+    """
+    logger = logging.getLogger(__name__)
+
+    key_params = dict(search_params, query=_normalize_query(search_params['query']))
+
+    cached = _tavily_cache.get(TAVILY_CACHE_URL, key_params)
+    if cached is not None:
+        logger.info(f"[Tavily] Cache hit: {search_params['query']}")
+        return cached
+
+    def _load() -> Optional[List[Dict[str, Any]]]:
+        # Another caller may have filled the cache while we waited (already counted as a miss)
+        cached = _tavily_cache.peek(TAVILY_CACHE_URL, key_params)
+        if cached is not None:
+            return cached
+
+        client = _get_client()
+        if client is None:
+            logger.warning("⚠️ TAVILY_API_KEY not found - skipping Tavily search")
+            print("⚠️ [Tavily] API 키가 설정되지 않았습니다. .env 파일을 확인하세요.")
+            return None
+
+        # Wait for a token from the shared Tavily rate limiter (bounded wait)
+        if not acquire_rate_limit(TAVILY_HOST):
+            logger.warning(f"[Tavily] Rate limited - skipping search: {search_params['query']}")
+            return None
+
+        response = client.search(**search_params)
+        results = (response or {}).get('results', [])
+        _tavily_cache.set(
+            TAVILY_CACHE_URL,
+            results,
+            ttl=cache_ttl or TAVILY_CACHE_TTL_DEFAULT,
+            params=key_params
+        )
+        return results
+
+    return _tavily_cache.single_flight(TAVILY_CACHE_URL, _load, key_params)
+
+
+def _search(
+    context: Optional["SearchContext"],
+    cache_ttl: Optional[int] = None,
+    **search_params
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Run a Tavily search through the request's SearchContext if given, else the cache directly
+    """
+    if context is not None:
+        return context.search(cache_ttl=cache_ttl, **search_params)
+    return _cached_search(cache_ttl=cache_ttl, **search_params)
+
+
+def _finance_search_params(
+    query: str,
+    stock_name: Optional[str],
+    stock_code: Optional[str],
+    max_results: int
+) -> Dict[str, Any]:
+    """
+    Build TavilyClient.search arguments for a finance.daum.net search
+    """
+    # Build search query - enforce site:finance.daum.net
+    search_query = f"site:finance.daum.net {query}"
+
+    # Add stock context if available
+    if stock_name:
+        search_query += f" {stock_name}"
+    if stock_code:
+        search_query += f" {stock_code}"
+
+    # CRITICAL: Only use include_domains to ensure finance.daum.net only
+    return {
+        'query': search_query,
+        'search_depth': "basic",
+        'max_results': max_results,
+        'include_domains': ["finance.daum.net"],
+        'include_answer': False,  # Don't use Tavily's answer (we analyze ourselves)
+        'include_raw_content': True,  # ✅ Include content for better data
+    }
+
+
+def _opinion_search_params(
+    stock_name: Optional[str],
+    stock_code: Optional[str],
+    max_results: int
+) -> Dict[str, Any]:
+    """
+    Build TavilyClient.search arguments for the investor opinions search
+    """
+    return {
+        'query': f"{stock_name or stock_code} 종목 투자 의견 분석 전망",
+        'search_depth': "basic",
+        'max_results': max_results
+    }
 
 
 @dataclass
@@ -24,7 +216,9 @@ def search_daum_finance_urls(
     query: str,
     stock_name: Optional[str] = None,
     stock_code: Optional[str] = None,
-    max_results: int = 5
+    max_results: int = 5,
+    cache_ttl: Optional[int] = None,
+    context: Optional["SearchContext"] = None
 ) -> List[TavilySearchResult]:
     """
     Search for URLs within finance.daum.net using Tavily
@@ -37,52 +231,29 @@ def search_daum_finance_urls(
         stock_name: Stock name (optional, for context)
         stock_code: Stock code (optional, for context)
         max_results: Maximum number of URLs to return (default: 5)
+        cache_ttl: Response cache TTL in seconds (default: TAVILY_CACHE_TTL_DEFAULT)
+        context: Per-request SearchContext for deduplication (optional)
 
     Returns:
         List of TavilySearchResult objects with URLs only
     """
-    import logging
     logger = logging.getLogger(__name__)
     
     try:
-        from tavily import TavilyClient
-
-        # Get API key
-        api_key = get_env('TAVILY_API_KEY')
-        if not api_key:
-            logger.warning("⚠️ TAVILY_API_KEY not found - skipping Tavily search")
-            print("⚠️ [Tavily] API 키가 설정되지 않았습니다. .env 파일을 확인하세요.")
-            return []
-
-        # Initialize client
-        client = TavilyClient(api_key=api_key)
-
-        # Build search query - enforce site:finance.daum.net
-        search_query = f"site:finance.daum.net {query}"
-
-        # Add stock context if available
-        if stock_name:
-            search_query += f" {stock_name}"
-        if stock_code:
-            search_query += f" {stock_code}"
+        search_params = _finance_search_params(query, stock_name, stock_code, max_results)
+        search_query = search_params['query']
 
         logger.info(f"🔍 [Tavily] Searching: {search_query}")
         print(f"🔍 [Tavily] Searching: {search_query}")
 
-        # Execute search
-        # CRITICAL: Only use include_domains to ensure finance.daum.net only
-        response = client.search(
-            query=search_query,
-            search_depth="basic",
-            max_results=max_results,
-            include_domains=["finance.daum.net"],
-            include_answer=False,  # Don't use Tavily's answer (we analyze ourselves)
-            include_raw_content=True,  # ✅ Include content for better data
-        )
+        # Execute search (served from the request context / response cache when possible)
+        items = _search(context, cache_ttl=cache_ttl, **search_params)
+        if items is None:
+            return []
 
         # Extract URLs with content
         results = []
-        for item in response.get('results', []):
+        for item in items:
             url = item.get('url', '')
             title = item.get('title', '')
             score = item.get('score', 0.0)
@@ -116,11 +287,17 @@ def search_daum_finance_urls(
         return []
 
 
+def _news_query(stock_name: Optional[str]) -> str:
+    """Latest news query used by get_tavily_news_by_question_type"""
+    return f"{stock_name} 최신 뉴스"
+
+
 def get_tavily_news_by_question_type(
     question_type: str,
     stock_name: Optional[str] = None,
     stock_code: Optional[str] = None,
-    max_results: int = 3
+    max_results: int = 3,
+    context: Optional["SearchContext"] = None
 ) -> List[TavilySearchResult]:
     """
     Get relevant news from Tavily based on question type
@@ -131,6 +308,7 @@ def get_tavily_news_by_question_type(
         stock_name: Stock name
         stock_code: Stock code
         max_results: Maximum number of results to return (default: 3)
+        context: Per-request SearchContext for deduplication (optional)
 
     Returns:
         List of TavilySearchResult objects with titles and URLs
@@ -148,39 +326,70 @@ def get_tavily_news_by_question_type(
     logger.info(f"Getting Tavily news for question_type={question_type}, stock={stock_name}, limit={max_results}")
 
     # Simple query for latest news
-    query = f"{stock_name} 최신 뉴스"
+    query = _news_query(stock_name)
 
     results = search_daum_finance_urls(
         query=query,
         stock_name=stock_name,
         stock_code=stock_code,
-        max_results=max_results
+        max_results=max_results,
+        cache_ttl=get_tavily_cache_ttl(question_type),
+        context=context
     )
 
     logger.info(f"Found {len(results)} news articles from Tavily")
     return results
 
 
-def get_tavily_urls_by_question_type(
-    question_type: str,
+def search_investor_opinions(
     stock_name: Optional[str] = None,
-    stock_code: Optional[str] = None
-) -> List[str]:
+    stock_code: Optional[str] = None,
+    max_results: int = 3,
+    context: Optional["SearchContext"] = None
+) -> List[Dict[str, Any]]:
     """
-    Get relevant URLs from Tavily based on question type
-    (Legacy function - returns URLs only)
+    Search investor opinions/analysis for a stock on the open web
+    (used instead of Daum talk pages, which return 404)
 
     Args:
-        question_type: Question type (A_매수판단형, B_시세상태형, etc.)
         stock_name: Stock name
         stock_code: Stock code
+        max_results: Maximum number of results (default: 3)
+        context: Per-request SearchContext for deduplication (optional)
 
     Returns:
-        List of URLs from finance.daum.net
+        List of raw Tavily result dicts (title, url, content, ...)
     """
-    import logging
+    from config import QUESTION_TYPE_PUBLIC_OPINION
+
     logger = logging.getLogger(__name__)
-    
+
+    try:
+        results = _search(
+            context,
+            cache_ttl=get_tavily_cache_ttl(QUESTION_TYPE_PUBLIC_OPINION),
+            **_opinion_search_params(stock_name, stock_code, max_results)
+        )
+        return (results or [])[:max_results]
+
+    except ImportError:
+        logger.warning("Tavily not installed, skipping investor opinions search")
+        return []
+
+    except Exception as e:
+        logger.error(f"Failed to search investor opinions via Tavily: {str(e)}")
+        return []
+
+
+def _build_url_queries(question_type: str, stock_name: Optional[str]) -> Tuple[List[str], int]:
+    """
+    Build URL discovery queries for a question type
+    Args:
+        question_type: Question type (A_매수판단형, B_시세상태형, etc.)
+        stock_name: Stock name
+    Returns:
+        (queries, max_results_per_query)
+    """
     from config import (
         QUESTION_TYPE_BUY_RECOMMENDATION,
         QUESTION_TYPE_PRICE_STATUS,
@@ -188,12 +397,8 @@ def get_tavily_urls_by_question_type(
         QUESTION_TYPE_NEWS_DISCLOSURE,
     )
 
-    logger.info(f"Getting Tavily URLs for question_type={question_type}, stock={stock_name}")
-
     # Define search queries based on question type
     # Focus on news/disclosures/talks since direct URLs often return 404
-    queries = []
-
     if question_type == QUESTION_TYPE_BUY_RECOMMENDATION:
         # For buy recommendations, search for news and analysis
         queries = [
@@ -235,25 +440,291 @@ def get_tavily_urls_by_question_type(
             f"{stock_name} 분석"
         ]
 
-    # Collect URLs from all queries
-    all_urls = set()
-
     # Increase max_results for question types that need more URL discovery
     if question_type in [QUESTION_TYPE_NEWS_DISCLOSURE, QUESTION_TYPE_PUBLIC_OPINION]:
         max_results_per_query = 5  # More aggressive for problematic types
     else:
         max_results_per_query = 3
 
-    for query in queries:
-        results = search_daum_finance_urls(
-            query=query,
-            stock_name=stock_name,
-            stock_code=stock_code,
-            max_results=max_results_per_query
-        )
+    return queries, max_results_per_query
+
+
+def get_tavily_urls_by_question_type(
+    question_type: str,
+    stock_name: Optional[str] = None,
+    stock_code: Optional[str] = None,
+    max_urls: Optional[int] = None,
+    url_filter: Optional[Callable[[str], bool]] = None,
+    deadline: float = TAVILY_DEADLINE,
+    context: Optional["SearchContext"] = None
+) -> List[str]:
+    """
+    Get relevant URLs from Tavily based on question type
+    (Legacy function - returns URLs only)
+
+    Queries are fanned out in parallel. Collection stops early once max_urls
+    unique URLs passing url_filter are found, or when the deadline passes.
+
+    Args:
+        question_type: Question type (A_매수판단형, B_시세상태형, etc.)
+        stock_name: Stock name
+        stock_code: Stock code
+        max_urls: Stop once this many usable URLs are collected (optional)
+        url_filter: Predicate deciding if a URL is usable (optional)
+        deadline: Total time budget in seconds (default: TAVILY_DEADLINE)
+        context: Per-request SearchContext for deduplication (optional)
+
+    Returns:
+        List of URLs from finance.daum.net
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+
+    logger.info(f"Getting Tavily URLs for question_type={question_type}, stock={stock_name}")
+
+    # Search queries based on question type (shared with SearchContext.prefetch)
+    queries, max_results_per_query = _build_url_queries(question_type, stock_name)
+
+    # Collect URLs from all queries (insertion-ordered, deduplicated)
+    all_urls = {}
+
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(TAVILY_MAX_WORKERS, len(queries))),
+        thread_name_prefix="tavily"
+    )
+    try:
+        pending = {
+            executor.submit(
+                search_daum_finance_urls,
+                query=query,
+                stock_name=stock_name,
+                stock_code=stock_code,
+                max_results=max_results_per_query,
+                cache_ttl=get_tavily_cache_ttl(question_type),
+                context=context
+            ): query
+            for query in queries
+        }
+
+        while pending:
+            remaining = deadline - (time.perf_counter() - start)
+            if remaining <= 0:
+                logger.warning(f"Tavily deadline ({deadline}s) exceeded, skipping {len(pending)} queries")
+                break
+
+            done, _ = wait(list(pending), timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                query = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.warning(f"Tavily query failed ({query}): {str(e)}")
+                    continue
+
+                for result in results:
+                    if url_filter is None or url_filter(result.url):
+                        all_urls.setdefault(result.url, None)
+
+            # Early stop once the caller's budget is covered
+            if max_urls is not None and len(all_urls) >= max_urls:
+                logger.info(f"Collected {len(all_urls)} URLs, skipping {len(pending)} remaining queries")
+                break
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    urls = list(all_urls)
+    if max_urls is not None:
+        urls = urls[:max_urls]
+
+    logger.info(f"Total unique URLs found: {len(urls)}")
+    return urls
+
+
+class SearchContext:
+    """
+    Per-request Tavily search context shared by planner and summarizer
+
+    Identical searches within one user question are issued once. Searches that only
+    differ in max_results are merged into the largest one and sliced for each caller.
+    prefetch() submits every search the pipeline will make as one parallel batch.
+    """
+
+    def __init__(
+        self,
+        stock_name: Optional[str] = None,
+        stock_code: Optional[str] = None,
+        question_type: Optional[str] = None
+    ):
+        self.stock_name = stock_name
+        self.stock_code = stock_code
+        self.question_type = question_type
+        self._lock = threading.Lock()
+        self._searches: Dict[str, Tuple[int, Future]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._requested = 0
+        self._issued = 0
+        self._closed = False
+
+    @staticmethod
+    def _key(search_params: Dict[str, Any]) -> str:
+        """Merge key: normalized search parameters without max_results"""
+        key_params = {k: v for k, v in search_params.items() if k != 'max_results'}
+        key_params['query'] = _normalize_query(key_params['query'])
+        return json.dumps(key_params, sort_keys=True, ensure_ascii=False)
+
+    def _submit(self, cache_ttl: Optional[int], search_params: Dict[str, Any], requested: bool) -> Future:
+        """Get the in-flight search covering search_params, or start a new one"""
+        key = self._key(search_params)
+        max_results = search_params.get('max_results', 5)
+
+        with self._lock:
+            if requested:
+                self._requested += 1
+
+            entry = self._searches.get(key)
+            if entry is not None and entry[0] >= max_results:
+                return entry[1]
+
+            future = Future()
+            if not self._closed:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=TAVILY_MAX_WORKERS,
+                        thread_name_prefix="tavily-ctx"
+                    )
+                future = self._executor.submit(_cached_search, cache_ttl=cache_ttl, **search_params)
+                self._searches[key] = (max_results, future)
+                self._issued += 1
+                return future
+
+        # Context already released (e.g. evicted) - run the search in the caller's thread
+        try:
+            future.set_result(_cached_search(cache_ttl=cache_ttl, **search_params))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def search(self, cache_ttl: Optional[int] = None, **search_params) -> Optional[List[Dict[str, Any]]]:
+        """
+        Same contract as _cached_search, deduplicated within this request
+        """
+        results = self._submit(cache_ttl, search_params, requested=True).result()
+        if results is None:
+            return None
+        return results[:search_params.get('max_results', 5)]
+
+    def prefetch(self, include_url_discovery: bool = True, include_opinions: bool = True):
+        """
+        Submit all Tavily searches this question will need as one parallel batch
+        Args:
+            include_url_discovery: Include get_tavily_urls_by_question_type queries
+            include_opinions: Include the investor opinions search used by summarize_results
+        """
+        from config import QUESTION_TYPE_BUY_RECOMMENDATION, QUESTION_TYPE_NEWS_DISCLOSURE
+
+        cache_ttl = get_tavily_cache_ttl(self.question_type)
+        batch: Dict[str, Tuple[Optional[int], Dict[str, Any]]] = {}
+
+        def _add(ttl: Optional[int], search_params: Dict[str, Any]):
+            key = self._key(search_params)
+            current = batch.get(key)
+            if current is None or current[1]['max_results'] < search_params['max_results']:
+                batch[key] = (ttl, search_params)
+
+        if self.question_type in [QUESTION_TYPE_BUY_RECOMMENDATION, QUESTION_TYPE_NEWS_DISCLOSURE]:
+            _add(cache_ttl, _finance_search_params(_news_query(self.stock_name), self.stock_name, self.stock_code, 3))
+
+        if include_url_discovery:
+            queries, max_results_per_query = _build_url_queries(self.question_type, self.stock_name)
+            for query in queries:
+                _add(cache_ttl, _finance_search_params(query, self.stock_name, self.stock_code, max_results_per_query))
+
+        if include_opinions and (self.stock_name or self.stock_code):
+            from config import QUESTION_TYPE_PUBLIC_OPINION
+            _add(
+                get_tavily_cache_ttl(QUESTION_TYPE_PUBLIC_OPINION),
+                _opinion_search_params(self.stock_name, self.stock_code, 3)
+            )
+
+        for ttl, search_params in batch.values():
+            self._submit(ttl, search_params, requested=False)
+
+        logging.getLogger(__name__).info(f"[Tavily] Prefetching {len(batch)} searches for {self.stock_name}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get context statistics
+        Returns:
+            Dict with requested (searches asked for) and issued (distinct searches run)
+        """
+        with self._lock:
+            return {'requested': self._requested, 'issued': self._issued}
+
+    def close(self):
+        """Release worker threads (in-flight searches finish in the background)"""
+        with self._lock:
+            self._closed = True
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+
+
+# Live search contexts by request id (oldest dropped beyond TAVILY_MAX_CONTEXTS)
+_contexts: "OrderedDict[str, SearchContext]" = OrderedDict()
+_contexts_lock = threading.Lock()
+
+
+def create_search_context(
+    request_id: str,
+    stock_name: Optional[str] = None,
+    stock_code: Optional[str] = None,
+    question_type: Optional[str] = None
+) -> SearchContext:
+    """
+    Create and register the search context for a request
+    Args:
+        request_id: Request id (e.g. ChatbotState['request_id']; unregistered if empty)
+        stock_name: Stock name
+        stock_code: Stock code
+        question_type: Question type
+    Returns:
+        SearchContext instance
+    """
+    context = SearchContext(stock_name, stock_code, question_type)
+    if not request_id:
+        return context
+
+    with _contexts_lock:
+        _contexts[request_id] = context
+        while len(_contexts) > TAVILY_MAX_CONTEXTS:
+            _, stale = _contexts.popitem(last=False)
+            stale.close()
+    return context
+
 
-        for result in results:
-            all_urls.add(result.url)
+def get_search_context(request_id: Optional[str]) -> Optional[SearchContext]:
+    """
+    Get the search context registered for a request (None if unknown)
+    """
+    if not request_id:
+        return None
+    with _contexts_lock:
+        return _contexts.get(request_id)
 
-    logger.info(f"Total unique URLs found: {len(all_urls)}")
-    return list(all_urls)
+
+def release_search_context(request_id: Optional[str]):
+    """
+    Unregister and close the search context for a request
+    """
+    if not request_id:
+        return
+    with _contexts_lock:
+        context = _contexts.pop(request_id, None)
+
+    if context is not None:
+        stats = context.stats()
+        logging.getLogger(__name__).info(
+            f"[Tavily] Request {request_id}: {stats['requested']} searches requested, {stats['issued']} issued"
+        )
+        context.close()